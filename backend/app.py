@@ -1,22 +1,190 @@
-from flask import Flask, request, jsonify, render_template, session, redirect, url_for
+from flask import Flask, request, jsonify, render_template, session, redirect, url_for, g, send_from_directory, has_request_context
+from werkzeug.utils import safe_join
 from flask_cors import CORS
-from authlib.integrations.flask_client import OAuth
+from authlib.integrations.flask_client import OAuth, FlaskOAuth2App
+from authlib.integrations.requests_client import OAuth2Session
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
 import sqlite3
 import random
 import os
+import sys
 import hashlib
 import datetime
 import requests
 import json
-from functools import wraps
+import re
+import base64
+import hmac
+from functools import wraps, lru_cache
+from operator import itemgetter
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 import uuid
+import threading
+import time
+import gzip
+import zlib
+import mimetypes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# backend/ is a package when imported by api/index.py, but the top-level
+# directory when run as app.py or by gunicorn from inside backend/
+try:
+    from backend.users import upsert_oauth_user, create_password_user
+    from backend.similarity import SimilarityIndex
+    from backend.recommendations import RecommendationModel, preference_terms
+    from backend.ingredients import PantryIndex, ingredient_words
+except ImportError:
+    from users import upsert_oauth_user, create_password_user
+    from similarity import SimilarityIndex
+    from recommendations import RecommendationModel, preference_terms
+    from ingredients import PantryIndex, ingredient_words
 
 app = Flask(__name__, template_folder='../templates', static_folder='../static')
 app.secret_key = os.getenv('SECRET_KEY', 'spice-pilot-secret-key-2024-cooking-adventures')
 CORS(app)
 
+# Outbound HTTP to identity providers: one keep-alive pool shared by every
+# OAuth session, bounded timeouts, and a per-host circuit breaker
+OAUTH_CONNECT_TIMEOUT = float(os.getenv('OAUTH_CONNECT_TIMEOUT', 3))
+OAUTH_READ_TIMEOUT = float(os.getenv('OAUTH_READ_TIMEOUT', 5))
+OAUTH_POOL_SIZE = int(os.getenv('OAUTH_POOL_SIZE', 10))
+OAUTH_METADATA_TTL = float(os.getenv('OAUTH_METADATA_TTL', 3600))
+OAUTH_BREAKER_THRESHOLD = int(os.getenv('OAUTH_BREAKER_THRESHOLD', 5))
+OAUTH_BREAKER_COOLDOWN = float(os.getenv('OAUTH_BREAKER_COOLDOWN', 30))
+
+class CircuitOpen(Exception):
+    """Raised without a network call while a provider host is failing"""
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, then lets one probe through per cooldown"""
+
+    def __init__(self, threshold=OAUTH_BREAKER_THRESHOLD, cooldown=OAUTH_BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return 'open'
+        return 'half-open'
+
+    def before_call(self):
+        """Raise CircuitOpen unless this call may reach the provider"""
+        with self._lock:
+            if self.state == 'closed':
+                return
+            if self.state == 'open':
+                self.rejected += 1
+                raise CircuitOpen('provider temporarily unavailable')
+            # Half-open: this caller is the probe; everyone else waits out a new cooldown
+            self.opened_at = time.monotonic()
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                if self.opened_at is None:
+                    print(f"⚠️  Circuit opened after {self.failures} failures")
+                self.opened_at = time.monotonic()
+
+    def stats(self):
+        return {'state': self.state, 'failures': self.failures, 'rejected': self.rejected}
+
+
+oauth_http_adapter = HTTPAdapter(pool_connections=OAUTH_POOL_SIZE, pool_maxsize=OAUTH_POOL_SIZE, max_retries=0)
+oauth_breakers = {}
+oauth_breakers_lock = threading.Lock()
+
+def get_oauth_breaker(url):
+    """Circuit breaker for the host serving ``url``"""
+    host = urlsplit(url).netloc
+    with oauth_breakers_lock:
+        if host not in oauth_breakers:
+            oauth_breakers[host] = CircuitBreaker()
+        return oauth_breakers[host]
+
+
+class PooledOAuth2Session(OAuth2Session):
+    """Authlib session on the shared connection pool, with timeouts and circuit breaking"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('default_timeout', (OAUTH_CONNECT_TIMEOUT, OAUTH_READ_TIMEOUT))
+        super().__init__(*args, **kwargs)
+        self.mount('https://', oauth_http_adapter)
+        self.mount('http://', oauth_http_adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        breaker = get_oauth_breaker(url)
+        breaker.before_call()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def close(self):
+        """Authlib closes a session after every call; keep the shared pool open"""
+
+
+class CachedOAuth2App(FlaskOAuth2App):
+    """Refreshes discovery metadata on a TTL and keeps serving it if a refresh fails"""
+    client_cls = PooledOAuth2Session
+    _metadata_lock = threading.Lock()
+
+    def load_server_metadata(self):
+        if not self._server_metadata_url or self._metadata_fresh():
+            return self.server_metadata
+        with self._metadata_lock:
+            if self._metadata_fresh():
+                return self.server_metadata
+            try:
+                with self.client_cls(**self.client_kwargs) as session:
+                    resp = session.request('GET', self._server_metadata_url, withhold_token=True)
+                    resp.raise_for_status()
+                    metadata = resp.json()
+            except (requests.RequestException, CircuitOpen, ValueError) as e:
+                if '_loaded_at' not in self.server_metadata:
+                    raise
+                print(f"⚠️  Using cached {self.name} OAuth metadata: {e}")
+                return self.server_metadata
+            metadata['_loaded_at'] = time.time()
+            self.server_metadata.update(metadata)
+        return self.server_metadata
+
+    def _metadata_fresh(self):
+        loaded_at = self.server_metadata.get('_loaded_at')
+        return loaded_at is not None and time.time() - loaded_at < OAUTH_METADATA_TTL
+
+
+class RecipeOAuth(OAuth):
+    oauth2_client_cls = CachedOAuth2App
+
+
 # OAuth Configuration
-oauth = OAuth(app)
+oauth = RecipeOAuth(app)
 
 # OAuth provider configurations
 # Note: In production, these should be environment variables
@@ -25,12 +193,17 @@ GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET', 'your-google-client-sec
 FACEBOOK_CLIENT_ID = os.getenv('FACEBOOK_CLIENT_ID', 'your-facebook-app-id')
 FACEBOOK_CLIENT_SECRET = os.getenv('FACEBOOK_CLIENT_SECRET', 'your-facebook-app-secret')
 
+# Provider endpoints can be pointed at a local stub identity provider for testing
+GOOGLE_METADATA_URL = os.getenv('GOOGLE_METADATA_URL', 'https://accounts.google.com/.well-known/openid-configuration')
+FACEBOOK_AUTHORIZE_URL = os.getenv('FACEBOOK_AUTHORIZE_URL', 'https://www.facebook.com/dialog/oauth')
+FACEBOOK_GRAPH_URL = os.getenv('FACEBOOK_GRAPH_URL', 'https://graph.facebook.com/')
+
 # Configure Google OAuth
 google = oauth.register(
     name='google',
     client_id=GOOGLE_CLIENT_ID,
     client_secret=GOOGLE_CLIENT_SECRET,
-    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+    server_metadata_url=GOOGLE_METADATA_URL,
     client_kwargs={
         'scope': 'openid email profile'
     }
@@ -41,51 +214,768 @@ facebook = oauth.register(
     name='facebook',
     client_id=FACEBOOK_CLIENT_ID,
     client_secret=FACEBOOK_CLIENT_SECRET,
-    access_token_url='https://graph.facebook.com/oauth/access_token',
-    authorize_url='https://www.facebook.com/dialog/oauth',
-    api_base_url='https://graph.facebook.com/',
+    access_token_url=FACEBOOK_GRAPH_URL + 'oauth/access_token',
+    authorize_url=FACEBOOK_AUTHORIZE_URL,
+    api_base_url=FACEBOOK_GRAPH_URL,
     client_kwargs={'scope': 'email'}
 )
 
 
 # Database path
-DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'database', 'recipes.db')
+DB_PATH = os.getenv('DB_PATH', os.path.join(os.path.dirname(__file__), '..', 'database', 'recipes.db'))
+
+# Connection pool configuration (per worker process)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 8))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 5))
+DB_POOL_HEALTH_CHECK_INTERVAL = float(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', 30))
+
+# SQLite storage profile applied to every new connection. WAL lets readers
+# keep going while a rating write is in progress in another worker.
+DB_STORAGE_PROFILE = {
+    'journal_mode': os.getenv('DB_JOURNAL_MODE', 'WAL'),
+    'synchronous': os.getenv('DB_SYNCHRONOUS', 'NORMAL'),
+    'mmap_size': int(os.getenv('DB_MMAP_SIZE', 64 * 1024 * 1024)),
+    'cache_size': int(os.getenv('DB_CACHE_SIZE', -16000)),  # negative = KiB
+    'temp_store': os.getenv('DB_TEMP_STORE', 'MEMORY'),
+    'busy_timeout': int(os.getenv('DB_BUSY_TIMEOUT', 5000)),  # milliseconds
+}
+DB_CHECKPOINT_INTERVAL = float(os.getenv('DB_CHECKPOINT_INTERVAL', 300))
+DB_CHECKPOINT_MODE = os.getenv('DB_CHECKPOINT_MODE', 'PASSIVE')
+
+# PRAGMA values that SQLite reports back as integers
+_PRAGMA_ENUMS = {
+    'synchronous': ['OFF', 'NORMAL', 'FULL', 'EXTRA'],
+    'temp_store': ['DEFAULT', 'FILE', 'MEMORY'],
+}
+
+
+def apply_storage_profile(conn, profile=None):
+    """Apply the configured PRAGMA profile to a fresh connection"""
+    profile = DB_STORAGE_PROFILE if profile is None else profile
+    # busy_timeout goes first so the journal_mode switch can wait on other workers
+    for name in ('busy_timeout', 'journal_mode', 'synchronous', 'mmap_size', 'cache_size', 'temp_store'):
+        if name in profile:
+            try:
+                conn.execute(f'PRAGMA {name} = {profile[name]}')
+            except sqlite3.OperationalError as e:
+                print(f"⚠️  Could not set PRAGMA {name}={profile[name]}: {e}")
+
+
+def read_storage_profile(conn):
+    """Read back the PRAGMA values that are actually in effect"""
+    active = {}
+    for name in DB_STORAGE_PROFILE:
+        value = conn.execute(f'PRAGMA {name}').fetchone()[0]
+        if name in _PRAGMA_ENUMS and isinstance(value, int):
+            value = _PRAGMA_ENUMS[name][value]
+        active[name] = value.upper() if isinstance(value, str) else value
+    return active
+
+
+def check_storage_profile(conn):
+    """Startup check: report the active profile and any setting SQLite refused"""
+    active = read_storage_profile(conn)
+    mismatched = {
+        name: active[name] for name, wanted in DB_STORAGE_PROFILE.items()
+        if str(active[name]).upper() != str(wanted).upper()
+    }
+    print("🗄️  Storage profile: " + ', '.join(f"{name}={value}" for name, value in active.items()))
+    for name, value in mismatched.items():
+        print(f"⚠️  {name} is {value}, expected {DB_STORAGE_PROFILE[name]}")
+    return active, mismatched
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes available in time"""
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of SQLite connections for one worker process"""
+
+    def __init__(self, path, size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT,
+                 health_check_interval=DB_POOL_HEALTH_CHECK_INTERVAL):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._lock = threading.Condition()
+        self._reset()
+
+    def _reset(self):
+        """Forget all connections (used on first use and after a fork)"""
+        self._pid = os.getpid()
+        self._idle = []
+        self._in_use = 0
+        self._last_used = {}
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'created': 0,
+            'discarded': 0,
+            'peak_in_use': 0,
+        }
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        apply_storage_profile(conn)
+        self._stats['created'] += 1
+        return conn
+
+    def _is_healthy(self, conn):
+        try:
+            conn.execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn):
+        self._last_used.pop(id(conn), None)
+        self._stats['discarded'] += 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def acquire(self):
+        """Check out a connection, waiting up to ``timeout`` seconds for one"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Connections must never be shared across a gunicorn fork
+                self._reset()
+
+            if not self._idle and self._in_use >= self.size:
+                self._stats['waits'] += 1
+                if not self._lock.wait_for(lambda: self._idle or self._in_use < self.size,
+                                           timeout=self.timeout):
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeout(f'No database connection available after {self.timeout}s')
+
+            conn = self._idle.pop() if self._idle else None
+            self._in_use += 1
+            self._stats['checkouts'] += 1
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], self._in_use)
+
+        try:
+            if conn is not None:
+                idle_for = time.monotonic() - self._last_used.get(id(conn), 0)
+                if idle_for > self.health_check_interval and not self._is_healthy(conn):
+                    with self._lock:
+                        self._discard(conn)
+                    conn = None
+            if conn is None:
+                conn = self._connect()
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+        return conn
+
+    def release(self, conn):
+        """Return a connection to the pool, rolling back any open transaction"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            healthy = True
+        except sqlite3.Error:
+            healthy = False
+
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            self._in_use -= 1
+            if healthy and len(self._idle) < self.size:
+                self._last_used[id(conn)] = time.monotonic()
+                self._idle.append(conn)
+            else:
+                self._discard(conn)
+            self._lock.notify()
+
+    def close_all(self):
+        """Close every idle connection"""
+        with self._lock:
+            while self._idle:
+                self._discard(self._idle.pop())
+
+    def check_health(self):
+        """Run a round-trip query on a pooled connection"""
+        conn = self.acquire()
+        try:
+            return self._is_healthy(conn)
+        finally:
+            self.release(conn)
+
+    def stats(self):
+        """Snapshot of pool usage counters for monitoring"""
+        with self._lock:
+            return dict(self._stats, size=self.size, in_use=self._in_use, idle=len(self._idle))
+
+
+class CheckpointScheduler:
+    """Background thread that periodically checkpoints the WAL file"""
+
+    def __init__(self, pool, interval=DB_CHECKPOINT_INTERVAL, mode=DB_CHECKPOINT_MODE):
+        self.pool = pool
+        self.interval = interval
+        self.mode = mode
+        self._pid = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self.checkpoints = 0
+        self.last_result = None
+
+    def ensure_running(self):
+        """Start the scheduler once per worker process"""
+        if self._pid == os.getpid() or self.interval <= 0:
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='wal-checkpoint', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.checkpoint()
+            except Exception as e:
+                print(f"WAL checkpoint error: {e}")
+
+    def checkpoint(self):
+        """Run a single checkpoint and remember its (busy, log, checkpointed) result"""
+        conn = self.pool.acquire()
+        try:
+            busy, log_frames, checkpointed = conn.execute(
+                f'PRAGMA wal_checkpoint({self.mode})'
+            ).fetchone()
+        finally:
+            self.pool.release(conn)
+        self.checkpoints += 1
+        self.last_result = {'busy': busy, 'log_frames': log_frames, 'checkpointed_frames': checkpointed}
+        return self.last_result
+
+
+db_pool = ConnectionPool(DB_PATH)
+wal_checkpointer = CheckpointScheduler(db_pool)
 
 def get_db_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Return the pooled database connection bound to the current app context"""
+    if 'db' not in g:
+        wal_checkpointer.ensure_running()
+        conn = db_pool.acquire()
+        try:
+            ensure_schema(conn)
+        except Exception:
+            db_pool.release(conn)
+            raise
+        g.db = conn
+    return g.db
 
-def init_database():
-    """Initialize the database with tables and sample data"""
-    conn = get_db_connection()
-    
-    # Check if we need to migrate the database
+def return_db_connection():
+    """Hand the request's connection back early, ahead of slow work that needs no database
+
+    A later get_db_connection() in the same request checks out a fresh one.
+    """
+    conn = g.pop('db', None)
+    if conn is not None:
+        db_pool.release(conn)
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    """Return the request's connection to the pool"""
+    return_db_connection()
+
+@app.errorhandler(PoolTimeout)
+def handle_pool_timeout(error):
+    """Fail fast when every pooled connection is busy"""
+    return jsonify({'error': 'Service busy, please retry'}), 503
+
+# Full-text search index over recipes. bm25() takes its column weights
+# positionally, so RECIPE_FTS_WEIGHTS must follow RECIPE_FTS_COLUMNS.
+RECIPE_FTS_COLUMNS = ('name', 'cuisine_type', 'country', 'origin', 'ingredients', 'description')
+RECIPE_FTS_WEIGHTS = (10.0, 6.0, 4.0, 3.0, 2.0, 1.0)
+LEGACY_FTS_TRIGGERS = ('recipes_fts_insert', 'recipes_fts_update', 'recipes_fts_delete')
+
+# Schema DDL, frozen by version. A migration runs the version that was current
+# when it was written, so its meaning never changes; a schema change adds a new
+# version plus a migration applying it, and repoints the live name below.
+USERS_TABLE_V1 = '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        oauth_provider TEXT DEFAULT NULL,
+        oauth_id TEXT DEFAULT NULL,
+        avatar_url TEXT DEFAULT NULL,
+        cuisine_preferences TEXT DEFAULT '',
+        newsletter_subscribed INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        is_active INTEGER DEFAULT 1
+    )
+'''
+
+# Migration 2: index over the recipes table itself, which still held the
+# pipe-delimited ingredients column
+SEARCH_INDEX_V1 = (
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5(
+        name, cuisine_type, country, origin, ingredients, description,
+        content='recipes',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_insert AFTER INSERT ON recipes BEGIN
+        INSERT INTO recipes_fts(rowid, name, cuisine_type, country, origin, ingredients, description)
+        VALUES (new.id, new.name, new.cuisine_type, new.country, new.origin, new.ingredients, new.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_delete AFTER DELETE ON recipes BEGIN
+        INSERT INTO recipes_fts(recipes_fts, rowid, name, cuisine_type, country, origin, ingredients, description)
+        VALUES ('delete', old.id, old.name, old.cuisine_type, old.country, old.origin, old.ingredients, old.description);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS recipes_fts_update AFTER UPDATE ON recipes BEGIN
+        INSERT INTO recipes_fts(recipes_fts, rowid, name, cuisine_type, country, origin, ingredients, description)
+        VALUES ('delete', old.id, old.name, old.cuisine_type, old.country, old.origin, old.ingredients, old.description);
+        INSERT INTO recipes_fts(rowid, name, cuisine_type, country, origin, ingredients, description)
+        VALUES (new.id, new.name, new.cuisine_type, new.country, new.origin, new.ingredients, new.description);
+    END
+    ''',
+)
+
+# Migration 9: ingredient vocabulary plus per-recipe ingredient and step rows
+# in list order. Foreign keys are off on pooled connections, so deleting a
+# recipe cascades to its rows through a trigger
+RECIPE_CHILD_TABLES_V1 = (
+    '''
+    CREATE TABLE IF NOT EXISTS ingredients (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS recipe_ingredients (
+        recipe_id INTEGER NOT NULL REFERENCES recipes (id),
+        position INTEGER NOT NULL,
+        ingredient_id INTEGER REFERENCES ingredients (id),
+        text TEXT NOT NULL,
+        PRIMARY KEY (recipe_id, position)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_ingredient
+    ON recipe_ingredients (ingredient_id, recipe_id)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS recipe_steps (
+        recipe_id INTEGER NOT NULL REFERENCES recipes (id),
+        position INTEGER NOT NULL,
+        text TEXT NOT NULL,
+        PRIMARY KEY (recipe_id, position)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS recipes_delete_children AFTER DELETE ON recipes BEGIN
+        DELETE FROM recipe_ingredients WHERE recipe_id = old.id;
+        DELETE FROM recipe_steps WHERE recipe_id = old.id;
+    END
+    ''',
+)
+
+# Migrations 9-11 index one document per recipe, with its ingredient lines
+# joined in order. External-content FTS rows must be deleted with exactly the
+# values they were indexed with, so each write removes the recipe's document
+# before it changes and re-adds it afterwards, whether the recipe or one of
+# its ingredients moved.
+SEARCH_DOCUMENTS_V1 = (
+    '''
+    CREATE VIEW IF NOT EXISTS recipe_search_documents AS
+    SELECT r.id, r.name, r.cuisine_type, r.country, r.origin,
+           (SELECT group_concat(text, ' ') FROM (
+                SELECT text FROM recipe_ingredients WHERE recipe_id = r.id ORDER BY position
+           )) AS ingredients,
+           r.description
+    FROM recipes r
+    ''',
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5(
+        name, cuisine_type, country, origin, ingredients, description,
+        content='recipe_search_documents',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    ''',
+)
+_SEARCH_REMOVE_V1 = ("INSERT INTO recipes_fts(recipes_fts, rowid, name, cuisine_type, country, origin, ingredients, description) "
+                     "SELECT 'delete', id, name, cuisine_type, country, origin, ingredients, description "
+                     "FROM recipe_search_documents WHERE id {};")
+_SEARCH_ADD_V1 = ("INSERT INTO recipes_fts(rowid, name, cuisine_type, country, origin, ingredients, description) "
+                  "SELECT id, name, cuisine_type, country, origin, ingredients, description "
+                  "FROM recipe_search_documents WHERE id {};")
+_RECIPE_DOCUMENT_COLUMNS_V1 = 'id, name, cuisine_type, country, origin, description'
+
+# Migration 9: every recipe write reindexes its document
+SEARCH_INDEX_V2 = SEARCH_DOCUMENTS_V1 + tuple(
+    f'CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {statement} END'
+    for name, event, statement in (
+        ('recipes_fts_after_insert', 'AFTER INSERT ON recipes', _SEARCH_ADD_V1.format('= new.id')),
+        ('recipes_fts_before_update', 'BEFORE UPDATE ON recipes', _SEARCH_REMOVE_V1.format('= old.id')),
+        ('recipes_fts_after_update', 'AFTER UPDATE ON recipes', _SEARCH_ADD_V1.format('= new.id')),
+        ('recipes_fts_before_delete', 'BEFORE DELETE ON recipes', _SEARCH_REMOVE_V1.format('= old.id')),
+        ('recipe_ingredients_fts_before_insert', 'BEFORE INSERT ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('= new.recipe_id')),
+        ('recipe_ingredients_fts_after_insert', 'AFTER INSERT ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('= new.recipe_id')),
+        ('recipe_ingredients_fts_before_update', 'BEFORE UPDATE ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('= old.recipe_id')),
+        ('recipe_ingredients_fts_after_update', 'AFTER UPDATE ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('= old.recipe_id')),
+        ('recipe_ingredients_fts_before_delete', 'BEFORE DELETE ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('= old.recipe_id')),
+        ('recipe_ingredients_fts_after_delete', 'AFTER DELETE ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('= old.recipe_id')),
+    )
+)
+
+# Migration 10: recipe updates only touch the index when a column of the
+# document changes, so image refreshes and hash backfills skip it
+SEARCH_INDEX_V3 = SEARCH_DOCUMENTS_V1 + tuple(
+    f'CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {statement} END'
+    for name, event, statement in (
+        ('recipes_fts_after_insert', 'AFTER INSERT ON recipes', _SEARCH_ADD_V1.format('= new.id')),
+        ('recipes_fts_before_update', f'BEFORE UPDATE OF {_RECIPE_DOCUMENT_COLUMNS_V1} ON recipes',
+         _SEARCH_REMOVE_V1.format('= old.id')),
+        ('recipes_fts_after_update', f'AFTER UPDATE OF {_RECIPE_DOCUMENT_COLUMNS_V1} ON recipes',
+         _SEARCH_ADD_V1.format('= new.id')),
+        ('recipes_fts_before_delete', 'BEFORE DELETE ON recipes', _SEARCH_REMOVE_V1.format('= old.id')),
+        ('recipe_ingredients_fts_before_insert', 'BEFORE INSERT ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('= new.recipe_id')),
+        ('recipe_ingredients_fts_after_insert', 'AFTER INSERT ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('= new.recipe_id')),
+        ('recipe_ingredients_fts_before_update', 'BEFORE UPDATE ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('= old.recipe_id')),
+        ('recipe_ingredients_fts_after_update', 'AFTER UPDATE ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('= old.recipe_id')),
+        ('recipe_ingredients_fts_before_delete', 'BEFORE DELETE ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('= old.recipe_id')),
+        ('recipe_ingredients_fts_after_delete', 'AFTER DELETE ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('= old.recipe_id')),
+    )
+)
+
+# Migration 11: an ingredient update can move the row to another recipe, so
+# it refreshes both documents; IN () keeps that to one when the recipe stays
+SEARCH_INDEX_V4 = SEARCH_DOCUMENTS_V1 + tuple(
+    f'CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {statement} END'
+    for name, event, statement in (
+        ('recipes_fts_after_insert', 'AFTER INSERT ON recipes', _SEARCH_ADD_V1.format('IN (new.id)')),
+        ('recipes_fts_before_update', f'BEFORE UPDATE OF {_RECIPE_DOCUMENT_COLUMNS_V1} ON recipes',
+         _SEARCH_REMOVE_V1.format('IN (old.id)')),
+        ('recipes_fts_after_update', f'AFTER UPDATE OF {_RECIPE_DOCUMENT_COLUMNS_V1} ON recipes',
+         _SEARCH_ADD_V1.format('IN (new.id)')),
+        ('recipes_fts_before_delete', 'BEFORE DELETE ON recipes', _SEARCH_REMOVE_V1.format('IN (old.id)')),
+        ('recipe_ingredients_fts_before_insert', 'BEFORE INSERT ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('IN (new.recipe_id)')),
+        ('recipe_ingredients_fts_after_insert', 'AFTER INSERT ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('IN (new.recipe_id)')),
+        ('recipe_ingredients_fts_before_update', 'BEFORE UPDATE ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('IN (old.recipe_id, new.recipe_id)')),
+        ('recipe_ingredients_fts_after_update', 'AFTER UPDATE ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('IN (old.recipe_id, new.recipe_id)')),
+        ('recipe_ingredients_fts_before_delete', 'BEFORE DELETE ON recipe_ingredients',
+         _SEARCH_REMOVE_V1.format('IN (old.recipe_id)')),
+        ('recipe_ingredients_fts_after_delete', 'AFTER DELETE ON recipe_ingredients',
+         _SEARCH_ADD_V1.format('IN (old.recipe_id)')),
+    )
+)
+
+# Migration 4: version stamp plus triggers catching every writer, including
+# update_recipe_images.py and manual admin edits
+CATALOG_VERSION_STAMP_V1 = (
+    '''
+    CREATE TABLE IF NOT EXISTS catalog_meta (
+        key TEXT PRIMARY KEY,
+        value NOT NULL
+    )
+    ''',
+    "INSERT OR IGNORE INTO catalog_meta (key, value) VALUES ('catalog_version', 1)",
+) + tuple(
+    f'''
+    CREATE TRIGGER IF NOT EXISTS recipes_bump_catalog_version_{event.lower()}
+    AFTER {event} ON recipes BEGIN
+        UPDATE catalog_meta SET value = value + 1 WHERE key = 'catalog_version';
+    END
+    '''
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+)
+
+# Migration 5: composite indexes leading with each facet, then (name, id), and
+# a partial (name, id) index per diet flag
+RECIPE_FACET_INDEXES_V1 = (
+    ('idx_recipes_country', 'CREATE INDEX IF NOT EXISTS idx_recipes_country ON recipes (country, name, id)'),
+    ('idx_recipes_cuisine', 'CREATE INDEX IF NOT EXISTS idx_recipes_cuisine ON recipes (cuisine_type, name, id)'),
+    ('idx_recipes_difficulty',
+     'CREATE INDEX IF NOT EXISTS idx_recipes_difficulty ON recipes (difficulty, spice_level, name, id)'),
+    ('idx_recipes_spice', 'CREATE INDEX IF NOT EXISTS idx_recipes_spice ON recipes (spice_level, name, id)'),
+    ('idx_recipes_vegan', 'CREATE INDEX IF NOT EXISTS idx_recipes_vegan ON recipes (name, id) WHERE is_vegan = 1'),
+    ('idx_recipes_vegetarian',
+     'CREATE INDEX IF NOT EXISTS idx_recipes_vegetarian ON recipes (name, id) WHERE is_vegetarian = 1'),
+    ('idx_recipes_gluten_free',
+     'CREATE INDEX IF NOT EXISTS idx_recipes_gluten_free ON recipes (name, id) WHERE is_gluten_free = 1'),
+)
+
+# The current definitions, recreated by rebuild_recipe_indexes() after a bulk load
+RECIPE_SEARCH_INDEX = SEARCH_INDEX_V4
+CATALOG_VERSION_STAMP = CATALOG_VERSION_STAMP_V1
+RECIPE_FACET_INDEXES = RECIPE_FACET_INDEXES_V1
+
+def apply_ddl(conn, statements):
+    """Execute a sequence of DDL statements in order"""
+    for statement in statements:
+        conn.execute(statement)
+
+def rebuild_recipe_search_index(conn):
+    """Repopulate the FTS index from its content table"""
+    print("🔎 Building recipe search index...")
+    conn.execute("INSERT INTO recipes_fts(recipes_fts) VALUES ('rebuild')")
+
+def create_recipe_search_index(conn):
+    """Create the current FTS index and sync triggers, and fill the index from the recipes"""
+    apply_ddl(conn, RECIPE_SEARCH_INDEX)
+    rebuild_recipe_search_index(conn)
+
+def drop_recipe_search_index(conn):
+    """Remove the FTS index and every trigger that maintains it"""
+    triggers = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%fts%'"
+    )]
+    for name in triggers:
+        conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+    conn.execute('DROP TABLE IF EXISTS recipes_fts')
+
+def create_catalog_version_stamp(conn):
+    """Create the catalog version stamp and the triggers that bump it on any recipe write"""
+    apply_ddl(conn, CATALOG_VERSION_STAMP)
+
+def create_recipe_facet_indexes(conn):
+    """Composite facet indexes and partial diet-flag indexes on recipes"""
+    apply_ddl(conn, (statement for _, statement in RECIPE_FACET_INDEXES))
+
+def drop_recipe_facet_indexes(conn):
+    """Remove every index created by create_recipe_facet_indexes()"""
+    for name, _ in RECIPE_FACET_INDEXES:
+        conn.execute(f'DROP INDEX IF EXISTS {name}')
+
+# Bulk loads drop what every recipe write would otherwise maintain row by row
+# (search index, facet indexes, catalog version triggers) and rebuild it once.
+# A marker row records the suspension with a lease the loader keeps renewing;
+# once the lease runs out the load is presumed dead and its indexes are rebuilt.
+IMPORT_LEASE_SECONDS = float(os.getenv('IMPORT_LEASE_SECONDS', 120))
+
+def index_suspension_lease():
+    """Marker value naming this process as the loader, valid for IMPORT_LEASE_SECONDS"""
+    return json.dumps({'pid': os.getpid(), 'expires': time.time() + IMPORT_LEASE_SECONDS})
+
+def suspend_recipe_indexes(conn):
+    """Drop the search index, facet indexes and version triggers ahead of a bulk load"""
+    conn.execute("INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('recipe_indexes_suspended', ?)",
+                 (index_suspension_lease(),))
+    drop_recipe_search_index(conn)
+    drop_recipe_facet_indexes(conn)
+    for event in ('insert', 'update', 'delete'):
+        conn.execute(f'DROP TRIGGER IF EXISTS recipes_bump_catalog_version_{event}')
+
+def rebuild_recipe_indexes(conn):
+    """Recreate everything suspend_recipe_indexes() dropped and bump the catalog version once"""
+    create_recipe_facet_indexes(conn)
+    create_catalog_version_stamp(conn)
+    conn.execute("UPDATE catalog_meta SET value = value + 1 WHERE key = 'catalog_version'")
+    create_recipe_search_index(conn)
+    conn.execute("DELETE FROM catalog_meta WHERE key = 'recipe_indexes_suspended'")
+
+def renew_index_suspension(conn):
+    """Extend the running load's lease, suspending again if its indexes were rebuilt meanwhile"""
+    renewed = conn.execute("UPDATE catalog_meta SET value = ? WHERE key = 'recipe_indexes_suspended'",
+                           (index_suspension_lease(),)).rowcount
+    if not renewed:
+        suspend_recipe_indexes(conn)
+
+def suspension_lease_left(conn):
+    """Seconds left on the loader's lease, 0 once it has expired, None when nothing is suspended"""
+    row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'recipe_indexes_suspended'").fetchone()
+    if not row:
+        return None
     try:
-        conn.execute('SELECT origin FROM recipes LIMIT 1')
-    except sqlite3.OperationalError:
-        # Database needs migration - drop and recreate
-        print("🔄 Migrating database to new schema...")
-        conn.execute('DROP TABLE IF EXISTS recipes')
+        lease = json.loads(row[0])
+        return max(0.0, float(lease['expires']) - time.time())
+    except (TypeError, ValueError, KeyError):
+        return 0.0
+
+def restore_suspended_indexes(conn):
+    """Rebuild indexes left suspended by a bulk load that died before finishing
+
+    A load whose lease is still running is left alone; the seconds until it
+    could expire are returned so the caller knows when to look again.
+    """
+    left = suspension_lease_left(conn)
+    if left is None or left > 0:
+        return left
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        left = suspension_lease_left(conn)
+        if left == 0:
+            print("⚠️  Recipe indexes were left suspended by an unfinished import; rebuilding")
+            rebuild_recipe_indexes(conn)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return left or None
+
+def build_fts_query(query):
+    """Turn free text into an FTS5 MATCH expression with prefix matching on every term"""
+    terms = [term for term in re.split(r'\W+', query.lower()) if term]
+    return ' '.join(f'"{term}"*' for term in terms)
+
+# Seed catalog, loaded in bulk by init_database()
+SEED_PATH = os.getenv('SEED_PATH', os.path.join(os.path.dirname(__file__), '..', 'database', 'seed_recipes.jsonl'))
+RECIPE_COLUMNS = (
+    'name', 'country', 'origin', 'cuisine_type', 'description', 'image', 'prep_time',
+    'difficulty', 'spice_level', 'is_vegan', 'is_vegetarian', 'is_gluten_free',
+    'health_benefits'
+)
+
+# The image is left out of a recipe's identity: update_recipe_images.py
+# replaces it without making the recipe a different one
+RECIPE_HASH_COLUMNS = tuple(column for column in RECIPE_COLUMNS if column != 'image') + ('ingredients', 'steps')
+
+def recipe_content_hash(recipe):
+    """SHA-256 of a recipe's normalized content (ingredients and steps as lists), ignoring id and image"""
+    def normalize(value):
+        if isinstance(value, (list, tuple)):
+            return [normalize(item) for item in value]
+        if isinstance(value, str):
+            return ' '.join(value.split())
+        if value is None:
+            return ''
+        return int(value)
+    content = json.dumps([normalize(recipe[column]) for column in RECIPE_HASH_COLUMNS],
+                         ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def file_checksum(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def split_recipe_list(value):
+    """Seed files and legacy rows store ingredients and steps pipe-delimited"""
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return value.split('|') if value else []
+
+def ingredient_ids(conn, lines):
+    """Map ingredient lines to ids in the normalized vocabulary, adding new names"""
+    names = {line: ' '.join(ingredient_words(line)) or None for line in lines}
+    vocabulary = sorted({name for name in names.values() if name})
+    conn.executemany('INSERT OR IGNORE INTO ingredients (name) VALUES (?)', [(name,) for name in vocabulary])
+    ids = dict(conn.execute(
+        'SELECT name, id FROM ingredients WHERE name IN (SELECT value FROM json_each(?))',
+        (json.dumps(vocabulary),)
+    ).fetchall())
+    return {line: ids.get(name) for line, name in names.items()}
+
+def replace_recipe_lists(conn, recipe_lists):
+    """Rewrite the ingredient and step rows of each (recipe_id, ingredients, steps)"""
+    recipe_lists = list(recipe_lists)
+    recipe_ids = json.dumps([recipe_id for recipe_id, _, _ in recipe_lists])
+    conn.execute('DELETE FROM recipe_ingredients WHERE recipe_id IN (SELECT value FROM json_each(?))', (recipe_ids,))
+    conn.execute('DELETE FROM recipe_steps WHERE recipe_id IN (SELECT value FROM json_each(?))', (recipe_ids,))
+    
+    ids = ingredient_ids(conn, {line for _, ingredients, _ in recipe_lists for line in ingredients})
+    conn.executemany(
+        'INSERT INTO recipe_ingredients (recipe_id, position, ingredient_id, text) VALUES (?, ?, ?, ?)',
+        [(recipe_id, position, ids[line], line)
+         for recipe_id, ingredients, _ in recipe_lists
+         for position, line in enumerate(ingredients)]
+    )
+    conn.executemany(
+        'INSERT INTO recipe_steps (recipe_id, position, text) VALUES (?, ?, ?)',
+        [(recipe_id, position, step)
+         for recipe_id, _, steps in recipe_lists
+         for position, step in enumerate(steps)]
+    )
+
+def load_seed_recipes(conn, path):
+    """Upsert the recipes of a JSON Lines seed file whose content changed, in a single transaction
+
+    Recipes already stored with the same content hash are left untouched, and
+    an existing recipe keeps its image, so reloading the seed never reverts
+    update_recipe_images.py. Returns the number of recipes written.
+    """
+    columns = ('id',) + RECIPE_COLUMNS + ('content_hash',)
+    updates = ', '.join(f'{column} = excluded.{column}' for column in columns[1:] if column != 'image')
+    
+    with open(path, encoding='utf-8') as f:
+        recipes = [json.loads(line) for line in f if line.strip()]
+    for recipe in recipes:
+        recipe['ingredients'] = split_recipe_list(recipe['ingredients'])
+        recipe['steps'] = split_recipe_list(recipe['steps'])
+        recipe['content_hash'] = recipe_content_hash(recipe)
+    
+    stored = dict(conn.execute('SELECT id, content_hash FROM recipes'))
+    changed = [recipe for recipe in recipes if stored.get(recipe['id'], '') != recipe['content_hash']]
     
+    with conn:
+        conn.executemany(f'''
+            INSERT INTO recipes ({', '.join(columns)})
+            VALUES ({', '.join('?' * len(columns))})
+            ON CONFLICT(id) DO UPDATE SET {updates}
+        ''', [tuple(recipe[column] for column in columns) for recipe in changed])
+        replace_recipe_lists(conn, ((recipe['id'], recipe['ingredients'], recipe['steps']) for recipe in changed))
+    return len(changed)
+
+# Schema migrations. Each step must be idempotent; migrate_database() runs the
+# pending ones in order, each inside its own transaction.
+LEGACY_RECIPE_COLUMNS = (
+    ('origin', "TEXT NOT NULL DEFAULT ''"),
+    ('cuisine_type', "TEXT NOT NULL DEFAULT ''"),
+    ('spice_level', "TEXT NOT NULL DEFAULT ''"),
+    ('is_vegan', 'INTEGER DEFAULT 0'),
+    ('is_vegetarian', 'INTEGER DEFAULT 0'),
+    ('is_gluten_free', 'INTEGER DEFAULT 0'),
+)
+
+def table_columns(conn, table):
+    """Names of the columns of ``table`` (empty if it does not exist)"""
+    return {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+
+def migrate_001_initial_schema(conn):
+    """Users, recipes and ratings tables; add columns missing from pre-migration databases"""
     # Create users table for authentication
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT UNIQUE NOT NULL,
-            password_hash TEXT,
-            first_name TEXT NOT NULL,
-            last_name TEXT NOT NULL,
-            oauth_provider TEXT DEFAULT NULL,
-            oauth_id TEXT DEFAULT NULL,
-            avatar_url TEXT DEFAULT NULL,
-            cuisine_preferences TEXT DEFAULT '',
-            newsletter_subscribed INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_active INTEGER DEFAULT 1
-        )
-    ''')
+    conn.execute(USERS_TABLE_V1)
+    
+    # Older databases predate the origin/cuisine/diet columns; add them in place
+    existing_columns = table_columns(conn, 'recipes')
+    if existing_columns:
+        for column, declaration in LEGACY_RECIPE_COLUMNS:
+            if column not in existing_columns:
+                conn.execute(f'ALTER TABLE recipes ADD COLUMN {column} {declaration}')
     
     # Create recipes table with enhanced schema
     conn.execute('''
@@ -109,7 +999,6 @@ def init_database():
         )
     ''')
     
-    
     # Create recipe ratings table
     conn.execute('''
         CREATE TABLE IF NOT EXISTS recipe_ratings (
@@ -125,1998 +1014,870 @@ def init_database():
             FOREIGN KEY (user_id) REFERENCES users (id)
         )
     ''')
+
+def migrate_002_search_index(conn):
+    """FTS5 index over recipe text, rebuilt from the current rows"""
+    apply_ddl(conn, SEARCH_INDEX_V1)
+    rebuild_recipe_search_index(conn)
+
+def migrate_003_listing_index(conn):
+    """Keyset pagination index for listings ordered by (name, id)"""
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_recipes_name_id ON recipes (name, id)')
+
+def migrate_004_catalog_version(conn):
+    """Version stamp used to invalidate the in-memory recipe catalog"""
+    apply_ddl(conn, CATALOG_VERSION_STAMP_V1)
+
+def migrate_005_facet_indexes(conn):
+    """Composite and partial indexes backing the /api/recipes facet filters"""
+    apply_ddl(conn, (statement for _, statement in RECIPE_FACET_INDEXES_V1))
+
+def migrate_006_rating_stats(conn):
+    """Materialized per-recipe rating aggregates, with recipe_id normalized to integers"""
+    # Older /api/rate-recipe writes could store recipe_id as text. Drop values that
+    # are not ids at all, then keep the newest rating per (recipe, type, user)
+    # before casting so the UNIQUE index holds
+    conn.execute('''
+        DELETE FROM recipe_ratings
+        WHERE typeof(recipe_id) = 'text'
+          AND (trim(recipe_id) = '' OR trim(recipe_id) GLOB '*[^0-9]*')
+    ''')
+    conn.execute('''
+        DELETE FROM recipe_ratings WHERE id NOT IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY CAST(recipe_id AS INTEGER), recipe_type, user_id
+                    ORDER BY updated_at DESC, id DESC
+                ) AS position
+                FROM recipe_ratings
+            ) WHERE position = 1
+        )
+    ''')
+    conn.execute('''
+        UPDATE recipe_ratings SET recipe_id = CAST(trim(recipe_id) AS INTEGER)
+        WHERE typeof(recipe_id) != 'integer'
+    ''')
     
-    # Check if data already exists
-    existing_recipes = conn.execute('SELECT COUNT(*) FROM recipes').fetchone()[0]
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recipe_rating_stats (
+            recipe_id INTEGER NOT NULL,
+            recipe_type TEXT NOT NULL,
+            rating_count INTEGER NOT NULL DEFAULT 0,
+            rating_sum INTEGER NOT NULL DEFAULT 0,
+            stars_1 INTEGER NOT NULL DEFAULT 0,
+            stars_2 INTEGER NOT NULL DEFAULT 0,
+            stars_3 INTEGER NOT NULL DEFAULT 0,
+            stars_4 INTEGER NOT NULL DEFAULT 0,
+            stars_5 INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (recipe_id, recipe_type)
+        ) WITHOUT ROWID
+    ''')
     
-    if existing_recipes == 0:
-        # Comprehensive Kenyan food database
-        kenyan_recipes = [
-            {
-                'name': 'Ugali',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Kenya\'s national staple food made from white cornmeal flour',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '15 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in carbohydrates for energy, gluten-free, rich in fiber, provides essential minerals',
-                'ingredients': '2 cups white cornmeal flour (maize flour)|3 cups water|1 tsp salt',
-                'steps': 'Boil water with salt in a heavy-bottomed pot|Gradually add cornmeal flour while stirring continuously|Stir vigorously to prevent lumps from forming|Cook for 10-15 minutes, stirring constantly until thick|The ugali is ready when it pulls away from the sides of the pot|Serve hot as an accompaniment to stews and vegetables'
-            },
-            {
-                'name': 'Nyama Choma',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan BBQ',
-                'description': 'Grilled meat, typically goat or beef, seasoned with salt and roasted over open fire',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and iron, provides essential amino acids, rich in B vitamins',
-                'ingredients': '1kg beef or goat meat|2 tsp salt|1 tsp black pepper|2 cloves garlic, minced|1 tsp ginger, minced|2 tbsp vegetable oil|Lemon juice',
-                'steps': 'Cut meat into medium-sized pieces|Season with salt, pepper, garlic, and ginger|Let marinate for 30 minutes|Prepare charcoal fire or grill|Grill meat over medium heat, turning occasionally|Cook for 25-30 minutes until well done but tender|Brush with oil and lemon juice while grilling|Serve hot with ugali and vegetables'
-            },
-            {
-                'name': 'Sukuma Wiki',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Collard greens sautéed with onions and tomatoes, a popular vegetable dish',
-                'image': 'https://images.unsplash.com/photo-1576045057995-568f588f82fb?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in vitamins A, C, and K, high in fiber, contains antioxidants, good source of calcium',
-                'ingredients': '1 bunch collard greens (sukuma wiki)|2 onions, chopped|3 tomatoes, chopped|3 cloves garlic, minced|2 tbsp vegetable oil|Salt to taste|1 tsp curry powder (optional)',
-                'steps': 'Wash and chop collard greens into thin strips|Heat oil in a large pan|Sauté onions until golden brown|Add garlic and cook for 1 minute|Add tomatoes and cook until soft|Add chopped greens and stir well|Season with salt and curry powder|Cook for 10-15 minutes until greens are tender|Serve as a side dish with ugali or rice'
-            },
-            {
-                'name': 'Githeri',
-                'country': 'Kenya',
-                'origin': 'Central Kenya (Kikuyu)',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Traditional Kikuyu dish of boiled maize and beans, often with vegetables',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Complete protein from beans and corn combination, high in fiber, rich in folate and iron',
-                'ingredients': '2 cups dried maize (corn)|1 cup kidney beans|2 onions, chopped|3 tomatoes, chopped|2 carrots, diced|2 tbsp vegetable oil|Salt to taste|2 tsp curry powder|Fresh coriander',
-                'steps': 'Soak maize and beans overnight separately|Boil maize for 30 minutes until tender|Add beans and continue cooking for 20 minutes|In a separate pan, heat oil and sauté onions|Add tomatoes and carrots, cook until soft|Add curry powder and cook for 2 minutes|Combine with boiled maize and beans|Season with salt and simmer for 10 minutes|Garnish with fresh coriander before serving'
-            },
-            {
-                'name': 'Mandazi',
-                'country': 'Kenya',
-                'origin': 'East Africa (Swahili Coast)',
-                'cuisine_type': 'Kenyan Snack',
-                'description': 'Sweet, spiced fried bread popular throughout East Africa',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides energy from carbohydrates, contains small amounts of protein and healthy fats',
-                'ingredients': '3 cups all-purpose flour|1/2 cup sugar|1 tsp active dry yeast|1/2 cup warm milk|2 eggs|3 tbsp melted butter|1 tsp cardamom powder|1/2 tsp salt|Oil for deep frying',
-                'steps': 'Mix warm milk with yeast and a pinch of sugar, let foam for 5 minutes|In a large bowl, mix flour, sugar, cardamom, and salt|Add yeast mixture, eggs, and melted butter|Knead into a soft dough and let rise for 1 hour|Roll out dough and cut into triangular or square shapes|Heat oil to 350°F (175°C)|Deep fry mandazi until golden brown on both sides|Drain on paper towels and serve warm with tea or coffee'
-            },
-            {
-                'name': 'Chapati',
-                'country': 'Kenya',
-                'origin': 'Indian-Kenyan',
-                'cuisine_type': 'Kenyan-Indian',
-                'description': 'Soft, layered flatbread that\'s a staple in Kenyan households',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Good source of carbohydrates, provides energy, contains small amounts of protein and fiber',
-                'ingredients': '3 cups all-purpose flour|1 tsp salt|2 tbsp vegetable oil|1 cup warm water|Extra oil for rolling',
-                'steps': 'Mix flour and salt in a large bowl|Add oil and gradually add water while mixing|Knead into a smooth, soft dough|Let rest for 30 minutes covered|Divide into 8-10 portions|Roll each portion thin, brush with oil|Roll up into a coil, then flatten and roll again|Cook on hot griddle until golden spots appear|Brush with oil while cooking|Serve warm with stew or curry'
-            },
-            {
-                'name': 'Pilau',
-                'country': 'Kenya',
-                'origin': 'Swahili Coast',
-                'cuisine_type': 'Kenyan-Arabic',
-                'description': 'Fragrant spiced rice dish cooked with meat and aromatic spices',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in protein from meat, provides complex carbohydrates, contains antioxidants from spices',
-                'ingredients': '2 cups basmati rice|500g beef or chicken, cubed|2 onions, sliced|4 cloves garlic, minced|2cm ginger, minced|2 tsp pilau masala|1 tsp cumin|4 cardamom pods|2 bay leaves|3 tbsp vegetable oil|3 cups beef stock|Salt to taste|Fresh coriander',
-                'steps': 'Wash and soak rice for 30 minutes|Heat oil in a heavy pot, brown meat pieces|Add onions and cook until golden|Add garlic, ginger, and all spices, cook for 2 minutes|Add drained rice and stir gently for 3 minutes|Pour in hot stock, bring to boil|Reduce heat, cover and simmer for 20 minutes|Let rest for 10 minutes before serving|Garnish with fresh coriander'
-            },
-            {
-                'name': 'Samosas',
-                'country': 'Kenya',
-                'origin': 'Indian-Kenyan',
-                'cuisine_type': 'Kenyan-Indian',
-                'description': 'Crispy triangular pastries filled with spiced meat or vegetables',
-                'image': 'https://images.unsplash.com/photo-1601050690117-94f5f6fa44d4?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides protein from meat, contains vitamins from vegetables, moderate calories',
-                'ingredients': '2 cups all-purpose flour|4 tbsp oil|1/2 tsp salt|Water as needed|500g ground beef|2 onions, diced|3 cloves garlic|2 tsp garam masala|1 tsp cumin|Green chilies|Fresh coriander|Oil for frying',
-                'steps': 'Make dough with flour, oil, salt, and water, knead until smooth|Let rest for 30 minutes|Cook ground beef with onions, garlic, and spices until dry|Let filling cool completely|Roll dough thin and cut into rectangles|Place filling on one end and fold into triangles|Seal edges with water|Deep fry until golden brown and crispy|Serve hot with chutney or kachumbari'
-            },
-            {
-                'name': 'Kachumbari',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan Salad',
-                'description': 'Fresh tomato and onion salad with lime and chili',
-                'image': 'https://images.unsplash.com/photo-1512621776951-a57141f2eefd?w=400&h=300&fit=crop',
-                'prep_time': '10 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in vitamin C, contains antioxidants, very low in calories, provides hydration',
-                'ingredients': '4 large tomatoes, diced|2 red onions, finely chopped|2 green chilies, chopped|Juice of 2 limes|1/4 cup fresh coriander, chopped|Salt to taste|1 cucumber, diced (optional)',
-                'steps': 'Dice tomatoes and place in a serving bowl|Add finely chopped onions and green chilies|Add diced cucumber if using|Pour lime juice over the vegetables|Season with salt to taste|Add fresh coriander and mix gently|Let sit for 5 minutes for flavors to blend|Serve as a side dish with nyama choma or other main dishes'
-            },
-            {
-                'name': 'Mukimo',
-                'country': 'Kenya',
-                'origin': 'Central Kenya (Kikuyu)',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Mashed green vegetables with potatoes, beans, and corn',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '40 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in vitamins and minerals, high in fiber, provides complex carbohydrates and plant protein',
-                'ingredients': '4 medium potatoes, peeled|1 cup green beans|1 cup green peas|2 cups pumpkin leaves or spinach|1 cup boiled maize|1 onion, chopped|2 tbsp vegetable oil|Salt to taste',
-                'steps': 'Boil potatoes until tender|Steam or boil green beans and peas until soft|Sauté onions in oil until golden|Add all vegetables and maize to the pot|Mash everything together while still warm|Season with salt to taste|Mix until well combined but still chunky|Serve hot as a main dish or side with meat'
-            },
-            {
-                'name': 'Fish Stew (Mchuzi wa Samaki)',
-                'country': 'Kenya',
-                'origin': 'Kenyan Coast (Swahili)',
-                'cuisine_type': 'Kenyan Coastal',
-                'description': 'Coconut fish curry popular along the Kenyan coast',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '35 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in omega-3 fatty acids, rich in protein, contains healthy fats from coconut',
-                'ingredients': '1kg white fish fillets|400ml coconut milk|2 onions, sliced|4 tomatoes, chopped|4 cloves garlic, minced|2cm ginger, minced|2 green chilies|2 tsp curry powder|1 tsp turmeric|2 tbsp vegetable oil|Salt to taste|Fresh coriander',
-                'steps': 'Cut fish into large pieces and season with salt|Heat oil in a large pan, lightly fry fish pieces and set aside|Sauté onions until soft and golden|Add garlic, ginger, and chilies, cook for 2 minutes|Add tomatoes and cook until soft|Add curry powder and turmeric, cook for 1 minute|Pour in coconut milk and bring to gentle simmer|Return fish to pan and simmer for 10 minutes|Garnish with coriander and serve with rice or ugali'
-            },
-            {
-                'name': 'Irio',
-                'country': 'Kenya',
-                'origin': 'Central Kenya (Kikuyu)',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Mashed potatoes mixed with green peas and corn',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in vitamin C, provides fiber and potassium, good source of plant protein from peas',
-                'ingredients': '6 medium potatoes, peeled|1 cup green peas|1 cup sweet corn kernels|2 tbsp butter or oil|Salt to taste|Fresh parsley (optional)',
-                'steps': 'Boil potatoes until very tender|Steam peas and corn until soft|Drain potatoes and mash while hot|Add steamed peas and corn to mashed potatoes|Add butter or oil and mix well|Season with salt to taste|Mash until well combined but leave some texture|Garnish with fresh parsley if desired|Serve hot as a side dish with meat or stew'
-            },
-            {
-                'name': 'Maharagwe',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Red kidney beans cooked in coconut milk with spices',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '75 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and fiber, rich in folate and iron, contains healthy fats from coconut',
-                'ingredients': '2 cups dried red kidney beans|400ml coconut milk|2 onions, chopped|3 tomatoes, chopped|3 cloves garlic, minced|2 tsp curry powder|1 tsp cumin|2 tbsp vegetable oil|Salt to taste|Fresh coriander',
-                'steps': 'Soak beans overnight, then boil until tender (about 45 minutes)|Heat oil in a large pan, sauté onions until golden|Add garlic and cook for 1 minute|Add tomatoes and cook until soft|Add curry powder and cumin, cook for 2 minutes|Add cooked beans with some cooking liquid|Pour in coconut milk and simmer for 15 minutes|Season with salt and garnish with coriander|Serve with rice, ugali, or chapati'
-            },
-            {
-                'name': 'Mutura',
-                'country': 'Kenya',
-                'origin': 'Central Kenya',
-                'cuisine_type': 'Kenyan Street Food',
-                'description': 'Traditional Kenyan blood sausage grilled over charcoal',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Very high in iron and protein, rich in B vitamins, provides essential minerals',
-                'ingredients': 'Cow or goat intestines (cleaned)|2 cups fresh blood|1 cup minced meat|2 onions, finely chopped|4 cloves garlic, minced|2 tsp ginger, minced|2 tsp curry powder|1 tsp black pepper|Salt to taste|Fresh coriander',
-                'steps': 'Clean intestines thoroughly with salt and lemon|Mix blood with minced meat, onions, garlic, ginger|Add spices and mix well|Stuff mixture into cleaned intestines|Tie ends securely with string|Boil gently for 45 minutes|Remove and let cool slightly|Grill over charcoal until crispy outside|Slice and serve hot with kachumbari'
-            },
-            {
-                'name': 'Matoke',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Green bananas cooked with meat and spices in a hearty stew',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '50 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in potassium and vitamin B6, high in fiber, provides sustained energy from complex carbs',
-                'ingredients': '8 green bananas (matoke)|500g beef, cubed|2 onions, chopped|3 tomatoes, chopped|3 cloves garlic, minced|2 tsp curry powder|1 tsp cumin|2 tbsp vegetable oil|2 cups beef stock|Salt to taste|Fresh coriander',
-                'steps': 'Peel and cut green bananas into chunks|Brown meat in oil until golden|Add onions and cook until soft|Add garlic and spices, cook for 2 minutes|Add tomatoes and cook until soft|Add banana chunks and gently mix|Pour in stock to barely cover|Cover and simmer for 25 minutes until bananas are tender|Season with salt and garnish with coriander|Serve hot as a complete meal'
-            },
-            {
-                'name': 'Bhajia',
-                'country': 'Kenya',
-                'origin': 'Indian-Kenyan',
-                'cuisine_type': 'Kenyan-Indian',
-                'description': 'Spiced potato fritters popular as a snack or appetizer',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides energy from potatoes, contains antioxidants from spices, good source of potassium',
-                'ingredients': '4 large potatoes, thinly sliced|2 cups chickpea flour (besan)|1 tsp turmeric|2 tsp coriander seeds, ground|1 tsp cumin seeds|2 green chilies, minced|1 tsp ginger-garlic paste|Salt to taste|Water as needed|Oil for deep frying',
-                'steps': 'Slice potatoes very thinly and soak in salted water|Mix chickpea flour with all spices and salt|Add water gradually to make a thick batter|Drain potato slices and pat dry|Heat oil to 350°F (175°C)|Dip potato slices in batter and deep fry until golden|Fry in small batches to avoid overcrowding|Drain on paper towels|Serve hot with chutney or tomato sauce'
-            },
-            {
-                'name': 'Kunde',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Black-eyed peas cooked with coconut milk and spices',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and fiber, rich in folate, contains antioxidants, good source of potassium',
-                'ingredients': '2 cups dried black-eyed peas|400ml coconut milk|2 onions, chopped|3 tomatoes, chopped|3 cloves garlic, minced|2 tsp curry powder|2 tbsp vegetable oil|Salt to taste|Fresh coriander',
-                'steps': 'Soak black-eyed peas overnight|Boil until tender, about 30 minutes|Heat oil in a pan, sauté onions until golden|Add garlic and cook for 1 minute|Add tomatoes and cook until soft|Add curry powder and cook for 2 minutes|Add cooked peas with some cooking liquid|Pour in coconut milk and simmer for 10 minutes|Season with salt and garnish with coriander|Serve with ugali or rice'
-            },
-            {
-                'name': 'Maandazi (Sweet Version)',
-                'country': 'Kenya',
-                'origin': 'East Africa (Swahili Coast)',
-                'cuisine_type': 'Kenyan Dessert',
-                'description': 'Sweet coconut-flavored fried bread, often eaten as a snack or dessert',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides quick energy, contains healthy fats from coconut, moderate protein content',
-                'ingredients': '3 cups all-purpose flour|1/2 cup sugar|1 tsp active dry yeast|200ml coconut milk|2 eggs|3 tbsp melted butter|1 tsp cardamom powder|1/2 tsp salt|1 tsp vanilla extract|Oil for frying',
-                'steps': 'Warm coconut milk slightly and mix with yeast and 1 tbsp sugar|Let foam for 5 minutes|Mix flour, remaining sugar, cardamom, and salt|Add yeast mixture, eggs, melted butter, and vanilla|Knead into soft dough and let rise for 1 hour|Roll out and cut into desired shapes|Heat oil to 350°F (175°C)|Deep fry until golden brown|Dust with powdered sugar and serve warm'
-            },
-            {
-                'name': 'Terere',
-                'country': 'Kenya',
-                'origin': 'Central Kenya',
-                'cuisine_type': 'Kenyan Traditional',
-                'description': 'Amaranth greens cooked with onions and tomatoes',
-                'image': 'https://images.unsplash.com/photo-1576045057995-568f588f82fb?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Extremely high in vitamins A and C, rich in iron and calcium, contains powerful antioxidants',
-                'ingredients': '2 bunches amaranth greens (terere)|2 onions, chopped|3 tomatoes, chopped|3 cloves garlic, minced|2 tbsp vegetable oil|Salt to taste|1 green chili (optional)',
-                'steps': 'Wash and chop amaranth greens|Heat oil in a large pan|Sauté onions until golden|Add garlic and green chili, cook for 1 minute|Add tomatoes and cook until soft|Add chopped greens and stir well|Cover and cook for 10 minutes until greens are tender|Season with salt to taste|Serve with ugali, rice, or chapati'
-            },
-            {
-                'name': 'Viazi Karai',
-                'country': 'Kenya',
-                'origin': 'Kenyan Coast',
-                'cuisine_type': 'Kenyan Street Food',
-                'description': 'Spiced potato curry, a popular street food snack',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Medium',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Good source of potassium and vitamin C, provides complex carbohydrates, contains antioxidants from spices',
-                'ingredients': '6 medium potatoes, cubed|2 onions, chopped|3 tomatoes, chopped|4 cloves garlic, minced|2cm ginger, minced|2 tsp curry powder|1 tsp turmeric|1 tsp cumin|2 green chilies|3 tbsp vegetable oil|Salt to taste|Fresh coriander',
-                'steps': 'Boil potatoes until just tender, don\'t overcook|Heat oil in a large pan|Sauté onions until golden brown|Add garlic, ginger, and green chilies|Add tomatoes and cook until soft|Add all spices and cook for 2 minutes|Add boiled potatoes and mix gently|Simmer for 10 minutes until flavors blend|Garnish with fresh coriander|Serve hot as a snack or with bread'
-            },
-            {
-                'name': 'Wali wa Nazi',
-                'country': 'Kenya',
-                'origin': 'Kenyan Coast (Swahili)',
-                'cuisine_type': 'Kenyan Coastal',
-                'description': 'Coconut rice, a fragrant coastal staple',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Provides complex carbohydrates, contains healthy fats from coconut, good source of energy',
-                'ingredients': '2 cups basmati rice|400ml coconut milk|2 cups water|1 tsp salt|1 cinnamon stick|3 cardamom pods|2 cloves|1 tbsp vegetable oil',
-                'steps': 'Wash rice until water runs clear|Heat oil in a heavy-bottomed pot|Add whole spices and fry for 1 minute|Add rice and stir for 2 minutes|Add coconut milk, water, and salt|Bring to boil, then reduce heat to low|Cover and simmer for 18 minutes|Turn off heat and let rest for 10 minutes|Fluff with a fork before serving|Serve with fish curry or vegetable dishes'
-            },
-            {
-                'name': 'Smokies (Kenyan Style)',
-                'country': 'Kenya',
-                'origin': 'Urban Kenya',
-                'cuisine_type': 'Kenyan Street Food',
-                'description': 'Grilled sausages served with kachumbari and ugali',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Good source of protein, provides essential amino acids and B vitamins',
-                'ingredients': '8 beef or pork sausages|2 tbsp vegetable oil|1 batch kachumbari|Ugali for serving|Tomato sauce (optional)',
-                'steps': 'Heat oil in a large pan or use a grill|Cook sausages over medium heat, turning frequently|Grill for 15-20 minutes until golden brown and cooked through|Meanwhile, prepare fresh kachumbari|Slice sausages diagonally if desired|Serve hot with kachumbari and ugali|Add tomato sauce on the side if preferred'
-            },
-            {
-                'name': 'Chai (Kenyan Tea)',
-                'country': 'Kenya',
-                'origin': 'East Africa',
-                'cuisine_type': 'Kenyan Beverage',
-                'description': 'Spiced milk tea that\'s a daily staple in Kenyan households',
-                'image': 'https://images.unsplash.com/photo-1571934811356-5cc061b6821f?w=400&h=300&fit=crop',
-                'prep_time': '10 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Contains antioxidants from tea, provides calcium from milk, spices aid digestion',
-                'ingredients': '2 cups water|2 cups whole milk|4 tsp black tea leaves|4 tsp sugar|4 cardamom pods, crushed|1 cinnamon stick|2 cloves|1cm ginger, sliced',
-                'steps': 'Bring water to boil in a saucepan|Add all spices and ginger, boil for 2 minutes|Add tea leaves and boil for 2 minutes|Add milk and sugar|Bring to boil, then simmer for 3-4 minutes|Strain into cups through a fine mesh|Serve hot with mandazi or biscuits'
-            }
-        ]
-        
-        # West African recipes (additional to existing)
-        west_african_recipes = [
-            {
-                'name': 'Egusi Soup',
-                'country': 'Nigeria',
-                'origin': 'West Africa',
-                'cuisine_type': 'Nigerian Traditional',
-                'description': 'Rich soup made with ground melon seeds, leafy greens, and meat',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, rich in vitamins A and C, contains healthy fats from seeds, provides iron',
-                'ingredients': '2 cups ground egusi (melon seeds)|500g assorted meat (beef, goat)|1 cup palm oil|2 onions, chopped|4 cloves garlic, minced|2 tbsp locust beans (iru)|4 cups spinach or bitter leaf|2 stock cubes|3 cups water|Scotch bonnet peppers|Salt to taste',
-                'steps': 'Season and boil meat until tender|Heat palm oil in large pot|Fry meat pieces until browned|Add onions and garlic, cook until soft|Add locust beans and cook for 2 minutes|Mix egusi with small amount of stock to form paste|Add egusi paste to pot and stir well|Add remaining stock and bring to boil|Simmer for 20 minutes, stirring occasionally|Add leafy greens and cook for 5 minutes|Season with salt and pepper|Serve with pounded yam or fufu'
-            },
-            {
-                'name': 'Kelewele',
-                'country': 'Ghana',
-                'origin': 'West Africa',
-                'cuisine_type': 'Ghanaian Street Food',
-                'description': 'Spiced fried plantain cubes, a popular Ghanaian snack',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Medium',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in potassium and vitamin A, provides natural sugars for energy, contains antioxidants',
-                'ingredients': '4 ripe plantains|2 tsp ginger, minced|2 cloves garlic, minced|1 tsp nutmeg|1 tsp cinnamon|1/2 tsp cloves, ground|1 tsp salt|1/2 tsp cayenne pepper|Oil for deep frying',
-                'steps': 'Peel plantains and cut into 1-inch cubes|Mix all spices with salt in a large bowl|Toss plantain cubes with spice mixture|Let marinate for 10 minutes|Heat oil to 350°F (175°C)|Fry plantains in batches until golden brown|Remove with slotted spoon|Drain on paper towels|Serve hot as a snack or side dish|Can be enjoyed with groundnut soup'
-            },
-            {
-                'name': 'Banku',
-                'country': 'Ghana',
-                'origin': 'West Africa',
-                'cuisine_type': 'Ghanaian Traditional',
-                'description': 'Fermented corn and cassava dough cooked into a smooth paste',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '45 mins + fermentation',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Good source of carbohydrates, naturally fermented for gut health, provides energy',
-                'ingredients': '2 cups fermented corn dough|1 cup cassava dough|4-5 cups water|Salt to taste',
-                'steps': 'Mix corn and cassava dough in large bowl|Gradually add water to form smooth paste|Strain mixture to remove lumps|Bring to boil in heavy pot, stirring constantly|Reduce heat and continue stirring vigorously|Cook for 20-30 minutes until very thick and smooth|The banku is ready when it doesn\'t stick to pot|Shape into portions with wet hands|Serve hot with grilled fish and pepper sauce'
-            },
-            {
-                'name': 'Moi Moi',
-                'country': 'Nigeria',
-                'origin': 'West Africa',
-                'cuisine_type': 'Nigerian Traditional',
-                'description': 'Steamed bean pudding made from black-eyed peas',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and fiber, rich in folate, provides plant-based iron, contains antioxidants',
-                'ingredients': '3 cups black-eyed peas (soaked and peeled)|1 red bell pepper|1 onion|3 cloves garlic|2 tsp ginger|1/2 cup palm oil|2 stock cubes|1 tsp salt|1 cup warm water|Banana leaves or foil for wrapping',
-                'steps': 'Soak beans overnight and remove skins|Blend beans with peppers, onion, garlic, ginger|Add just enough water to make smooth paste|Season with salt and stock cubes|Gradually add palm oil while mixing|Mix until well combined and fluffy|Wrap portions in banana leaves or foil|Steam for 45-60 minutes until firm|Test with toothpick - should come out clean|Serve hot as main dish or side|Can be eaten with bread or rice'
-            },
-            {
-                'name': 'Plantain Fufu',
-                'country': 'Ghana',
-                'origin': 'West Africa',
-                'cuisine_type': 'Ghanaian Traditional',
-                'description': 'Smooth, stretchy fufu made from boiled plantains',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in potassium and vitamin B6, provides complex carbohydrates, contains dietary fiber',
-                'ingredients': '8 green plantains|2 cups cassava flour|Water as needed|Salt to taste',
-                'steps': 'Peel and cut plantains into chunks|Boil plantains until very tender|Drain and mash while hot|Gradually add cassava flour while pounding|Add small amounts of warm water as needed|Pound until smooth and stretchy|The fufu should be elastic and not sticky|Form into balls and serve immediately|Traditionally eaten with soup or stew|Use hands to pinch off pieces and dip in soup'
-            }
-        ]
-        
-        # Other African recipes
-        other_african_recipes = west_african_recipes + [
-            {
-                'name': 'Jollof Rice',
-                'country': 'Nigeria',
-                'origin': 'West Africa',
-                'cuisine_type': 'Nigerian Traditional',
-                'description': 'One-pot rice dish cooked in tomato sauce with spices and vegetables',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in lycopene from tomatoes, provides complex carbohydrates, contains antioxidants from spices',
-                'ingredients': '3 cups long-grain rice|400ml tomato puree|2 onions, chopped|4 cloves garlic, minced|2cm ginger, minced|2 tsp curry powder|1 tsp thyme|2 bay leaves|3 tbsp vegetable oil|3 cups chicken or vegetable stock|Salt and pepper to taste|Green bell pepper|Scotch bonnet pepper (optional)',
-                'steps': 'Wash rice until water runs clear|Heat oil in a large pot, sauté onions until golden|Add garlic and ginger, cook for 2 minutes|Add tomato puree and cook for 10 minutes until reduced|Add spices, bay leaves, and cook for 2 minutes|Add rice and stir to coat with sauce|Pour in stock, bring to boil|Add bell pepper, reduce heat and simmer covered for 20 minutes|Let rest 10 minutes before serving|Garnish with fresh herbs'
-            },
-            {
-                'name': 'Tagine',
-                'country': 'Morocco',
-                'origin': 'North Africa',
-                'cuisine_type': 'Moroccan Traditional',
-                'description': 'Slow-cooked stew with meat, vegetables, and aromatic spices',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, rich in antioxidants from spices, contains healthy fats, provides vitamins from vegetables',
-                'ingredients': '1kg lamb or chicken, cubed|2 onions, sliced|3 carrots, sliced|2 tsp ginger, minced|4 cloves garlic, minced|2 tsp cinnamon|1 tsp turmeric|1 tsp cumin|1/2 cup dried apricots|1/4 cup almonds|3 tbsp olive oil|2 cups chicken stock|Fresh coriander|Salt and pepper',
-                'steps': 'Heat oil in tagine or heavy pot|Brown meat pieces on all sides|Add onions and cook until soft|Add garlic, ginger, and all spices|Cook for 2 minutes until fragrant|Add carrots, apricots, and stock|Bring to boil, then reduce heat|Cover and simmer for 60 minutes until meat is tender|Add almonds in last 10 minutes|Garnish with fresh coriander|Serve with couscous or bread'
-            },
-            {
-                'name': 'Bobotie',
-                'country': 'South Africa',
-                'origin': 'South Africa',
-                'cuisine_type': 'South African Traditional',
-                'description': 'Spiced mince meat dish topped with egg custard and baked',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '75 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, provides essential amino acids, contains antioxidants from spices',
-                'ingredients': '500g ground beef or lamb|2 onions, chopped|2 slices white bread|1 cup milk|2 eggs|2 tbsp curry powder|1 tsp turmeric|2 tbsp chutney|2 tbsp vinegar|1/4 cup raisins|2 tbsp almonds, chopped|2 bay leaves|Salt and pepper',
-                'steps': 'Preheat oven to 180°C (350°F)|Soak bread in milk, then squeeze out excess|Brown mince in a large pan|Add onions and cook until soft|Add spices and cook for 2 minutes|Add soaked bread, chutney, vinegar, raisins|Mix well and transfer to baking dish|Beat eggs with remaining milk|Pour egg mixture over meat|Top with bay leaves|Bake for 45 minutes until golden|Serve with yellow rice and chutney'
-            },
-            {
-                'name': 'Injera',
-                'country': 'Ethiopia',
-                'origin': 'East Africa (Ethiopia)',
-                'cuisine_type': 'Ethiopian Traditional',
-                'description': 'Spongy sourdough flatbread made from teff flour',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '72 hours (fermentation)',
-                'difficulty': 'Hard',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and fiber, rich in iron and calcium, naturally fermented for gut health',
-                'ingredients': '4 cups teff flour|4 cups water|1/2 cup starter (optional)|Additional water for thinning',
-                'steps': 'Mix teff flour with water to form smooth batter|Cover and let ferment at room temperature for 3 days|Stir daily and add water if needed|Batter should smell sour and bubbly|Boil 1 cup of batter with 3 cups water until thick|Cool and mix back into main batter|Heat non-stick pan over medium heat|Pour thin layer of batter onto pan|Cover and cook until surface is dry and edges lift|Do not flip - cook only one side|Stack cooked injera with cloth between layers'
-            },
-            {
-                'name': 'Couscous',
-                'country': 'Morocco',
-                'origin': 'North Africa',
-                'cuisine_type': 'Moroccan Traditional',
-                'description': 'Steamed semolina grain served with vegetables and meat',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'Good source of protein and fiber, provides B vitamins, contains selenium for immune support',
-                'ingredients': '2 cups couscous|500g lamb or chicken|3 carrots, sliced|2 zucchini, sliced|1 onion, quartered|2 tomatoes, quartered|1 tsp cinnamon|1 tsp ginger|1 tsp turmeric|3 tbsp olive oil|4 cups water or stock|Salt to taste|Fresh herbs',
-                'steps': 'Place couscous in steamer basket|Steam over boiling water for 20 minutes|Meanwhile, brown meat in oil|Add onions and cook until soft|Add spices and cook for 2 minutes|Add vegetables and enough water to cover|Simmer for 30 minutes until tender|Fluff couscous with fork and add oil|Steam couscous again for 15 minutes|Serve couscous with vegetables and meat on top'
-            },
-            {
-                'name': 'Bunny Chow',
-                'country': 'South Africa',
-                'origin': 'South Africa (Durban)',
-                'cuisine_type': 'South African Fusion',
-                'description': 'Curry served in a hollowed-out loaf of bread',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Hot',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein from meat, provides carbohydrates from bread, contains antioxidants from spices',
-                'ingredients': '1 unsliced white bread loaf|500g mutton or chicken, cubed|2 onions, chopped|4 tomatoes, chopped|4 cloves garlic, minced|2cm ginger, minced|3 tbsp curry powder|1 tsp garam masala|2 green chilies|3 tbsp oil|1 cup water|Salt to taste|Fresh coriander',
-                'steps': 'Cut bread loaf in half and hollow out centers|Brown meat in oil until sealed|Add onions and cook until golden|Add garlic, ginger, chilies and spices|Cook for 3 minutes until fragrant|Add tomatoes and cook until soft|Add water and simmer for 30 minutes until meat is tender|Season with salt|Fill bread halves with curry|Garnish with coriander|Serve immediately while hot'
-            },
-            {
-                'name': 'Fufu',
-                'country': 'Ghana',
-                'origin': 'West Africa',
-                'cuisine_type': 'Ghanaian Traditional',
-                'description': 'Starchy staple made from cassava and plantain, served with soup',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '40 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in carbohydrates for energy, good source of fiber, provides potassium and vitamin C',
-                'ingredients': '2 cups cassava flour|1 cup plantain flour|3-4 cups water|Pinch of salt',
-                'steps': 'Boil water with salt in a large pot|Gradually add cassava flour while stirring continuously|Stir vigorously to prevent lumps|Add plantain flour gradually|Continue stirring until mixture is smooth and thick|Cook for 15-20 minutes, stirring constantly|The fufu is ready when it becomes very thick and stretchy|Serve hot with soup or stew|Traditionally eaten by hand, pinched off and dipped in soup'
-            },
-            {
-                'name': 'Biltong',
-                'country': 'South Africa',
-                'origin': 'South Africa',
-                'cuisine_type': 'South African Snack',
-                'description': 'Air-dried seasoned meat, similar to jerky but with unique spicing',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '7 days (drying time)',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Very high in protein, low in fat, rich in iron and B vitamins, long shelf life',
-                'ingredients': '2kg beef silverside|200g coarse salt|2 tbsp coriander seeds, crushed|2 tbsp black pepper|1 tbsp brown sugar|2 tbsp vinegar',
-                'steps': 'Cut meat into long strips with the grain|Mix salt, coriander, pepper, and sugar|Rub spice mixture into meat strips|Hang in vinegar for 1 minute|Hang strips in well-ventilated, dry area|Ensure good air circulation around meat|Dry for 5-7 days depending on thickness|Test for dryness - should be firm but not hard|Slice thinly against the grain to serve|Store in airtight container'
-            },
-            {
-                'name': 'Thieboudienne',
-                'country': 'Senegal',
-                'origin': 'West Africa',
-                'cuisine_type': 'Senegalese Traditional',
-                'description': 'National dish of Senegal - fish and rice with vegetables',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in omega-3 fatty acids, rich in protein, provides vitamins from vegetables',
-                'ingredients': '1kg white fish fillets|3 cups jasmine rice|2 onions, quartered|3 carrots, sliced|2 eggplants, cubed|1 cabbage, quartered|4 tomatoes, chopped|6 cloves garlic|2cm ginger|2 tbsp tomato paste|3 tbsp palm oil|Scotch bonnet pepper|Parsley|Thyme|Salt to taste',
-                'steps': 'Make a paste with garlic, ginger, and herbs|Stuff fish with paste and season|Brown fish in oil and set aside|Sauté onions until golden|Add tomato paste and cook for 5 minutes|Add tomatoes and cook until soft|Add enough water to cover rice|Add vegetables in order of cooking time|Return fish to pot|Simmer for 45 minutes until rice is cooked|Serve fish and vegetables over rice'
-            },
-            {
-                'name': 'Doro Wat',
-                'country': 'Ethiopia',
-                'origin': 'East Africa (Ethiopia)',
-                'cuisine_type': 'Ethiopian Traditional',
-                'description': 'Spicy chicken stew with hard-boiled eggs and berbere spice',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Hot',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, rich in iron, contains antioxidants from spices, provides healthy fats',
-                'ingredients': '1 whole chicken, cut into pieces|6 hard-boiled eggs|3 large onions, chopped|4 cloves garlic, minced|2cm ginger, minced|3 tbsp berbere spice blend|2 tbsp paprika|1/4 cup red wine|3 tbsp clarified butter|2 cups chicken stock|Salt to taste',
-                'steps': 'Dry roast onions in heavy pot until caramelized (30 mins)|Add garlic and ginger, cook 5 minutes|Add berbere and paprika, cook 2 minutes|Add wine and cook until evaporated|Add butter and chicken pieces|Brown chicken well on all sides|Add stock gradually while stirring|Simmer covered for 45 minutes|Add peeled hard-boiled eggs|Simmer 15 minutes more|Serve with injera bread'
-            },
-            {
-                'name': 'Bunny Suya',
-                'country': 'Nigeria',
-                'origin': 'West Africa (Northern Nigeria)',
-                'cuisine_type': 'Nigerian Street Food',
-                'description': 'Spicy grilled meat skewers with peanut spice mix',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Hot',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, contains healthy fats from peanuts, rich in antioxidants from spices',
-                'ingredients': '1kg beef, cut into cubes|1 cup roasted peanuts, ground|2 tsp ginger powder|2 tsp garlic powder|1 tsp cayenne pepper|1 tsp paprika|1 tsp onion powder|Salt to taste|Vegetable oil|Wooden skewers',
-                'steps': 'Soak wooden skewers in water for 30 minutes|Mix ground peanuts with all spices and salt|Thread meat onto skewers|Brush meat with oil|Sprinkle suya spice mix generously over meat|Let marinate for 20 minutes|Grill over medium-high heat for 15-20 minutes|Turn frequently and baste with oil|Sprinkle more spice mix before serving|Serve hot with sliced onions and tomatoes'
-            },
-            {
-                'name': 'Pap en Vleis',
-                'country': 'South Africa',
-                'origin': 'South Africa',
-                'cuisine_type': 'South African Traditional',
-                'description': 'Maize porridge served with grilled meat, a staple combination',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '40 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Provides sustained energy from complex carbs, high in protein from meat, contains essential minerals',
-                'ingredients': '2 cups white maize meal|4 cups water|1 tsp salt|1kg beef steak or boerewors|2 tbsp vegetable oil|Black pepper|Salt for seasoning meat',
-                'steps': 'Bring water and salt to boil in heavy pot|Gradually add maize meal while stirring|Stir continuously to prevent lumps|Cook for 25-30 minutes, stirring regularly|Meanwhile, season meat with salt and pepper|Grill meat over medium-high heat|Cook steak for 4-5 minutes per side|Or grill boerewors for 15-20 minutes, turning frequently|Let meat rest before slicing|Serve hot pap with grilled meat alongside'
-            }
-        ]
-        
-        # Famous European recipes
-        european_recipes = [
-            {
-                'name': 'Pasta Carbonara',
-                'country': 'Italy',
-                'origin': 'Central Italy (Rome)',
-                'cuisine_type': 'Italian Traditional',
-                'description': 'Classic Roman pasta with eggs, cheese, pancetta, and black pepper',
-                'image': 'https://images.unsplash.com/photo-1621996346565-e3dbc353d2e5?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein from eggs and pancetta, provides energy from pasta, contains calcium from cheese',
-                'ingredients': '400g spaghetti|200g pancetta, diced|4 large eggs|100g Parmesan cheese, grated|2 cloves garlic, minced|Freshly ground black pepper|2 tbsp olive oil|Salt for pasta water',
-                'steps': 'Bring large pot of salted water to boil|Cook spaghetti according to package directions|Meanwhile, heat oil in large pan|Cook pancetta until crispy|Add garlic and cook for 1 minute|Beat eggs with Parmesan and black pepper|Drain pasta, reserving 1 cup pasta water|Add hot pasta to pancetta pan|Remove from heat and quickly stir in egg mixture|Add pasta water gradually until creamy|Serve immediately with extra Parmesan and pepper'
-            },
-            {
-                'name': 'Paella',
-                'country': 'Spain',
-                'origin': 'Valencia, Spain',
-                'cuisine_type': 'Spanish Traditional',
-                'description': 'Saffron-infused rice dish with seafood, chicken, and vegetables',
-                'image': 'https://images.unsplash.com/photo-1534080564583-6be75777b70a?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein from seafood, rich in omega-3 fatty acids, contains antioxidants from saffron',
-                'ingredients': '2 cups bomba or short-grain rice|500g mixed seafood (mussels, prawns, squid)|400g chicken thighs|1 red bell pepper|1 cup green beans|4 cups chicken stock|Pinch of saffron|4 cloves garlic, minced|2 tomatoes, grated|4 tbsp olive oil|Salt and pepper|Lemon wedges|Fresh parsley',
-                'steps': 'Heat olive oil in large paella pan|Season and brown chicken pieces, set aside|Sauté bell pepper and green beans, set aside|Cook garlic and tomatoes until thick|Add rice and stir for 2 minutes|Heat stock with saffron in separate pot|Add hot stock to rice, bring to boil|Return chicken and vegetables to pan|Simmer for 10 minutes without stirring|Add seafood in last 8 minutes|Let rest for 5 minutes before serving|Garnish with parsley and lemon'
-            },
-            {
-                'name': 'Fish and Chips',
-                'country': 'United Kingdom',
-                'origin': 'England',
-                'cuisine_type': 'British Traditional',
-                'description': 'Beer-battered fish with thick-cut chips, a British classic',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and omega-3 fatty acids, provides carbohydrates from potatoes',
-                'ingredients': '4 large cod fillets|1kg large potatoes|2 cups all-purpose flour|1 bottle beer|1 tsp baking powder|Salt and pepper|Vegetable oil for frying|Mushy peas and tartar sauce for serving',
-                'steps': 'Cut potatoes into thick chips and soak in cold water|Heat oil to 140°C, fry chips for 5 minutes|Remove and drain on paper towels|Make batter with flour, beer, baking powder, and salt|Heat oil to 180°C|Dip fish in flour, then batter|Fry fish for 4-5 minutes until golden|Fry chips again at 180°C until crispy|Season with salt and serve with mushy peas|Add malt vinegar and tartar sauce'
-            },
-            {
-                'name': 'Coq au Vin',
-                'country': 'France',
-                'origin': 'Burgundy, France',
-                'cuisine_type': 'French Traditional',
-                'description': 'Chicken braised in red wine with mushrooms and bacon',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, contains antioxidants from red wine, provides B vitamins',
-                'ingredients': '1 whole chicken, cut into pieces|200g bacon, diced|500ml red wine|250g mushrooms, quartered|12 small onions|3 cloves garlic, minced|2 tbsp flour|2 tbsp butter|2 bay leaves|Fresh thyme|2 tbsp olive oil|Salt and pepper|Fresh parsley',
-                'steps': 'Season chicken pieces with salt and pepper|Heat oil in heavy pot, brown chicken and set aside|Cook bacon until crispy, set aside|Sauté onions and mushrooms until golden|Add garlic and cook for 1 minute|Sprinkle flour and cook for 2 minutes|Gradually add wine, stirring constantly|Return chicken and bacon to pot|Add herbs and bring to simmer|Cover and cook for 45 minutes until tender|Serve with mashed potatoes and crusty bread'
-            },
-            {
-                'name': 'Wiener Schnitzel',
-                'country': 'Austria',
-                'origin': 'Austria',
-                'cuisine_type': 'Austrian Traditional',
-                'description': 'Breaded and fried veal cutlet, a classic Austrian dish',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides essential amino acids and B vitamins',
-                'ingredients': '4 veal cutlets, pounded thin|2 cups breadcrumbs|2 eggs, beaten|1/2 cup flour|Vegetable oil for frying|Salt and pepper|Lemon wedges|Fresh parsley',
-                'steps': 'Pound veal cutlets until very thin|Season with salt and pepper|Set up breading station: flour, beaten eggs, breadcrumbs|Dredge cutlets in flour, then egg, then breadcrumbs|Press coating gently to adhere|Heat oil in large skillet to 350°F|Fry schnitzels for 2-3 minutes per side until golden|Drain on paper towels|Serve immediately with lemon wedges|Traditionally served with potato salad and lingonberry sauce'
-            },
-            {
-                'name': 'Moussaka',
-                'country': 'Greece',
-                'origin': 'Greece',
-                'cuisine_type': 'Greek Traditional',
-                'description': 'Layered casserole with eggplant, meat sauce, and béchamel',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, contains fiber from eggplant, provides calcium from cheese and milk',
-                'ingredients': '3 large eggplants, sliced|500g ground lamb|2 onions, chopped|400ml canned tomatoes|3 cloves garlic, minced|1 tsp cinnamon|1/2 cup red wine|For béchamel: 4 tbsp butter|4 tbsp flour|2 cups milk|100g cheese, grated|2 egg yolks|Olive oil|Salt and pepper',
-                'steps': 'Slice eggplants, salt and let drain 30 minutes|Brush with oil and grill until golden|Brown lamb with onions and garlic|Add tomatoes, wine, cinnamon, simmer 20 minutes|Make béchamel: melt butter, add flour, gradually add milk|Whisk until thick, add cheese and egg yolks|Layer eggplant, meat sauce, repeat|Top with béchamel sauce|Bake at 180°C for 45 minutes until golden|Let rest 10 minutes before serving'
-            },
-            {
-                'name': 'Ratatouille',
-                'country': 'France',
-                'origin': 'Provence, France',
-                'cuisine_type': 'French Traditional',
-                'description': 'Traditional vegetable stew from southern France',
-                'image': 'https://images.unsplash.com/photo-1576045057995-568f588f82fb?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in vitamins and antioxidants, high in fiber, low in calories, provides potassium',
-                'ingredients': '2 eggplants, cubed|4 zucchini, sliced|4 tomatoes, chopped|2 bell peppers, sliced|1 large onion, sliced|4 cloves garlic, minced|4 tbsp olive oil|2 tsp herbes de Provence|1 bay leaf|Salt and pepper|Fresh basil',
-                'steps': 'Heat olive oil in large heavy pot|Sauté onion until translucent|Add garlic and cook 1 minute|Add eggplant and cook for 5 minutes|Add bell peppers and zucchini|Add tomatoes, herbs, bay leaf|Season with salt and pepper|Simmer covered for 30 minutes|Stir occasionally until vegetables are tender|Remove bay leaf|Garnish with fresh basil|Serve as side dish or main with bread'
-            }
-        ]
-        
-        # Combine all African recipes
-        all_african_recipes = kenyan_recipes + other_african_recipes
-        
-        # Popular Asian recipes
-        asian_recipes = [
-            {
-                'name': 'Pad Thai',
-                'country': 'Thailand',
-                'origin': 'Thailand',
-                'cuisine_type': 'Thai Traditional',
-                'description': 'Stir-fried rice noodles with sweet, sour, and savory flavors',
-                'image': 'https://images.unsplash.com/photo-1559847844-d2104c53b694?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Good source of protein, contains vitamin E from peanuts, provides complex carbohydrates',
-                'ingredients': '400g rice noodles|200g shrimp or chicken|3 eggs|1 cup bean sprouts|3 cloves garlic, minced|3 tbsp fish sauce|2 tbsp tamarind paste|2 tbsp palm sugar|3 tbsp vegetable oil|1/4 cup peanuts, crushed|2 green onions, chopped|1 lime, cut in wedges|Chili flakes',
-                'steps': 'Soak rice noodles in warm water until soft|Heat oil in large wok or pan|Scramble eggs and set aside|Stir-fry garlic until fragrant|Add shrimp or chicken, cook until done|Add drained noodles and sauce ingredients|Toss everything together for 2-3 minutes|Add bean sprouts and scrambled eggs|Stir-fry for another minute|Garnish with peanuts, green onions, lime|Serve immediately while hot'
-            },
-            {
-                'name': 'Sushi',
-                'country': 'Japan',
-                'origin': 'Japan',
-                'cuisine_type': 'Japanese Traditional',
-                'description': 'Vinegared rice with fresh fish and vegetables',
-                'image': 'https://images.unsplash.com/photo-1579952363873-27d3bfaa0103?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in omega-3 fatty acids, low in calories, provides high-quality protein, contains iodine',
-                'ingredients': '2 cups sushi rice|3 cups water|1/4 cup rice vinegar|2 tbsp sugar|1 tsp salt|200g sashimi-grade fish|Nori sheets|Wasabi|Pickled ginger|Soy sauce|1 cucumber|1 avocado',
-                'steps': 'Rinse rice until water runs clear|Cook rice with water in rice cooker|Mix vinegar, sugar, and salt|When rice is done, add vinegar mixture and cool|Cut fish into thin slices|Wet hands and form rice into oval shapes|Top with fish slice and small dab of wasabi|For maki: place nori on bamboo mat|Spread rice, add fillings, roll tightly|Cut with sharp wet knife|Serve with soy sauce, wasabi, and ginger'
-            },
-            {
-                'name': 'Butter Chicken',
-                'country': 'India',
-                'origin': 'North India (Delhi)',
-                'cuisine_type': 'Indian Traditional',
-                'description': 'Creamy tomato-based curry with tender chicken pieces',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, contains antioxidants from tomatoes and spices, provides healthy fats',
-                'ingredients': '1kg chicken, cubed|400ml canned tomatoes|200ml heavy cream|1 onion, chopped|4 cloves garlic, minced|2cm ginger, minced|2 tsp garam masala|1 tsp turmeric|1 tsp cumin|2 tbsp butter|2 tbsp oil|Salt to taste|Fresh coriander|Basmati rice for serving',
-                'steps': 'Marinate chicken with salt, turmeric for 30 minutes|Heat oil in large pan, brown chicken and set aside|Melt butter, sauté onions until golden|Add garlic and ginger, cook 2 minutes|Add tomatoes and spices, cook 10 minutes|Blend sauce until smooth if desired|Return to pan, add chicken|Simmer for 15 minutes|Add cream and simmer 5 minutes more|Garnish with coriander|Serve with basmati rice and naan'
-            },
-            {
-                'name': 'Fried Rice',
-                'country': 'China',
-                'origin': 'China',
-                'cuisine_type': 'Chinese Traditional',
-                'description': 'Wok-fried rice with vegetables, eggs, and choice of protein',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides complex carbohydrates, good source of protein from eggs, contains vitamins from vegetables',
-                'ingredients': '4 cups cooked jasmine rice (day-old)|3 eggs, beaten|200g cooked chicken or shrimp|1 cup mixed vegetables (peas, carrots, corn)|3 cloves garlic, minced|2 green onions, chopped|3 tbsp soy sauce|2 tbsp vegetable oil|1 tsp sesame oil|White pepper to taste',
-                'steps': 'Heat oil in large wok or pan over high heat|Scramble eggs and set aside|Add more oil if needed|Stir-fry garlic until fragrant|Add cooked protein and vegetables|Stir-fry for 2 minutes|Add cold rice, breaking up clumps|Stir-fry for 3-4 minutes|Add soy sauce and sesame oil|Return eggs to pan and mix|Garnish with green onions|Serve immediately while hot'
-            },
-            {
-                'name': 'Pho',
-                'country': 'Vietnam',
-                'origin': 'North Vietnam',
-                'cuisine_type': 'Vietnamese Traditional',
-                'description': 'Aromatic noodle soup with herbs, meat, and fragrant broth',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '180 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in protein and collagen, contains antioxidants from herbs, provides essential amino acids',
-                'ingredients': '400g rice noodles|1kg beef bones|500g beef brisket|1 onion, halved|5cm ginger|4 star anise|1 cinnamon stick|4 cloves|1 tbsp coriander seeds|Fish sauce to taste|Rock sugar|200g raw beef, thinly sliced|Bean sprouts|Thai basil|Cilantro|Lime wedges|Chili slices',
-                'steps': 'Char onion and ginger over open flame until blackened|Roast spices in dry pan until fragrant|Boil bones and brisket for 3 hours with aromatics|Strain broth and season with fish sauce and sugar|Cook rice noodles according to package directions|Slice raw beef paper-thin|Place noodles in bowls, top with raw beef|Ladle boiling broth over to cook beef|Serve with fresh herbs, bean sprouts, lime|Add chili and extra fish sauce to taste'
-            },
-            {
-                'name': 'Ramen',
-                'country': 'Japan',
-                'origin': 'Japan',
-                'cuisine_type': 'Japanese Traditional',
-                'description': 'Rich noodle soup with various toppings and flavorful broth',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '240 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, contains B vitamins, provides essential amino acids, rich in minerals',
-                'ingredients': '4 portions fresh ramen noodles|1kg pork bones|500g pork belly|4 eggs|2 onions|6 cloves garlic|5cm ginger|Miso paste|Soy sauce|Mirin|Green onions|Nori sheets|Bamboo shoots|Corn kernels',
-                'steps': 'Simmer pork bones for 4 hours to make rich broth|Cook pork belly until tender, slice thin|Soft-boil eggs for 6 minutes, marinate in soy sauce|Prepare toppings: slice green onions, corn, bamboo shoots|Cook ramen noodles according to package directions|Season broth with miso, soy sauce, and mirin|Place noodles in bowls|Ladle hot broth over noodles|Top with pork belly, egg, and vegetables|Garnish with nori and green onions'
-            },
-            {
-                'name': 'Biryani',
-                'country': 'India',
-                'origin': 'Indian Subcontinent',
-                'cuisine_type': 'Indian Traditional',
-                'description': 'Fragrant layered rice dish with spiced meat and aromatic spices',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, contains antioxidants from spices, provides complex carbohydrates',
-                'ingredients': '3 cups basmati rice|1kg mutton or chicken|1 cup yogurt|2 onions, sliced|6 cloves garlic|3cm ginger|4 green chilies|1 tsp turmeric|2 tsp red chili powder|1 tsp garam masala|Saffron soaked in milk|4 tbsp ghee|Fresh mint|Coriander|Salt to taste',
-                'steps': 'Marinate meat with yogurt and spices for 2 hours|Fry onions until golden and crispy|Cook rice 70% done with whole spices|Cook marinated meat until tender|Layer rice and meat in heavy pot|Sprinkle fried onions, herbs, saffron milk|Cover with foil, then lid|Cook on high heat 3 minutes, then low for 45 minutes|Let rest 10 minutes before opening|Gently mix and serve with raita and boiled eggs'
-            },
-            {
-                'name': 'Tom Yum Soup',
-                'country': 'Thailand',
-                'origin': 'Thailand',
-                'cuisine_type': 'Thai Traditional',
-                'description': 'Hot and sour soup with shrimp and aromatic herbs',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '25 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Hot',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Low in calories, rich in antioxidants, contains vitamin C, supports immune system',
-                'ingredients': '500g large shrimp|4 cups chicken stock|3 lemongrass stalks|4 kaffir lime leaves|3cm galangal, sliced|4 bird\'s eye chilies|200g mushrooms|3 tomatoes, quartered|3 tbsp fish sauce|2 tbsp lime juice|1 tbsp palm sugar|Fresh cilantro',
-                'steps': 'Bring stock to boil in large pot|Add lemongrass, galangal, lime leaves|Simmer for 10 minutes to infuse flavors|Add mushrooms and tomatoes|Cook for 5 minutes|Add shrimp and chilies|Cook until shrimp turn pink|Season with fish sauce, lime juice, sugar|Taste and adjust seasoning|Remove lemongrass before serving|Garnish with fresh cilantro|Serve hot with jasmine rice'
-            }
-        ]
-        
-        # Famous American recipes
-        american_recipes = [
-            {
-                'name': 'BBQ Ribs',
-                'country': 'USA',
-                'origin': 'Southern United States',
-                'cuisine_type': 'American BBQ',
-                'description': 'Slow-cooked pork ribs with smoky barbecue sauce',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '240 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and iron, provides B vitamins, contains zinc for immune support',
-                'ingredients': '2kg pork ribs|2 tbsp brown sugar|2 tbsp paprika|1 tbsp garlic powder|1 tbsp onion powder|1 tsp cayenne pepper|2 tsp salt|1 tsp black pepper|BBQ sauce|Apple cider vinegar|Liquid smoke (optional)',
-                'steps': 'Mix all dry spices to make rub|Coat ribs generously with spice rub|Let marinate for 2 hours or overnight|Preheat oven to 275°F (135°C)|Wrap ribs in foil with apple cider vinegar|Bake for 2.5 hours until tender|Remove foil and brush with BBQ sauce|Increase heat to 425°F (220°C)|Bake 15 minutes more until caramelized|Let rest 10 minutes before cutting|Serve with extra BBQ sauce and coleslaw'
-            },
-            {
-                'name': 'Tacos',
-                'country': 'Mexico',
-                'origin': 'Mexico',
-                'cuisine_type': 'Mexican Traditional',
-                'description': 'Soft or hard shell tortillas filled with seasoned meat and toppings',
-                'image': 'https://images.unsplash.com/photo-1565299624946-b28f40a0ca4b?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Good source of protein, contains fiber from beans, provides vitamins from vegetables',
-                'ingredients': '500g ground beef or chicken|12 corn tortillas|1 onion, diced|3 cloves garlic, minced|2 tsp chili powder|1 tsp cumin|1 tsp paprika|Salt and pepper|Lettuce, shredded|Tomatoes, diced|Cheese, grated|Sour cream|Salsa|Lime wedges',
-                'steps': 'Brown ground meat in large skillet|Add onions and garlic, cook until soft|Add spices and cook for 2 minutes|Season with salt and pepper|Warm tortillas in dry pan or microwave|Fill tortillas with meat mixture|Top with lettuce, tomatoes, cheese|Add sour cream and salsa|Serve with lime wedges|Offer hot sauce on the side'
-            },
-            {
-                'name': 'Hamburger',
-                'country': 'USA',
-                'origin': 'United States',
-                'cuisine_type': 'American Classic',
-                'description': 'Grilled beef patty served in a bun with classic toppings',
-                'image': 'https://images.unsplash.com/photo-1568901346375-23c9450c58cd?w=400&h=300&fit=crop',
-                'prep_time': '25 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides B vitamins, contains essential amino acids',
-                'ingredients': '600g ground beef (80/20)|4 hamburger buns|4 slices cheese|1 large tomato, sliced|1 onion, sliced|Lettuce leaves|Pickles|Ketchup|Mustard|Mayonnaise|Salt and pepper',
-                'steps': 'Form ground beef into 4 equal patties|Season both sides with salt and pepper|Heat grill or skillet to medium-high heat|Cook patties 4-5 minutes per side for medium|Add cheese in last minute of cooking|Toast buns lightly on grill|Assemble burgers: bottom bun, sauce, lettuce|Add patty with cheese, tomato, onion, pickles|Top with more sauce and top bun|Serve immediately with fries'
-            },
-            {
-                'name': 'Mac and Cheese',
-                'country': 'USA',
-                'origin': 'United States',
-                'cuisine_type': 'American Comfort Food',
-                'description': 'Creamy baked macaroni pasta with cheese sauce',
-                'image': 'https://images.unsplash.com/photo-1621996346565-e3dbc353d2e5?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Good source of calcium and protein, provides energy from pasta, contains vitamin A',
-                'ingredients': '400g elbow macaroni|3 cups sharp cheddar cheese, grated|1 cup milk|3 tbsp butter|3 tbsp flour|1/2 tsp mustard powder|1/4 tsp paprika|Salt and white pepper|1/2 cup breadcrumbs|Extra cheese for topping',
-                'steps': 'Preheat oven to 375°F (190°C)|Cook macaroni according to package directions|Melt butter in saucepan, whisk in flour|Gradually add milk, whisking constantly|Cook until thickened, about 5 minutes|Add mustard powder and seasonings|Remove from heat, stir in cheese until melted|Combine cheese sauce with cooked pasta|Transfer to greased baking dish|Top with breadcrumbs and extra cheese|Bake 25 minutes until golden and bubbly'
-            },
-            {
-                'name': 'Fried Chicken',
-                'country': 'USA',
-                'origin': 'Southern United States',
-                'cuisine_type': 'American Southern',
-                'description': 'Crispy seasoned fried chicken with golden crust',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, provides essential amino acids, contains B vitamins and selenium',
-                'ingredients': '1 whole chicken, cut into pieces|2 cups buttermilk|3 cups all-purpose flour|2 tbsp paprika|1 tbsp garlic powder|1 tbsp onion powder|2 tsp salt|1 tsp black pepper|1 tsp cayenne pepper|Vegetable oil for frying',
-                'steps': 'Marinate chicken in buttermilk for 2-4 hours|Mix flour with all spices in large bowl|Heat oil to 350°F (175°C) in heavy pot|Remove chicken from buttermilk, dredge in seasoned flour|Shake off excess flour|Fry chicken pieces in batches, don\'t overcrowd|Cook 12-15 minutes until golden and internal temp reaches 165°F|Drain on paper towels|Serve hot with mashed potatoes and gravy'
-            },
-            {
-                'name': 'Apple Pie',
-                'country': 'USA',
-                'origin': 'United States',
-                'cuisine_type': 'American Dessert',
-                'description': 'Classic American dessert with spiced apple filling in flaky crust',
-                'image': 'https://images.unsplash.com/photo-1621996346565-e3dbc353d2e5?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Contains fiber and vitamin C from apples, provides antioxidants, moderate calories',
-                'ingredients': '8 large apples, peeled and sliced|2 pie crusts|3/4 cup sugar|2 tbsp flour|1 tsp cinnamon|1/4 tsp nutmeg|1/4 tsp salt|2 tbsp butter|1 egg for wash|1 tbsp milk',
-                'steps': 'Preheat oven to 425°F (220°C)|Line pie dish with bottom crust|Mix sliced apples with sugar, flour, and spices|Fill crust with apple mixture|Dot with butter pieces|Cover with top crust and crimp edges|Cut vents in top crust|Brush with egg wash mixed with milk|Bake 45-50 minutes until golden|Cool before serving|Serve with vanilla ice cream'
-            }
-        ]
-        
-        # Korean recipes
-        korean_recipes = [
-            {
-                'name': 'Kimchi',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean Traditional',
-                'description': 'Fermented napa cabbage with chili peppers, garlic, and ginger',
-                'image': 'https://images.unsplash.com/photo-1610415946035-bad6d5b9dbb6?w=400&h=300&fit=crop',
-                'prep_time': '30 mins + 3 days fermentation',
-                'difficulty': 'Medium',
-                'spice_level': 'Hot',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in probiotics for gut health, high in vitamins A and C, contains antioxidants, supports immune system',
-                'ingredients': '1 large napa cabbage|1/4 cup sea salt|1 tbsp grated ginger|5 cloves garlic, minced|1 tsp sugar|3 tbsp fish sauce (or soy sauce for vegan)|1-5 tbsp Korean red pepper flakes (gochugaru)|4 scallions, chopped|1 daikon radish, julienned',
-                'steps': 'Cut cabbage into 2-inch pieces and salt generously|Let sit for 2 hours, then rinse and drain|Mix ginger, garlic, sugar, and fish sauce into paste|Add red pepper flakes to create gochujang-like mixture|Combine cabbage with paste, scallions, and radish|Mix thoroughly with clean hands|Pack into clean jar, leaving 1 inch headspace|Ferment at room temperature for 3-5 days|Taste daily and refrigerate when desired sourness is reached|Serve as banchan (side dish) with Korean meals'
-            },
-            {
-                'name': 'Bulgogi',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean BBQ',
-                'description': 'Marinated grilled beef with sweet and savory flavors',
-                'image': 'https://images.unsplash.com/photo-1548940740-204726a19be3?w=400&h=300&fit=crop',
-                'prep_time': '45 mins + marinating',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides B vitamins, contains antioxidants from garlic and ginger',
-                'ingredients': '1kg thinly sliced ribeye or sirloin|1/2 cup soy sauce|1/4 cup brown sugar|2 tbsp sesame oil|1 Asian pear, grated|1 onion, sliced|6 cloves garlic, minced|1 tbsp fresh ginger, minced|2 green onions, chopped|1 tbsp toasted sesame seeds|2 tsp black pepper',
-                'steps': 'Freeze beef for 30 minutes for easier slicing|Slice beef paper-thin against the grain|Mix soy sauce, brown sugar, sesame oil, and grated pear|Add garlic, ginger, and black pepper to marinade|Marinate beef for at least 30 minutes (or overnight)|Heat grill or large skillet over high heat|Cook beef in batches, don\'t overcrowd|Cook for 2-3 minutes until caramelized|Garnish with green onions and sesame seeds|Serve with steamed rice and kimchi'
-            },
-            {
-                'name': 'Bibimbap',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean Traditional',
-                'description': 'Mixed rice bowl with seasoned vegetables, meat, and fried egg',
-                'image': 'https://images.unsplash.com/photo-1498654896293-37aacf113fd9?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'Balanced nutrition from vegetables and protein, rich in vitamins and minerals, provides healthy fats',
-                'ingredients': '4 cups cooked short-grain rice|200g beef bulgogi|4 shiitake mushrooms, sliced|1 cup bean sprouts|1 carrot, julienned|1 cucumber, julienned|1 cup spinach|4 eggs|4 tbsp gochujang|2 tbsp sesame oil|Soy sauce|Garlic|Vegetable oil',
-                'steps': 'Prepare bulgogi beef and set aside|Blanch spinach, season with sesame oil and garlic|Sauté mushrooms with soy sauce|Blanch bean sprouts briefly|Salt cucumber and let drain, then rinse|Sauté carrot until tender-crisp|Fry eggs sunny-side up|Place rice in bowls|Arrange vegetables in sections on top of rice|Top with beef and fried egg|Serve with gochujang on the side|Mix everything together before eating'
-            },
-            {
-                'name': 'Korean Fried Chicken',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean Street Food',
-                'description': 'Extra crispy double-fried chicken with sweet and spicy glaze',
-                'image': 'https://images.unsplash.com/photo-1562967916-eb82221dfb92?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Hot',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, provides essential amino acids, contains antioxidants from garlic and ginger',
-                'ingredients': '1kg chicken wings or drumettes|1 cup potato starch|1/2 cup all-purpose flour|1 cup cold water|1 tsp salt|For sauce: 1/4 cup gochujang|3 tbsp soy sauce|3 tbsp honey|2 tbsp rice vinegar|4 cloves garlic, minced|1 tbsp ginger, minced|1 tbsp sesame oil|Oil for frying',
-                'steps': 'Mix potato starch, flour, and salt|Add cold water to make smooth batter|Let batter rest for 30 minutes|Heat oil to 325°F (160°C)|Dip chicken in batter and fry for 10 minutes|Remove and drain on rack|Meanwhile, mix all sauce ingredients|Heat oil to 375°F (190°C)|Fry chicken again for 5 minutes until golden|Toss hot chicken with sauce immediately|Garnish with sesame seeds and green onions|Serve immediately while crispy'
-            },
-            {
-                'name': 'Japchae',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean Traditional',
-                'description': 'Stir-fried sweet potato noodles with vegetables and beef',
-                'image': 'https://images.unsplash.com/photo-1553621042-f6e147245754?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Gluten-free noodles, rich in vegetables, provides protein from beef, contains antioxidants',
-                'ingredients': '200g sweet potato noodles (dangmyeon)|200g beef, thinly sliced|1 carrot, julienned|1 bell pepper, sliced|4 shiitake mushrooms, sliced|2 cups spinach|3 green onions, chopped|4 tbsp soy sauce|2 tbsp sugar|3 tbsp sesame oil|2 cloves garlic, minced|1 tbsp vegetable oil',
-                'steps': 'Soak noodles in warm water for 30 minutes until soft|Marinate beef with 1 tbsp soy sauce and garlic|Blanch spinach and squeeze out excess water|Stir-fry beef until cooked, set aside|Stir-fry each vegetable separately, seasoning lightly|Boil noodles for 6-7 minutes until tender|Drain noodles and rinse with cold water|Mix soy sauce, sugar, and sesame oil for sauce|Combine noodles with sauce and all ingredients|Toss everything together gently|Garnish with sesame seeds and serve at room temperature'
-            },
-            {
-                'name': 'Korean Corn Dog',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean Street Food',
-                'description': 'Hot dog coated in potato cubes and fried until golden',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides protein, contains carbohydrates for energy, fun comfort food option',
-                'ingredients': '6 hot dogs or mozzarella sticks|1 cup all-purpose flour|1/2 cup cornstarch|1 tsp baking powder|1 tsp salt|1 cup milk|1 egg|2 cups small potato cubes|Wooden skewers|Oil for frying|Ketchup and mustard for serving',
-                'steps': 'Insert wooden skewers into hot dogs|Mix flour, cornstarch, baking powder, and salt|Add milk and egg to make smooth batter|Dip hot dogs in batter, coating completely|Roll in potato cubes, pressing gently to adhere|Heat oil to 350°F (175°C)|Fry corn dogs for 3-4 minutes until golden|Turn occasionally for even browning|Drain on paper towels|Serve hot with ketchup and mustard|Best enjoyed immediately while crispy'
-            },
-            {
-                'name': 'Tteokbokki',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean Street Food',
-                'description': 'Chewy rice cakes in sweet and spicy sauce',
-                'image': 'https://images.unsplash.com/photo-1590736969955-71cc94901144?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Hot',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Provides quick energy from rice, contains antioxidants from chili, low in fat',
-                'ingredients': '500g cylindrical rice cakes|3 tbsp gochujang|1 tbsp soy sauce|1 tbsp sugar|2 cups water|2 green onions, chopped|1 tbsp vegetable oil|1 clove garlic, minced|Sesame seeds for garnish',
-                'steps': 'Soak rice cakes in warm water to soften|Mix gochujang, soy sauce, and sugar in small bowl|Heat oil in large pan over medium heat|Add garlic and cook for 30 seconds|Add sauce mixture and water|Bring to simmer and add rice cakes|Cook for 8-10 minutes until sauce thickens|Add green onions in last minute|Garnish with sesame seeds|Serve hot as a snack or light meal'
-            },
-            {
-                'name': 'Korean Fried Rice (Kimchi Bokkeumbap)',
-                'country': 'South Korea',
-                'origin': 'Korea',
-                'cuisine_type': 'Korean Home Cooking',
-                'description': 'Fried rice with kimchi, vegetables, and optional protein',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Contains probiotics from kimchi, provides protein and carbohydrates, rich in vitamins from vegetables',
-                'ingredients': '4 cups day-old cooked rice|1 cup aged kimchi, chopped|200g spam or bacon, diced|2 eggs|2 green onions, chopped|2 cloves garlic, minced|2 tbsp vegetable oil|1 tbsp sesame oil|1 tbsp soy sauce|Sesame seeds|Nori sheets, shredded',
-                'steps': 'Heat oil in large wok or skillet|Cook spam or bacon until crispy|Add garlic and cook for 1 minute|Add kimchi and stir-fry for 3 minutes|Add cold rice, breaking up clumps|Stir-fry for 5 minutes until heated through|Push rice to one side, scramble eggs|Mix eggs into rice|Add soy sauce and sesame oil|Garnish with green onions, sesame seeds, and nori|Serve hot as a main dish'
-            }
-        ]
-        
-        # Middle Eastern and other global recipes
-        global_recipes = [
-            {
-                'name': 'Hummus',
-                'country': 'Lebanon',
-                'origin': 'Middle East',
-                'cuisine_type': 'Middle Eastern Traditional',
-                'description': 'Creamy chickpea dip with tahini, lemon, and garlic',
-                'image': 'https://images.unsplash.com/photo-1571197119282-7c4fe7c2f9f5?w=400&h=300&fit=crop',
-                'prep_time': '15 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and fiber, contains healthy fats, rich in folate and magnesium',
-                'ingredients': '2 cups cooked chickpeas|1/4 cup tahini|3 cloves garlic, minced|Juice of 2 lemons|3 tbsp olive oil|1 tsp ground cumin|Salt to taste|Water as needed|Paprika for garnish|Pine nuts (optional)',
-                'steps': 'Drain and rinse chickpeas, reserve cooking liquid|Add chickpeas to food processor|Add tahini, garlic, lemon juice, and cumin|Process until smooth|With processor running, drizzle in olive oil|Add reserved liquid until desired consistency|Season with salt to taste|Transfer to serving plate|Drizzle with olive oil and sprinkle paprika|Serve with pita bread or vegetables'
-            },
-            {
-                'name': 'Kebabs',
-                'country': 'Turkey',
-                'origin': 'Middle East',
-                'cuisine_type': 'Turkish Traditional',
-                'description': 'Grilled seasoned meat skewers with herbs and spices',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and iron, provides essential amino acids, contains antioxidants from herbs',
-                'ingredients': '1kg lamb or beef, cubed|2 onions, grated|4 cloves garlic, minced|2cm ginger, minced|2 tsp ground cumin|2 tsp paprika|1 tsp cinnamon|1/4 cup fresh parsley, chopped|1/4 cup fresh mint, chopped|3 tbsp olive oil|Salt and pepper|Wooden skewers',
-                'steps': 'Soak wooden skewers in water for 30 minutes|Mix grated onions with meat in large bowl|Add garlic, ginger, and all spices|Add herbs and olive oil|Season with salt and pepper|Mix well and marinate for 2 hours|Thread meat onto skewers|Grill over medium-high heat for 12-15 minutes|Turn frequently for even cooking|Serve with rice, flatbread, and yogurt sauce'
-            },
-            {
-                'name': 'Falafel',
-                'country': 'Egypt',
-                'origin': 'Middle East',
-                'cuisine_type': 'Middle Eastern Traditional',
-                'description': 'Deep-fried chickpea balls with herbs and spices',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '30 mins + soaking',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and fiber, contains iron and folate, provides healthy plant proteins',
-                'ingredients': '2 cups dried chickpeas (soaked overnight)|1 onion, roughly chopped|4 cloves garlic|1/4 cup fresh parsley|1/4 cup fresh cilantro|2 tsp ground cumin|1 tsp ground coriander|1/2 tsp cayenne pepper|1 tsp salt|2 tbsp flour|Oil for frying',
-                'steps': 'Drain soaked chickpeas completely|Add chickpeas to food processor with onion and garlic|Pulse until coarsely ground, not smooth|Add herbs and spices|Pulse to combine|Add flour and mix|Let mixture rest 30 minutes|Form into small balls with wet hands|Heat oil to 350°F (175°C)|Fry falafel in batches until golden brown|Drain on paper towels|Serve in pita with tahini sauce and vegetables'
-            },
-            {
-                'name': 'Pizza Margherita',
-                'country': 'Italy',
-                'origin': 'Naples, Italy',
-                'cuisine_type': 'Italian Traditional',
-                'description': 'Classic Neapolitan pizza with tomato, mozzarella, and basil',
-                'image': 'https://images.unsplash.com/photo-1621996346565-e3dbc353d2e5?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides calcium from cheese, contains lycopene from tomatoes, includes antioxidants from basil',
-                'ingredients': 'For dough: 3 cups flour|1 tsp active dry yeast|1 tsp salt|1 tbsp olive oil|1 cup warm water|For topping: 1/2 cup tomato sauce|200g fresh mozzarella, sliced|Fresh basil leaves|Extra virgin olive oil|Salt and pepper',
-                'steps': 'Dissolve yeast in warm water for 5 minutes|Mix flour and salt in large bowl|Add yeast mixture and oil|Knead for 10 minutes until smooth|Let rise for 1 hour until doubled|Preheat oven to 475°F (245°C)|Roll dough into thin circle|Spread tomato sauce evenly|Add mozzarella slices|Bake for 12-15 minutes until golden|Add fresh basil leaves|Drizzle with olive oil before serving'
-            },
-            {
-                'name': 'Shawarma',
-                'country': 'Lebanon',
-                'origin': 'Middle East',
-                'cuisine_type': 'Middle Eastern Street Food',
-                'description': 'Marinated meat cooked on rotating spit, served in pita',
-                'image': 'https://images.unsplash.com/photo-1565299624946-b28f40a0ca4b?w=400&h=300&fit=crop',
-                'prep_time': '60 mins + marinating',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, contains antioxidants from spices, provides B vitamins',
-                'ingredients': '1kg lamb or chicken, thinly sliced|1/4 cup olive oil|4 cloves garlic, minced|2 tsp ground cumin|2 tsp paprika|1 tsp turmeric|1 tsp cinnamon|Juice of 2 lemons|Salt and pepper|Pita bread|Tahini sauce|Pickled vegetables|Fresh parsley',
-                'steps': 'Mix olive oil with garlic and all spices|Marinate meat in spice mixture for 4+ hours|Cook meat in hot skillet in batches|Cook until crispy edges form|Warm pita bread|Spread tahini sauce on pita|Fill with cooked meat|Add pickled vegetables and parsley|Roll tightly and serve immediately|Offer extra sauce on the side'
-            },
-            {
-                'name': 'Pierogies',
-                'country': 'Poland',
-                'origin': 'Eastern Europe',
-                'cuisine_type': 'Polish Traditional',
-                'description': 'Filled dumplings with potato, cheese, or meat filling',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Good source of carbohydrates, provides protein from cheese, contains potassium',
-                'ingredients': '3 cups flour|1 egg|1/2 cup sour cream|1/4 cup butter, melted|1 tsp salt|For filling: 4 potatoes, mashed|1 cup farmer\'s cheese|1 onion, diced|2 tbsp butter|Salt and pepper|Sour cream for serving',
-                'steps': 'Make dough with flour, egg, sour cream, melted butter, salt|Knead until smooth, let rest 30 minutes|Cook onions in butter until golden|Mix mashed potatoes with cheese and onions|Season filling with salt and pepper|Roll dough thin and cut into circles|Place filling in center of each circle|Fold and seal edges well|Boil in salted water until they float|Sauté in butter until golden|Serve with sour cream and fried onions'
-            },
-            {
-                'name': 'Butter Croissant',
-                'country': 'France',
-                'origin': 'France',
-                'cuisine_type': 'French Pastry',
-                'description': 'Flaky, buttery pastry with layers of dough and butter',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '8 hours (with rising)',
-                'difficulty': 'Hard',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides energy from carbohydrates, contains some protein, source of B vitamins',
-                'ingredients': '4 cups bread flour|1/4 cup sugar|2 tsp salt|1 packet active dry yeast|1 cup warm milk|250g unsalted butter, cold|1 egg for wash|1 tbsp milk for wash',
-                'steps': 'Dissolve yeast in warm milk with 1 tbsp sugar|Mix flour, remaining sugar, and salt|Add yeast mixture and knead 10 minutes|Let rise 1 hour|Roll butter into rectangle between parchment|Roll dough into rectangle twice the size of butter|Place butter on half of dough, fold over|Roll and fold 3 times, chilling between folds|Cut into triangles and shape into crescents|Let rise 2 hours|Brush with egg wash|Bake at 400°F for 15-20 minutes until golden'
-            }
-        ]
-        
-        # Brazilian recipes
-        brazilian_recipes = [
-            {
-                'name': 'Feijoada',
-                'country': 'Brazil',
-                'origin': 'Brazil',
-                'cuisine_type': 'Brazilian Traditional',
-                'description': 'Brazil\'s national dish - black bean stew with pork and beef',
-                'image': 'https://images.unsplash.com/photo-1586511925558-a4c6376fe65f?w=400&h=300&fit=crop',
-                'prep_time': '180 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and fiber, rich in iron, provides complex carbohydrates, contains antioxidants',
-                'ingredients': '2 cups dried black beans|500g pork shoulder, cubed|300g beef, cubed|200g Portuguese chorizo|200g bacon, diced|2 onions, chopped|6 cloves garlic, minced|2 bay leaves|1 orange, zested|Salt and pepper|For serving: white rice|Collard greens|Orange slices|Farofa (toasted cassava flour)',
-                'steps': 'Soak black beans overnight|Cook beans with bay leaves for 1 hour until tender|In large pot, brown bacon until crispy|Add pork and beef, brown on all sides|Add chorizo and cook for 5 minutes|Add onions and garlic, cook until soft|Add cooked beans with cooking liquid|Add orange zest and seasonings|Simmer for 45 minutes until meat is tender|Adjust seasoning with salt and pepper|Serve with white rice, sautéed collard greens|Garnish with orange slices and farofa'
-            },
-            {
-                'name': 'Brigadeiros',
-                'country': 'Brazil',
-                'origin': 'Brazil',
-                'cuisine_type': 'Brazilian Dessert',
-                'description': 'Rich chocolate truffles covered in chocolate sprinkles',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '30 mins + chilling',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Contains antioxidants from cocoa, provides quick energy, comfort food in moderation',
-                'ingredients': '1 can (14oz) sweetened condensed milk|3 tbsp unsweetened cocoa powder|2 tbsp butter|Pinch of salt|1 cup chocolate sprinkles (granulado)|Butter for hands',
-                'steps': 'Combine condensed milk, cocoa powder, and butter in saucepan|Cook over medium-low heat, stirring constantly|Stir for 8-10 minutes until mixture thickens|Mixture is ready when it pulls away from pan sides|Remove from heat and let cool completely|Butter hands and roll mixture into small balls|Roll each ball in chocolate sprinkles|Place in small paper cups|Chill for at least 1 hour before serving|Serve at room temperature for best flavor'
-            },
-            {
-                'name': 'Coxinha',
-                'country': 'Brazil',
-                'origin': 'Brazil',
-                'cuisine_type': 'Brazilian Street Food',
-                'description': 'Teardrop-shaped croquettes filled with shredded chicken',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'Good source of protein from chicken, provides carbohydrates, contains B vitamins',
-                'ingredients': '500g chicken breast|2 cups chicken stock|2 tbsp butter|2 cups all-purpose flour|2 eggs, beaten|2 cups breadcrumbs|1 onion, minced|2 cloves garlic, minced|Salt and pepper|Oil for frying|Fresh parsley',
-                'steps': 'Boil chicken in seasoned water until tender|Shred chicken finely and season|Sauté onion and garlic, mix with chicken|Bring stock to boil, add butter|Gradually add flour, stirring constantly|Cook until dough forms and pulls from sides|Let dough cool completely|Form dough around chicken filling into teardrop shapes|Dip in beaten eggs, then breadcrumbs|Deep fry until golden brown|Drain on paper towels|Serve hot as appetizer or snack'
-            },
-            {
-                'name': 'Moqueca',
-                'country': 'Brazil',
-                'origin': 'Bahia, Brazil',
-                'cuisine_type': 'Brazilian Coastal',
-                'description': 'Brazilian fish stew with coconut milk, dendê oil, and peppers',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '40 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in omega-3 fatty acids, rich in protein, contains healthy fats from coconut and dendê',
-                'ingredients': '1kg white fish fillets|400ml coconut milk|3 tbsp dendê oil (palm oil)|2 onions, sliced|1 red bell pepper, sliced|1 yellow bell pepper, sliced|4 tomatoes, chopped|4 cloves garlic, minced|2 limes, juiced|2 malagueta peppers (or jalapeños)|Fresh cilantro|Salt to taste',
-                'steps': 'Season fish with salt and lime juice|Let marinate for 15 minutes|Heat dendê oil in heavy pot or clay moquequeira|Sauté onions until translucent|Add garlic and cook for 1 minute|Add bell peppers and cook for 5 minutes|Add tomatoes and cook until soft|Add coconut milk and bring to gentle simmer|Add fish pieces and peppers|Cook for 10-12 minutes until fish is done|Garnish with fresh cilantro|Serve with white rice and farofa'
-            },
-            {
-                'name': 'Pão de Açúcar',
-                'country': 'Brazil',
-                'origin': 'Brazil',
-                'cuisine_type': 'Brazilian Dessert',
-                'description': 'Brazilian sugar bread, sweet and fluffy breakfast bread',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides energy from carbohydrates, contains protein from eggs and milk, source of B vitamins',
-                'ingredients': '4 cups bread flour|1/2 cup sugar|2 tsp active dry yeast|1 cup warm milk|2 eggs|4 tbsp butter, melted|1 tsp salt|1 tsp vanilla extract|Egg wash for brushing',
-                'steps': 'Dissolve yeast in warm milk with 1 tbsp sugar|Mix flour, remaining sugar, and salt in large bowl|Add yeast mixture, eggs, melted butter, and vanilla|Knead for 10 minutes until smooth and elastic|Place in greased bowl, let rise for 1 hour|Punch down and shape into small rolls|Place on baking sheets, let rise 45 minutes|Brush with egg wash|Bake at 375°F for 15-20 minutes until golden|Serve warm with butter and jam'
-            },
-            {
-                'name': 'Açaí Bowl',
-                'country': 'Brazil',
-                'origin': 'Amazon, Brazil',
-                'cuisine_type': 'Brazilian Healthy',
-                'description': 'Superfruit smoothie bowl topped with granola and fresh fruits',
-                'image': 'https://images.unsplash.com/photo-1571197119282-7c4fe7c2f9f5?w=400&h=300&fit=crop',
-                'prep_time': '15 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 1,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Extremely high in antioxidants, provides healthy fats, rich in fiber, supports heart health',
-                'ingredients': '2 packets frozen açaí purée|1 banana|1/2 cup blueberries|1/4 cup coconut milk|1 tbsp honey|For toppings: granola|sliced banana|strawberries|coconut flakes|chia seeds|nuts',
-                'steps': 'Partially thaw açaí packets for 5 minutes|Break into chunks and add to blender|Add banana, blueberries, and coconut milk|Blend until smooth and thick|Add honey to taste|Pour into serving bowls|Arrange toppings in sections on top|Serve immediately for best texture|Popular breakfast or post-workout meal'
-            }
-        ]
-        
-        # Vietnamese recipes (additional to existing Pho)
-        vietnamese_recipes = [
-            {
-                'name': 'Banh Mi',
-                'country': 'Vietnam',
-                'origin': 'Vietnam',
-                'cuisine_type': 'Vietnamese Street Food',
-                'description': 'Vietnamese baguette sandwich with pickled vegetables and meat',
-                'image': 'https://images.unsplash.com/photo-1565299624946-b28f40a0ca4b?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'Balanced nutrition, contains probiotics from pickled vegetables, provides protein and carbohydrates',
-                'ingredients': '4 small baguettes|300g pork belly or chicken|1 carrot, julienned|1 daikon radish, julienned|1/4 cup rice vinegar|2 tbsp sugar|1 tsp salt|Mayonnaise|Pâté (optional)|Cucumber slices|Fresh cilantro|Jalapeño slices|Soy sauce|Fish sauce',
-                'steps': 'Make quick pickles: combine carrot, daikon with vinegar, sugar, salt|Let sit for 30 minutes|Season and grill pork or chicken until cooked|Slice meat thinly|Slice baguettes lengthwise, remove some bread|Spread mayonnaise and pâté on bread|Layer with meat, pickled vegetables|Add cucumber, cilantro, and jalapeño|Season with soy sauce and fish sauce|Serve immediately while bread is crispy'
-            },
-            {
-                'name': 'Fresh Spring Rolls (Goi Cuon)',
-                'country': 'Vietnam',
-                'origin': 'Vietnam',
-                'cuisine_type': 'Vietnamese Traditional',
-                'description': 'Fresh rice paper rolls with herbs, vegetables, and shrimp',
-                'image': 'https://images.unsplash.com/photo-1559847844-d2104c53b694?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Low in calories, rich in fresh vegetables, provides protein, contains vitamins and minerals',
-                'ingredients': '12 rice paper rounds|200g cooked shrimp|100g rice vermicelli noodles|1 cup lettuce leaves|1 cup fresh mint|1 cup fresh cilantro|1 cucumber, julienned|1 carrot, julienned|For dipping sauce: 3 tbsp fish sauce|2 tbsp lime juice|2 tbsp sugar|1/4 cup water|1 chili, minced',
-                'steps': 'Cook rice noodles according to package directions, drain and cool|Prepare all vegetables and herbs|Mix dipping sauce ingredients until sugar dissolves|Soften rice paper in warm water for 10 seconds|Place on flat surface|Add lettuce, herbs, noodles, vegetables|Place shrimp on top|Roll tightly, folding in sides|Place seam-side down|Cover with damp towel until serving|Serve with dipping sauce'
-            },
-            {
-                'name': 'Bun Bo Hue',
-                'country': 'Vietnam',
-                'origin': 'Hue, Vietnam',
-                'cuisine_type': 'Vietnamese Traditional',
-                'description': 'Spicy beef noodle soup from the imperial city of Hue',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '240 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Hot',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Rich in protein and collagen, contains antioxidants from lemongrass, provides essential nutrients',
-                'ingredients': '400g thick rice noodles|1kg beef bones|500g pork bones|300g beef brisket|200g pork hock|3 lemongrass stalks|4 tbsp shrimp paste|3 tbsp chili oil|Fish sauce|Sugar|200g Vietnamese ham|Blood sausage (optional)|Bean sprouts|Banana flower|Fresh herbs',
-                'steps': 'Simmer beef and pork bones for 4 hours|Add brisket and pork hock, cook 2 hours more|Strain broth and season with shrimp paste|Add lemongrass and simmer 30 minutes|Cook noodles according to package directions|Slice meats thinly|Place noodles in bowls with meat|Ladle hot broth over noodles|Serve with chili oil, herbs, bean sprouts|Add banana flower and lime wedges'
-            },
-            {
-                'name': 'Vietnamese Coffee (Cà Phê Sữa Đá)',
-                'country': 'Vietnam',
-                'origin': 'Vietnam',
-                'cuisine_type': 'Vietnamese Beverage',
-                'description': 'Strong coffee with sweetened condensed milk served over ice',
-                'image': 'https://images.unsplash.com/photo-1571934811356-5cc061b6821f?w=400&h=300&fit=crop',
-                'prep_time': '10 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Contains antioxidants from coffee, provides energy from caffeine, calcium from condensed milk',
-                'ingredients': '3 tbsp Vietnamese ground coffee (dark roast)|2-3 tbsp sweetened condensed milk|Hot water|Ice cubes|Vietnamese coffee filter (phin)',
-                'steps': 'Place condensed milk in bottom of glass|Set up Vietnamese coffee filter (phin) on top|Add ground coffee to filter|Pour small amount of hot water to bloom coffee|Wait 30 seconds|Slowly add remaining hot water|Let coffee drip slowly (about 5 minutes)|Stir coffee and condensed milk together|Add ice cubes to serve cold|Can be served hot without ice'
-            }
-        ]
-        
-        # French recipes (additional to existing)
-        french_recipes = [
-            {
-                'name': 'Bouillabaisse',
-                'country': 'France',
-                'origin': 'Marseille, France',
-                'cuisine_type': 'French Traditional',
-                'description': 'Traditional Provençal fish stew with saffron and rouille',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in omega-3 fatty acids, rich in protein, contains antioxidants from saffron and tomatoes',
-                'ingredients': '1kg mixed fish (sea bass, red mullet, John Dory)|500g mussels|300g prawns|2 onions, chopped|4 tomatoes, chopped|4 cloves garlic, minced|1/4 cup olive oil|1 cup white wine|Pinch of saffron|2 bay leaves|Fresh thyme|Parsley|Orange zest|For rouille: mayonnaise|garlic|saffron|cayenne',
-                'steps': 'Clean and prepare all seafood|Heat olive oil in large pot|Sauté onions until translucent|Add garlic, cook for 1 minute|Add tomatoes, herbs, orange zest|Add wine and reduce slightly|Add firm fish first, cook 5 minutes|Add delicate fish and shellfish|Add saffron and simmer 10 minutes|Season with salt and pepper|Make rouille by mixing mayo with garlic, saffron, cayenne|Serve in bowls with crusty bread and rouille'
-            },
-            {
-                'name': 'French Onion Soup',
-                'country': 'France',
-                'origin': 'France',
-                'cuisine_type': 'French Traditional',
-                'description': 'Rich onion soup topped with cheese and bread',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '75 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Contains antioxidants from onions, provides calcium from cheese, supports immune system',
-                'ingredients': '6 large onions, thinly sliced|4 tbsp butter|2 tbsp olive oil|1 tsp sugar|1/2 cup dry white wine|6 cups beef stock|2 bay leaves|Fresh thyme|Salt and pepper|6 slices French bread|2 cups Gruyère cheese, grated',
-                'steps': 'Heat butter and oil in large heavy pot|Add onions and sugar|Cook slowly for 45 minutes until caramelized|Stir occasionally to prevent burning|Add wine and cook until evaporated|Add stock, bay leaves, and thyme|Simmer for 20 minutes|Season with salt and pepper|Preheat broiler|Ladle soup into oven-safe bowls|Top with bread slice and cheese|Broil until cheese is bubbly and golden|Serve immediately while hot'
-            },
-            {
-                'name': 'Crème Brûlée',
-                'country': 'France',
-                'origin': 'France',
-                'cuisine_type': 'French Dessert',
-                'description': 'Creamy vanilla custard with caramelized sugar top',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '4 hours (with chilling)',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Good source of calcium and protein, contains vitamins from cream and eggs',
-                'ingredients': '2 cups heavy cream|6 egg yolks|1/3 cup sugar (plus extra for topping)|1 tsp vanilla extract|Pinch of salt',
-                'steps': 'Preheat oven to 325°F (160°C)|Heat cream in saucepan until just simmering|Whisk egg yolks with sugar until pale|Slowly add hot cream to eggs, whisking constantly|Add vanilla and salt|Strain mixture through fine mesh|Pour into ramekins|Bake in water bath for 35-40 minutes|Custard should be set but still jiggly|Chill for at least 3 hours|Before serving, sprinkle sugar on top|Caramelize with kitchen torch|Serve immediately'
-            }
-        ]
-        
-        # Additional European Western dishes
-        more_european_recipes = [
-            {
-                'name': 'Bangers and Mash',
-                'country': 'United Kingdom',
-                'origin': 'England',
-                'cuisine_type': 'British Traditional',
-                'description': 'British sausages served with mashed potatoes and onion gravy',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '35 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, provides carbohydrates from potatoes, contains B vitamins',
-                'ingredients': '8 pork sausages|1kg potatoes, peeled|1/4 cup butter|1/4 cup milk|2 large onions, sliced|2 tbsp flour|2 cups beef stock|2 tbsp vegetable oil|Salt and pepper|Fresh thyme',
-                'steps': 'Boil potatoes until tender, about 20 minutes|Meanwhile, cook sausages in oil until browned all over|Remove sausages and keep warm|Add onions to same pan, cook until caramelized|Sprinkle flour over onions, cook 2 minutes|Gradually add stock, stirring constantly|Simmer until thickened|Mash potatoes with butter and milk|Season with salt and pepper|Serve sausages on mashed potatoes|Pour onion gravy over top|Garnish with fresh thyme'
-            },
-            {
-                'name': 'Shepherd\'s Pie',
-                'country': 'United Kingdom',
-                'origin': 'England/Ireland',
-                'cuisine_type': 'British Traditional',
-                'description': 'Ground lamb with vegetables topped with mashed potatoes',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, contains vitamins from vegetables, provides carbohydrates',
-                'ingredients': '1kg ground lamb|1kg potatoes|2 carrots, diced|1 cup peas|1 onion, diced|2 cloves garlic, minced|2 tbsp tomato paste|1 cup beef stock|2 tbsp Worcestershire sauce|2 tbsp flour|1/4 cup butter|1/4 cup milk|2 tbsp olive oil|Salt and pepper|Fresh rosemary',
-                'steps': 'Preheat oven to 400°F (200°C)|Boil and mash potatoes with butter and milk|Heat oil in large pan, brown lamb|Add onions, carrots, cook until soft|Add garlic, cook 1 minute|Stir in tomato paste and flour|Add stock and Worcestershire sauce|Add peas, simmer until thick|Season with salt, pepper, rosemary|Transfer to baking dish|Top with mashed potatoes|Bake 25 minutes until golden|Let rest 5 minutes before serving'
-            },
-            {
-                'name': 'Beef Wellington',
-                'country': 'United Kingdom',
-                'origin': 'England',
-                'cuisine_type': 'British Fine Dining',
-                'description': 'Beef tenderloin wrapped in puff pastry with mushroom duxelles',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Hard',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides B vitamins, contains antioxidants from mushrooms',
-                'ingredients': '1kg beef tenderloin|500g puff pastry|500g mushrooms, chopped|200g pâté|8 slices prosciutto|2 egg yolks|2 tbsp Dijon mustard|2 tbsp olive oil|2 shallots, minced|2 cloves garlic|1/4 cup brandy|Salt and pepper|Fresh thyme',
-                'steps': 'Season beef and sear in hot oil until browned|Brush with mustard and let cool|Cook mushrooms with shallots until moisture evaporates|Add garlic, thyme, brandy, cook until dry|Cool completely|Lay prosciutto on plastic wrap|Spread pâté over prosciutto|Add mushroom mixture|Wrap beef in prosciutto mixture|Chill 30 minutes|Roll pastry around beef|Brush with egg wash|Bake at 425°F for 25-30 minutes|Rest 10 minutes before slicing'
-            },
-            {
-                'name': 'Sauerbraten',
-                'country': 'Germany',
-                'origin': 'Rhine Valley, Germany',
-                'cuisine_type': 'German Traditional',
-                'description': 'German pot roast marinated in vinegar and wine with sweet-sour gravy',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '4 days + 3 hours cooking',
-                'difficulty': 'Hard',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides B vitamins, contains antioxidants from wine',
-                'ingredients': '2kg beef roast|2 cups red wine vinegar|1 cup red wine|2 onions, sliced|2 carrots, sliced|2 bay leaves|1 tsp peppercorns|4 cloves|1 tsp juniper berries|3 tbsp vegetable oil|3 tbsp flour|1/4 cup raisins|2 tbsp sugar|Gingersnap cookies for thickening',
-                'steps': 'Combine vinegar, wine, vegetables, and spices for marinade|Marinate beef for 3-4 days in refrigerator|Turn daily|Remove beef, strain and reserve marinade|Pat beef dry and brown in oil|Add strained vegetables and cook|Add 2 cups marinade and bring to boil|Cover and simmer 2.5 hours until tender|Remove beef and strain liquid|Make gravy with flour, add raisins and sugar|Thicken with crushed gingersnaps|Slice beef and serve with gravy and red cabbage'
-            },
-            {
-                'name': 'Schnitzel',
-                'country': 'Germany',
-                'origin': 'Austria/Germany',
-                'cuisine_type': 'German Traditional',
-                'description': 'Breaded and fried meat cutlet served with lemon',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, provides essential amino acids, source of B vitamins and iron',
-                'ingredients': '4 pork or chicken cutlets|2 cups fine breadcrumbs|2 eggs, beaten|1/2 cup flour|Vegetable oil for frying|Salt and pepper|Lemon wedges|Fresh parsley|Potato salad for serving',
-                'steps': 'Pound cutlets until very thin|Season with salt and pepper|Set up breading station: flour, beaten eggs, breadcrumbs|Dredge cutlets in flour, then egg, then breadcrumbs|Press coating to adhere well|Heat oil in large skillet|Fry schnitzels 2-3 minutes per side until golden|Drain on paper towels|Serve immediately with lemon wedges|Traditionally served with potato salad and lingonberry sauce|Garnish with fresh parsley'
-            },
-            {
-                'name': 'Beef Stroganoff',
-                'country': 'Russia',
-                'origin': 'Russia',
-                'cuisine_type': 'Russian Traditional',
-                'description': 'Tender beef in creamy mushroom and sour cream sauce',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides B vitamins, contains antioxidants from mushrooms',
-                'ingredients': '1kg beef sirloin, sliced thin|500g mushrooms, sliced|1 onion, chopped|3 cloves garlic, minced|1 cup sour cream|1 cup beef stock|3 tbsp flour|3 tbsp butter|2 tbsp vegetable oil|2 tbsp Dijon mustard|Salt and pepper|Fresh dill|Egg noodles for serving',
-                'steps': 'Season beef strips with salt and pepper|Heat oil in large skillet, brown beef in batches|Remove beef and set aside|Add butter to pan, sauté mushrooms until golden|Add onions and garlic, cook until soft|Sprinkle flour over vegetables, cook 2 minutes|Gradually add stock, stirring constantly|Add mustard and simmer until thickened|Return beef to pan|Stir in sour cream and heat through|Garnish with fresh dill|Serve over egg noodles'
-            },
-            {
-                'name': 'Swedish Meatballs',
-                'country': 'Sweden',
-                'origin': 'Scandinavia',
-                'cuisine_type': 'Scandinavian Traditional',
-                'description': 'Tender meatballs in cream sauce, served with lingonberry jam',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, provides iron and B vitamins, contains calcium from cream',
-                'ingredients': '500g ground beef|250g ground pork|1 onion, finely minced|1/2 cup breadcrumbs|1/4 cup milk|1 egg|1/2 tsp allspice|1/4 tsp nutmeg|Salt and pepper|2 tbsp butter|2 tbsp flour|2 cups beef stock|1/2 cup heavy cream|Lingonberry jam',
-                'steps': 'Soak breadcrumbs in milk|Mix ground meats with onion, egg, soaked breadcrumbs|Season with allspice, nutmeg, salt, pepper|Form into small meatballs|Brown meatballs in butter in large skillet|Remove meatballs, add flour to pan|Cook flour for 2 minutes|Gradually add stock, whisking constantly|Return meatballs to pan|Simmer 15 minutes until cooked through|Stir in cream|Serve with boiled potatoes and lingonberry jam'
-            },
-            {
-                'name': 'Dutch Pancakes (Pannenkoeken)',
-                'country': 'Netherlands',
-                'origin': 'Netherlands',
-                'cuisine_type': 'Dutch Traditional',
-                'description': 'Large thin pancakes served sweet or savory',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides energy from carbohydrates, contains protein from eggs, source of calcium',
-                'ingredients': '2 cups all-purpose flour|3 eggs|2 cups milk|1/2 tsp salt|2 tbsp melted butter|Butter for cooking|Toppings: powdered sugar|syrup|bacon|cheese|apples|jam',
-                'steps': 'Whisk flour and salt in large bowl|Beat eggs with milk|Gradually add milk mixture to flour|Whisk until smooth batter forms|Stir in melted butter|Let batter rest 30 minutes|Heat large skillet or crepe pan|Add butter and pour in batter to cover pan|Cook until golden brown, flip once|Add desired toppings while still in pan|Fold or roll pancake|Serve immediately while hot'
-            },
-            {
-                'name': 'Spanish Tortilla',
-                'country': 'Spain',
-                'origin': 'Spain',
-                'cuisine_type': 'Spanish Traditional',
-                'description': 'Thick potato omelet, a Spanish classic served hot or cold',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein from eggs, provides potassium from potatoes, contains healthy fats',
-                'ingredients': '6 large potatoes, thinly sliced|6 large eggs|1 large onion, thinly sliced|1 cup olive oil|Salt to taste|Fresh parsley for garnish',
-                'steps': 'Heat olive oil in large skillet|Add sliced potatoes and onions|Cook slowly for 20 minutes until tender, not browned|Drain potatoes and onions, reserve oil|Beat eggs in large bowl|Add warm potatoes and onions to eggs|Season with salt and mix gently|Heat 2 tbsp reserved oil in same skillet|Pour in egg mixture and cook 8-10 minutes|Flip carefully using large plate|Cook 5 minutes more until set|Serve warm or at room temperature|Cut into wedges like a pie'
-            },
-            {
-                'name': 'Goulash',
-                'country': 'Hungary',
-                'origin': 'Hungary',
-                'cuisine_type': 'Hungarian Traditional',
-                'description': 'Hearty beef stew with paprika, vegetables, and potatoes',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '120 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein and iron, rich in vitamin C from peppers, contains antioxidants from paprika',
-                'ingredients': '1kg beef chuck, cubed|3 large onions, chopped|3 tbsp Hungarian paprika|2 red bell peppers, chopped|3 tomatoes, chopped|4 potatoes, cubed|3 cloves garlic, minced|2 tbsp tomato paste|3 cups beef stock|2 tbsp vegetable oil|1 tsp caraway seeds|Salt and pepper|Sour cream for serving',
-                'steps': 'Heat oil in large heavy pot|Brown beef cubes in batches|Remove beef and sauté onions until golden|Add paprika and cook for 1 minute|Return beef to pot|Add tomato paste, garlic, caraway seeds|Add chopped tomatoes and bell peppers|Pour in stock to cover|Bring to boil, then simmer covered 1 hour|Add potatoes and cook 30 minutes more|Season with salt and pepper|Serve hot with sour cream and crusty bread'
-            }
-        ]
-        
-        # More American regional dishes
-        more_american_recipes = [
-            {
-                'name': 'New England Clam Chowder',
-                'country': 'USA',
-                'origin': 'New England, USA',
-                'cuisine_type': 'American Regional',
-                'description': 'Creamy white soup with clams, potatoes, and bacon',
-                'image': 'https://images.unsplash.com/photo-1559847844-5315695dadae?w=400&h=300&fit=crop',
-                'prep_time': '45 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein from clams, provides iodine, contains calcium from cream',
-                'ingredients': '2 cans chopped clams with juice|6 slices bacon, diced|1 onion, diced|2 celery stalks, diced|3 potatoes, cubed|3 tbsp flour|2 cups milk|1 cup heavy cream|2 bay leaves|1 tsp thyme|Salt and pepper|Oyster crackers',
-                'steps': 'Cook bacon in large pot until crispy|Remove bacon, leave fat in pot|Sauté onion and celery until soft|Add flour and cook 2 minutes|Gradually add clam juice, stirring constantly|Add potatoes, bay leaves, thyme|Simmer until potatoes are tender|Add clams, milk, and cream|Heat through but don\'t boil|Season with salt and pepper|Remove bay leaves|Serve hot with oyster crackers and crispy bacon'
-            },
-            {
-                'name': 'Jambalaya',
-                'country': 'USA',
-                'origin': 'Louisiana, USA',
-                'cuisine_type': 'American Creole',
-                'description': 'Louisiana rice dish with sausage, shrimp, and the holy trinity',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'Medium',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, provides complex carbohydrates, contains antioxidants from vegetables and spices',
-                'ingredients': '2 cups long-grain rice|500g andouille sausage, sliced|500g large shrimp|1 onion, diced|1 bell pepper, diced|2 celery stalks, diced|4 cloves garlic, minced|400g canned tomatoes|3 cups chicken stock|2 bay leaves|1 tsp paprika|1/2 tsp cayenne|1/4 tsp thyme|3 tbsp vegetable oil|Salt and pepper|Green onions',
-                'steps': 'Cook sausage in large heavy pot until browned|Remove sausage, cook shrimp until pink|Remove shrimp, add vegetables to pot|Cook until soft, about 8 minutes|Add garlic and spices, cook 1 minute|Add tomatoes and cook 5 minutes|Add rice and stir to coat|Add stock and bring to boil|Return sausage to pot|Cover and simmer 18 minutes|Add shrimp in last 5 minutes|Remove bay leaves|Garnish with green onions'
-            },
-            {
-                'name': 'Philly Cheesesteak',
-                'country': 'USA',
-                'origin': 'Philadelphia, USA',
-                'cuisine_type': 'American Regional',
-                'description': 'Sliced beef and cheese on a hoagie roll, Philadelphia\'s signature sandwich',
-                'image': 'https://images.unsplash.com/photo-1565299624946-b28f40a0ca4b?w=400&h=300&fit=crop',
-                'prep_time': '20 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides calcium from cheese, contains B vitamins',
-                'ingredients': '1kg ribeye steak, thinly sliced|4 hoagie rolls|8 slices provolone or Cheez Whiz|2 onions, sliced|1 bell pepper, sliced|3 tbsp vegetable oil|Salt and pepper',
-                'steps': 'Freeze steak for 30 minutes for easier slicing|Slice steak paper-thin against grain|Heat oil in large skillet over high heat|Cook onions and peppers until caramelized|Remove vegetables, add beef to pan|Cook quickly, stirring constantly for 2-3 minutes|Season with salt and pepper|Return vegetables to pan and mix|Split rolls and warm them|Fill rolls with meat mixture|Top with cheese while hot|Serve immediately while cheese is melted'
-            },
-            {
-                'name': 'Buffalo Wings',
-                'country': 'USA',
-                'origin': 'Buffalo, New York',
-                'cuisine_type': 'American Bar Food',
-                'description': 'Spicy chicken wings with hot sauce and butter, served with blue cheese',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Hot',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in protein, provides B vitamins, contains capsaicin which may boost metabolism',
-                'ingredients': '2kg chicken wings|1/2 cup hot sauce (Frank\'s RedHot)|1/4 cup butter|1 tbsp white vinegar|1/4 tsp garlic powder|Salt to taste|For blue cheese dip: 1/2 cup blue cheese|1/2 cup sour cream|1/4 cup mayonnaise|2 tbsp milk|Celery sticks',
-                'steps': 'Preheat oven to 425°F (220°C)|Pat wings dry and season with salt|Arrange on wire rack over baking sheet|Bake 45 minutes until crispy|Meanwhile, melt butter in small saucepan|Whisk in hot sauce, vinegar, garlic powder|Make blue cheese dip by mixing all ingredients|Toss hot wings with sauce|Serve immediately with celery sticks and blue cheese dip|Provide extra napkins'
-            },
-            {
-                'name': 'Fish Tacos',
-                'country': 'USA',
-                'origin': 'California, USA',
-                'cuisine_type': 'Californian Mexican',
-                'description': 'Grilled fish in soft tortillas with cabbage slaw and lime crema',
-                'image': 'https://images.unsplash.com/photo-1565299624946-b28f40a0ca4b?w=400&h=300&fit=crop',
-                'prep_time': '30 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'Mild',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'High in omega-3 fatty acids, contains fiber from cabbage, provides vitamin C',
-                'ingredients': '600g white fish fillets|8 corn tortillas|2 cups cabbage, shredded|1/4 cup mayonnaise|1/4 cup sour cream|2 limes, juiced|1 tsp cumin|1 tsp chili powder|1/2 tsp paprika|Salt and pepper|Fresh cilantro|Avocado slices|Pico de gallo',
-                'steps': 'Season fish with cumin, chili powder, paprika, salt, pepper|Grill fish for 4-5 minutes per side until flaky|Make lime crema by mixing mayo, sour cream, lime juice|Season crema with salt|Warm tortillas in dry pan|Flake fish into bite-sized pieces|Assemble tacos: tortilla, fish, cabbage|Top with lime crema, cilantro, avocado|Serve with pico de gallo and lime wedges|Best served immediately while warm'
-            }
-        ]
-        
-        # Canadian and Australian dishes
-        anglo_western_recipes = [
-            {
-                'name': 'Poutine',
-                'country': 'Canada',
-                'origin': 'Quebec, Canada',
-                'cuisine_type': 'Canadian Traditional',
-                'description': 'French fries topped with cheese curds and gravy',
-                'image': 'https://images.unsplash.com/photo-1601050690597-df0568f70950?w=400&h=300&fit=crop',
-                'prep_time': '40 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 0,
-                'health_benefits': 'Provides energy from potatoes, contains calcium from cheese curds, comfort food in moderation',
-                'ingredients': '1kg large potatoes|2 cups cheese curds|3 tbsp butter|3 tbsp flour|2 cups beef stock|1 tbsp soy sauce|Salt and pepper|Vegetable oil for frying',
-                'steps': 'Cut potatoes into thick fries|Soak in cold water for 30 minutes|Make gravy: melt butter, whisk in flour|Gradually add stock, whisking constantly|Add soy sauce and simmer until thick|Season with salt and pepper|Heat oil to 350°F (175°C)|Fry chips twice: first at 325°F for 5 mins|Then at 375°F for 2-3 mins until golden|Drain and season with salt|Top hot fries with cheese curds|Pour hot gravy over top|Serve immediately while cheese melts'
-            },
-            {
-                'name': 'Tourtière',
-                'country': 'Canada',
-                'origin': 'Quebec, Canada',
-                'cuisine_type': 'Canadian Traditional',
-                'description': 'Traditional French-Canadian meat pie, especially popular at Christmas',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '90 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein, provides iron and B vitamins, contains healthy fats from pastry',
-                'ingredients': '2 pie crusts|500g ground pork|250g ground beef|1 onion, minced|2 cloves garlic, minced|1 tsp sage|1/2 tsp thyme|1/4 tsp cloves|1/4 tsp cinnamon|1/2 cup chicken stock|Salt and pepper|1 egg for wash',
-                'steps': 'Cook ground meats in large skillet until browned|Add onion and garlic, cook until soft|Add spices and cook 2 minutes|Add stock and simmer until liquid evaporates|Season with salt and pepper|Cool completely|Line pie dish with bottom crust|Fill with meat mixture|Cover with top crust and crimp edges|Cut vents in top|Brush with beaten egg|Bake at 425°F for 15 minutes|Reduce to 350°F and bake 30 minutes more|Cool 10 minutes before serving'
-            },
-            {
-                'name': 'Meat Pie',
-                'country': 'Australia',
-                'origin': 'Australia',
-                'cuisine_type': 'Australian Traditional',
-                'description': 'Individual pastry filled with seasoned ground meat and gravy',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '60 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and iron, provides energy from pastry, contains B vitamins',
-                'ingredients': '500g ground beef|1 onion, diced|2 cloves garlic, minced|2 tbsp tomato paste|1 tbsp Worcestershire sauce|1 cup beef stock|2 tbsp flour|2 tbsp vegetable oil|Salt and pepper|6 individual pie tins|2 sheets puff pastry|1 sheet shortcrust pastry|1 egg for wash',
-                'steps': 'Heat oil in large pan, brown ground beef|Add onion and garlic, cook until soft|Stir in tomato paste and cook 2 minutes|Add Worcestershire sauce and flour|Gradually add stock, stirring constantly|Simmer until thickened|Season and cool completely|Line pie tins with shortcrust pastry|Fill with meat mixture|Top with puff pastry and crimp edges|Cut small vents in top|Brush with beaten egg|Bake at 400°F for 25 minutes until golden|Serve hot with tomato sauce'
-            },
-            {
-                'name': 'Pavlova',
-                'country': 'Australia',
-                'origin': 'Australia/New Zealand',
-                'cuisine_type': 'Australian Dessert',
-                'description': 'Meringue cake topped with cream and fresh fruits',
-                'image': 'https://images.unsplash.com/photo-1549007994-cb92caebd54b?w=400&h=300&fit=crop',
-                'prep_time': '3 hours (with cooling)',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Contains vitamin C from fruits, provides calcium from cream, naturally gluten-free',
-                'ingredients': '6 egg whites|1 1/2 cups superfine sugar|1 tsp vanilla extract|1 tsp white vinegar|2 tsp cornstarch|2 cups heavy cream|2 tbsp powdered sugar|Mixed fresh fruits: strawberries|kiwi|passionfruit|mango',
-                'steps': 'Preheat oven to 300°F (150°C)|Beat egg whites until soft peaks form|Gradually add sugar, beating until stiff peaks form|Fold in vanilla, vinegar, and cornstarch|Spoon onto parchment-lined baking sheet|Shape into circle with shallow well|Bake 1 hour 15 minutes|Turn off oven, cool in oven with door ajar|Whip cream with powdered sugar|Top meringue with cream and fresh fruits|Serve immediately after assembling'
-            },
-            {
-                'name': 'Maple Glazed Salmon',
-                'country': 'Canada',
-                'origin': 'Canada',
-                'cuisine_type': 'Canadian Modern',
-                'description': 'Fresh salmon with sweet maple syrup glaze and herbs',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '25 mins',
-                'difficulty': 'Easy',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 1,
-                'health_benefits': 'Very high in omega-3 fatty acids, excellent source of protein, contains antioxidants',
-                'ingredients': '4 salmon fillets|1/4 cup pure maple syrup|2 tbsp soy sauce|2 tbsp olive oil|2 cloves garlic, minced|1 tbsp fresh ginger, minced|1 tbsp Dijon mustard|Salt and pepper|Fresh dill|Lemon wedges',
-                'steps': 'Preheat oven to 400°F (200°C)|Mix maple syrup, soy sauce, garlic, ginger, mustard|Season salmon with salt and pepper|Heat oil in oven-safe skillet|Sear salmon skin-side up for 3 minutes|Flip and brush with maple glaze|Transfer to oven for 8-10 minutes|Baste with glaze once more|Remove when fish flakes easily|Garnish with fresh dill|Serve with roasted vegetables and lemon wedges'
-            }
-        ]
-        
-        # Additional Italian classics
-        more_italian_recipes = [
-            {
-                'name': 'Risotto',
-                'country': 'Italy',
-                'origin': 'Northern Italy',
-                'cuisine_type': 'Italian Traditional',
-                'description': 'Creamy rice dish cooked slowly with stock and finished with cheese',
-                'image': 'https://images.unsplash.com/photo-1563379091339-03246963d51a?w=400&h=300&fit=crop',
-                'prep_time': '40 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 1,
-                'is_gluten_free': 1,
-                'health_benefits': 'Provides complex carbohydrates, contains calcium from cheese, source of B vitamins',
-                'ingredients': '2 cups Arborio rice|6 cups warm chicken stock|1 onion, finely diced|1/2 cup white wine|1/2 cup Parmesan cheese, grated|3 tbsp butter|2 tbsp olive oil|Salt and pepper|Fresh parsley',
-                'steps': 'Heat stock in separate saucepan and keep warm|Heat oil in large heavy pan|Sauté onion until translucent|Add rice and stir for 2 minutes until coated|Add wine and stir until absorbed|Add warm stock one ladle at a time|Stir constantly, adding more stock as absorbed|Continue for 18-20 minutes until rice is creamy|Stir in butter and Parmesan|Season with salt and pepper|Garnish with parsley and serve immediately'
-            },
-            {
-                'name': 'Osso Buco',
-                'country': 'Italy',
-                'origin': 'Milan, Italy',
-                'cuisine_type': 'Italian Traditional',
-                'description': 'Braised veal shanks with vegetables, white wine, and broth',
-                'image': 'https://images.unsplash.com/photo-1544025162-d76694265947?w=400&h=300&fit=crop',
-                'prep_time': '150 mins',
-                'difficulty': 'Medium',
-                'spice_level': 'None',
-                'is_vegan': 0,
-                'is_vegetarian': 0,
-                'is_gluten_free': 0,
-                'health_benefits': 'High in protein and collagen, rich in iron, provides B vitamins and minerals',
-                'ingredients': '4 veal shanks, thick cut|1/2 cup flour|1 onion, diced|1 carrot, diced|1 celery stalk, diced|3 cloves garlic, minced|1 cup white wine|2 cups beef stock|400g canned tomatoes|2 bay leaves|Fresh thyme|4 tbsp olive oil|Salt and pepper|Gremolata: lemon zest|garlic|parsley',
-                'steps': 'Season veal shanks and dredge in flour|Heat oil in heavy Dutch oven|Brown shanks on all sides|Remove shanks and sauté vegetables until soft|Add garlic and cook 1 minute|Add wine and cook until reduced by half|Return shanks to pot|Add tomatoes, stock, herbs|Bring to simmer, cover and braise 1.5 hours|Turn shanks halfway through|Make gremolata by mixing lemon zest, minced garlic, parsley|Serve shanks with sauce|Garnish with gremolata|Traditionally served with risotto alla milanese'
-            }
-        ]
-        
-        # Combine all recipes including new Western dishes
-        all_recipes = (all_african_recipes + european_recipes + asian_recipes + american_recipes + 
-                      global_recipes + korean_recipes + brazilian_recipes + vietnamese_recipes + 
-                      french_recipes + more_european_recipes + more_american_recipes + 
-                      anglo_western_recipes + more_italian_recipes)
-        
-        for recipe in all_recipes:
-            conn.execute('''
-                INSERT INTO recipes (name, country, origin, cuisine_type, description, image, prep_time, difficulty, spice_level, is_vegan, is_vegetarian, is_gluten_free, health_benefits, ingredients, steps)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (recipe['name'], recipe['country'], recipe['origin'], recipe['cuisine_type'], recipe['description'], recipe['image'], 
-                  recipe['prep_time'], recipe['difficulty'], recipe['spice_level'], recipe['is_vegan'], recipe['is_vegetarian'], 
-                  recipe['is_gluten_free'], recipe['health_benefits'], recipe['ingredients'], recipe['steps']))
+    # One-time backfill from the existing ratings
+    conn.execute('DELETE FROM recipe_rating_stats')
+    conn.execute('''
+        INSERT INTO recipe_rating_stats
+        SELECT recipe_id, recipe_type, COUNT(*), SUM(rating),
+               SUM(rating = 1), SUM(rating = 2), SUM(rating = 3), SUM(rating = 4), SUM(rating = 5)
+        FROM recipe_ratings
+        GROUP BY recipe_id, recipe_type
+    ''')
+    
+    # Keep the aggregates in step with every write, inside the writer's transaction
+    add_new = '''
+        INSERT INTO recipe_rating_stats (recipe_id, recipe_type) VALUES (new.recipe_id, new.recipe_type)
+            ON CONFLICT DO NOTHING;
+        UPDATE recipe_rating_stats SET
+            rating_count = rating_count + 1,
+            rating_sum = rating_sum + new.rating,
+            stars_1 = stars_1 + (new.rating = 1),
+            stars_2 = stars_2 + (new.rating = 2),
+            stars_3 = stars_3 + (new.rating = 3),
+            stars_4 = stars_4 + (new.rating = 4),
+            stars_5 = stars_5 + (new.rating = 5)
+        WHERE recipe_id = new.recipe_id AND recipe_type = new.recipe_type;
+    '''
+    remove_old = '''
+        UPDATE recipe_rating_stats SET
+            rating_count = rating_count - 1,
+            rating_sum = rating_sum - old.rating,
+            stars_1 = stars_1 - (old.rating = 1),
+            stars_2 = stars_2 - (old.rating = 2),
+            stars_3 = stars_3 - (old.rating = 3),
+            stars_4 = stars_4 - (old.rating = 4),
+            stars_5 = stars_5 - (old.rating = 5)
+        WHERE recipe_id = old.recipe_id AND recipe_type = old.recipe_type;
+    '''
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS recipe_ratings_stats_insert AFTER INSERT ON recipe_ratings BEGIN
+            {add_new}
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS recipe_ratings_stats_update
+        AFTER UPDATE OF recipe_id, recipe_type, rating ON recipe_ratings BEGIN
+            {remove_old}
+            {add_new}
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS recipe_ratings_stats_delete AFTER DELETE ON recipe_ratings BEGIN
+            {remove_old}
+        END
+    ''')
+
+def migrate_007_user_ratings_index(conn):
+    """Covering index for looking up all of one user's ratings"""
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_recipe_ratings_user
+        ON recipe_ratings (user_id, recipe_type, recipe_id, rating)
+    ''')
+
+USER_OAUTH_COLUMNS = (
+    ('oauth_provider', 'TEXT DEFAULT NULL'),
+    ('oauth_id', 'TEXT DEFAULT NULL'),
+    ('avatar_url', 'TEXT DEFAULT NULL'),
+)
+
+def migrate_008_user_oauth_lookup(conn):
+    """OAuth columns on pre-OAuth users tables, nullable password_hash, and a provider lookup index"""
+    columns = {row[1]: row for row in conn.execute('PRAGMA table_info(users)')}
+    if columns['password_hash'][3]:
+        # SQLite cannot drop NOT NULL in place, so rebuild the table; OAuth-only
+        # accounts have no password. The legacy rename leaves the recipe_ratings
+        # foreign key naming "users", which the rebuilt table takes over
+        legacy = list(columns)
+        conn.execute('PRAGMA legacy_alter_table = ON')
+        conn.execute('ALTER TABLE users RENAME TO users_legacy')
+        conn.execute('PRAGMA legacy_alter_table = OFF')
+        conn.execute(USERS_TABLE_V1)
+        conn.execute(f'''
+            INSERT INTO users ({', '.join(legacy)})
+            SELECT {', '.join(legacy)} FROM users_legacy
+        ''')
+        conn.execute('DROP TABLE users_legacy')
+    else:
+        for column, declaration in USER_OAUTH_COLUMNS:
+            if column not in columns:
+                conn.execute(f'ALTER TABLE users ADD COLUMN {column} {declaration}')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_oauth
+        ON users (oauth_provider, oauth_id)
+    ''')
+
+def migrate_009_recipe_child_tables(conn):
+    """Ingredients and steps moved from pipe-delimited columns into ordered child tables"""
+    # Drop the search index first: its triggers name the old columns, and the
+    # backfill would otherwise reindex a recipe for every ingredient row
+    drop_recipe_search_index(conn)
+    apply_ddl(conn, RECIPE_CHILD_TABLES_V1)
+    
+    if {'ingredients', 'steps'} <= table_columns(conn, 'recipes'):
+        rows = conn.execute('''
+            SELECT id, ingredients, steps FROM recipes
+            WHERE id NOT IN (SELECT recipe_id FROM recipe_ingredients)
+              AND id NOT IN (SELECT recipe_id FROM recipe_steps)
+        ''').fetchall()
+        replace_recipe_lists(conn, (
+            (row['id'], split_recipe_list(row['ingredients']), split_recipe_list(row['steps']))
+            for row in rows
+        ))
+        print(f"🧂 Moved ingredients and steps of {len(rows)} recipes into child tables")
+        conn.execute('ALTER TABLE recipes DROP COLUMN ingredients')
+        conn.execute('ALTER TABLE recipes DROP COLUMN steps')
+    
+    apply_ddl(conn, SEARCH_INDEX_V2)
+    rebuild_recipe_search_index(conn)
+
+def migrate_010_recipe_content_hash(conn):
+    """Content hash per recipe for de-duplicating imports; search triggers limited to indexed columns"""
+    # Recreated below with update triggers that ignore non-indexed columns, so
+    # the backfill (and later image refreshes) no longer reindex each recipe
+    drop_recipe_search_index(conn)
+    if 'content_hash' not in table_columns(conn, 'recipes'):
+        conn.execute('ALTER TABLE recipes ADD COLUMN content_hash TEXT')
+    
+    rows = conn.execute('SELECT * FROM recipes WHERE content_hash IS NULL').fetchall()
+    lists = recipe_lists(conn, [row['id'] for row in rows], RECIPE_LIST_FIELDS)
+    conn.executemany('UPDATE recipes SET content_hash = ? WHERE id = ?', [
+        (recipe_content_hash({
+            **dict(row),
+            'ingredients': lists['ingredients'].get(row['id'], []),
+            'steps': lists['steps'].get(row['id'], []),
+        }), row['id'])
+        for row in rows
+    ])
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_recipes_content_hash ON recipes (content_hash)')
+    apply_ddl(conn, SEARCH_INDEX_V3)
+    rebuild_recipe_search_index(conn)
+
+def migrate_011_search_triggers_for_moved_ingredients(conn):
+    """Search index triggers refresh both recipes when an ingredient row moves between them"""
+    drop_recipe_search_index(conn)
+    apply_ddl(conn, SEARCH_INDEX_V4)
+    rebuild_recipe_search_index(conn)
+
+MIGRATIONS = [
+    (1, migrate_001_initial_schema),
+    (2, migrate_002_search_index),
+    (3, migrate_003_listing_index),
+    (4, migrate_004_catalog_version),
+    (5, migrate_005_facet_indexes),
+    (6, migrate_006_rating_stats),
+    (7, migrate_007_user_ratings_index),
+    (8, migrate_008_user_oauth_lookup),
+    (9, migrate_009_recipe_child_tables),
+    (10, migrate_010_recipe_content_hash),
+    (11, migrate_011_search_triggers_for_moved_ingredients),
+]
+
+def get_schema_version(conn):
+    """Highest applied migration, or 0 for a database that has never been migrated"""
+    try:
+        return conn.execute('SELECT MAX(version) FROM schema_version').fetchone()[0] or 0
+    except sqlite3.OperationalError:
+        return 0
+
+def migrate_database(conn):
+    """Apply pending migrations in order, each in its own transaction"""
+    latest = MIGRATIONS[-1][0]
+    if get_schema_version(conn) >= latest:
+        return 0
+    
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    applied = 0
+    for version, migrate in MIGRATIONS:
+        # IMMEDIATE takes the write lock up front so concurrent workers apply each step once
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            description = migrate.__doc__.strip()
+            print(f"🔄 Applying migration {version}: {description}")
+            migrate(conn)
+            conn.execute(
+                'INSERT INTO schema_version (version, description) VALUES (?, ?)',
+                (version, description)
+            )
+            conn.commit()
+            applied += 1
+        except Exception:
+            conn.rollback()
+            raise
+    return applied
+
+# gunicorn imports app:app without calling init_database(), so the first
+# connection each worker checks out applies any pending migrations
+_schema_lock = threading.Lock()
+_schema_checked_pid = None
+_suspension_recheck_at = None
+
+def ensure_schema(conn):
+    """Run migrate_database() once per worker process, whichever entry point started it
+
+    Indexes suspended by an import that is still running are left to it and
+    checked again only once its lease could have expired.
+    """
+    global _schema_checked_pid, _suspension_recheck_at
+    pid = os.getpid()
+    if _schema_checked_pid == pid and (_suspension_recheck_at is None or time.monotonic() < _suspension_recheck_at):
+        return
+    with _schema_lock:
+        if _schema_checked_pid != pid:
+            migrate_database(conn)
+            _schema_checked_pid = pid
+            _suspension_recheck_at = time.monotonic()
+        if _suspension_recheck_at is not None and time.monotonic() >= _suspension_recheck_at:
+            try:
+                left = restore_suspended_indexes(conn)
+            except sqlite3.OperationalError as e:
+                # The loader still holds the write lock, so it is not dead after all
+                print(f"⚠️  Could not rebuild suspended recipe indexes yet: {e}")
+                left = IMPORT_LEASE_SECONDS
+            _suspension_recheck_at = None if left is None else time.monotonic() + left
+
+def init_database():
+    """Bring the schema up to date and load the seed catalog"""
+    conn = db_pool.acquire()
+    ensure_schema(conn)
+    
+    # Load the seed catalog when the table is empty or the seed file has changed
+    seed_checksum = file_checksum(SEED_PATH)
+    stored_checksum = conn.execute(
+        "SELECT value FROM catalog_meta WHERE key = 'seed_checksum'"
+    ).fetchone()
+    existing_recipes = conn.execute('SELECT COUNT(*) FROM recipes').fetchone()[0]
+    
+    # A populated database without a stored checksum predates the seed file;
+    # adopt it as-is rather than overwriting edits such as update_recipe_images.py
+    if existing_recipes == 0 or (stored_checksum and stored_checksum[0] != seed_checksum):
+        count = load_seed_recipes(conn, SEED_PATH)
+        print(f"🌱 Loaded {count} new or changed seed recipes")
+    conn.execute(
+        "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('seed_checksum', ?)",
+        (seed_checksum,)
+    )
     
     conn.commit()
-    conn.close()
+    check_storage_profile(conn)
+    check_filter_query_plans(conn)
+    get_similarity_table(recipe_catalog.get(conn))
+    db_pool.release(conn)
 
-def format_recipe(row):
-    """Convert database row to recipe dictionary"""
-    return {
-        'id': row['id'],
-        'name': row['name'],
-        'country': row['country'],
-        'origin': row['origin'] if 'origin' in row.keys() else '',
-        'cuisine_type': row['cuisine_type'] if 'cuisine_type' in row.keys() else '',
-        'description': row['description'],
-        'image': row['image'],
-        'prep_time': row['prep_time'],
-        'difficulty': row['difficulty'],
-        'spice_level': row['spice_level'] if 'spice_level' in row.keys() else '',
-        'is_vegan': bool(row['is_vegan']) if 'is_vegan' in row.keys() else False,
-        'is_vegetarian': bool(row['is_vegetarian']) if 'is_vegetarian' in row.keys() else False,
-        'is_gluten_free': bool(row['is_gluten_free']) if 'is_gluten_free' in row.keys() else False,
-        'health_benefits': row['health_benefits'],
-        'ingredients': row['ingredients'].split('|') if row['ingredients'] else [],
-        'steps': row['steps'].split('|') if row['steps'] else []
-    }
+# Response compression
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+COMPRESS_MIMETYPES = ('application/json',)
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', 5))
+STATIC_MAX_AGE = 365 * 24 * 60 * 60
+STATIC_MANIFEST_PATH = os.path.join(app.static_folder, 'dist', 'manifest.json')
+
+def negotiate_encoding(offers=None):
+    """Pick the best content coding the client accepts, or None for identity"""
+    if offers is None:
+        offers = ['br', 'gzip'] if brotli else ['gzip']
+    return request.accept_encodings.best_match(offers)
+
+def compress_body(body, encoding):
+    """Compress a response body with the negotiated content coding"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+@app.after_request
+def compress_response(response):
+    """Compress JSON responses above COMPRESS_MIN_SIZE for clients that accept it"""
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    if encoding:
+        response.set_data(compress_body(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def load_static_manifest():
+    """Map static paths to their content-hashed copies written by build_static.py"""
+    try:
+        with open(STATIC_MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+static_manifest = load_static_manifest()
+
+@app.template_global()
+def asset_url(path):
+    """URL of a static asset, using its content-hashed copy when one has been built"""
+    return url_for('static', filename=static_manifest.get(path, path))
+
+def precompressed_is_fresh(filename, compressed, immutable):
+    """Whether a .br/.gz sibling can stand in for the static file it was built from"""
+    try:
+        compressed_mtime = os.stat(compressed).st_mtime_ns
+    except OSError:
+        return False
+    if immutable:
+        return True
+    # Un-hashed files are edited in place; a sibling older than its source is stale
+    source = safe_join(app.static_folder, filename)
+    try:
+        return compressed_mtime >= os.stat(source).st_mtime_ns
+    except (OSError, TypeError):
+        return False
+
+def serve_static(filename):
+    """Serve static files, preferring precompressed .br/.gz siblings"""
+    # Hashed filenames change whenever their content does, so they never need revalidating
+    immutable = filename.startswith('dist/')
+    max_age = STATIC_MAX_AGE if immutable else None
+    
+    encoding = negotiate_encoding(['br', 'gzip'])
+    suffix = {'br': '.br', 'gzip': '.gz'}.get(encoding)
+    compressed = safe_join(app.static_folder, filename + suffix) if suffix else None
+    
+    if compressed and precompressed_is_fresh(filename, compressed, immutable):
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        response = send_from_directory(app.static_folder, filename + suffix,
+                                       mimetype=mimetype, max_age=max_age)
+        response.headers['Content-Encoding'] = encoding
+    else:
+        response = send_from_directory(app.static_folder, filename, max_age=max_age)
+    response.vary.add('Accept-Encoding')
+    
+    if immutable:
+        response.cache_control.immutable = True
+    return response
+
+app.view_functions['static'] = serve_static
+
+# In-memory recipe catalog
+CATALOG_CHECK_INTERVAL = float(os.getenv('CATALOG_CHECK_INTERVAL', 2))
+CATALOG_CACHE_MAX_AGE = int(os.getenv('CATALOG_CACHE_MAX_AGE', 60))
+
+Recipe = namedtuple('Recipe', [
+    'id', 'name', 'country', 'origin', 'cuisine_type', 'description', 'image',
+    'prep_time', 'difficulty', 'spice_level', 'is_vegan', 'is_vegetarian',
+    'is_gluten_free', 'health_benefits', 'ingredients', 'steps'
+])
+
+def intern_text(value):
+    """Share one string object for values repeated across many recipes"""
+    return sys.intern(value) if value else ''
+
+def recipe_from_row(row, ingredients=(), steps=()):
+    """Build an immutable Recipe from a recipes table row and its ingredient and step lists"""
+    return Recipe(
+        id=row['id'],
+        name=row['name'],
+        country=intern_text(row['country']),
+        origin=intern_text(row['origin']),
+        cuisine_type=intern_text(row['cuisine_type']),
+        description=row['description'],
+        image=row['image'],
+        prep_time=intern_text(row['prep_time']),
+        difficulty=intern_text(row['difficulty']),
+        spice_level=intern_text(row['spice_level']),
+        is_vegan=bool(row['is_vegan']),
+        is_vegetarian=bool(row['is_vegetarian']),
+        is_gluten_free=bool(row['is_gluten_free']),
+        health_benefits=row['health_benefits'],
+        ingredients=tuple(ingredients),
+        steps=tuple(steps)
+    )
+
+# Field tuples arrive canonicalized by parse_recipe_fields(), but a client can
+# still ask for thousands of distinct sets, so only the recent ones stay compiled
+SERIALIZER_CACHE_SIZE = 64
+
+@lru_cache(maxsize=SERIALIZER_CACHE_SIZE)
+def recipe_serializer(fields):
+    """Compile, once per field tuple, a function turning a Recipe into its API dictionary"""
+    get_values = itemgetter(*(Recipe._fields.index(field) for field in fields))
+    if len(fields) == 1:
+        field = fields[0]
+        if field in RECIPE_LIST_FIELDS:
+            return lambda recipe: {field: list(get_values(recipe))}
+        return lambda recipe: {field: get_values(recipe)}
+    
+    list_positions = tuple(i for i, field in enumerate(fields) if field in RECIPE_LIST_FIELDS)
+    if not list_positions:
+        return lambda recipe: dict(zip(fields, get_values(recipe)))
+    
+    def serialize(recipe):
+        values = list(get_values(recipe))
+        for i in list_positions:
+            values[i] = list(values[i])
+        return dict(zip(fields, values))
+    return serialize
+
+def recipe_to_dict(recipe, fields=None):
+    """Convert a catalog Recipe to the API's recipe dictionary, optionally only ``fields``"""
+    return recipe_serializer(RECIPE_FIELDS if fields is None else tuple(fields))(recipe)
+
+
+class RecipeSampler:
+    """Draws k distinct recipes from precomputed per-filter id arrays"""
+
+    def __init__(self, recipes):
+        self._pools = {(): tuple(recipe.id for recipe in recipes)}
+        for flag in RECIPE_FLAG_FIELDS:
+            self._pools[((flag, True),)] = tuple(recipe.id for recipe in recipes if getattr(recipe, flag))
+        for field in RECIPE_FACET_FIELDS:
+            groups = {}
+            for recipe in recipes:
+                groups.setdefault(getattr(recipe, field), []).append(recipe.id)
+            for value, ids in groups.items():
+                self._pools[((field, value),)] = tuple(ids)
+
+    def pool(self, filters):
+        """Id array for a filter combination; combinations are intersected once and cached"""
+        key = tuple(sorted(filters.items()))
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+        if len(key) < 2:
+            return ()
+
+        singles = sorted((self.pool(dict([item])) for item in key), key=len)
+        if not singles[0]:
+            return ()
+        others = [set(ids) for ids in singles[1:]]
+        pool = tuple(recipe_id for recipe_id in singles[0] if all(recipe_id in ids for ids in others))
+        self._pools[key] = pool
+        return pool
+
+    def sample(self, k, filters=None, seed=None):
+        """k distinct ids drawn uniformly; pass ``seed`` for a reproducible draw"""
+        pool = self.pool(filters or {})
+        rng = random.Random(seed) if seed is not None else random
+        # random.sample() draws by index, so the cost depends on k rather than the catalog size
+        return rng.sample(pool, min(k, len(pool)))
+
+
+class RecipeCatalog:
+    """Process-local snapshot of the recipes table, reloaded when its version stamp changes"""
+
+    def __init__(self, check_interval=CATALOG_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._checked_at = 0.0
+
+    @staticmethod
+    def read_version(conn):
+        try:
+            row = conn.execute(
+                "SELECT value FROM catalog_meta WHERE key = 'catalog_version'"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def _load(self, conn, version):
+        rows = conn.execute('SELECT * FROM recipes ORDER BY name').fetchall()
+        lists = recipe_lists(conn, [row['id'] for row in rows], RECIPE_LIST_FIELDS)
+        recipes = tuple(
+            recipe_from_row(row, lists['ingredients'].get(row['id'], ()), lists['steps'].get(row['id'], ()))
+            for row in rows
+        )
+        return {
+            'version': version,
+            'recipes': recipes,
+            'by_id': {recipe.id: recipe for recipe in recipes},
+            'countries': tuple(sorted({recipe.country for recipe in recipes})),
+            'cuisines': tuple(sorted({recipe.cuisine_type for recipe in recipes})),
+            # Serialized response bodies, filled lazily by catalog_response()
+            'responses': {},
+            'compressed': {},
+            'sampler': RecipeSampler(recipes),
+            'pantry': PantryIndex(recipes),
+        }
+
+    def get(self, conn):
+        """Return the current snapshot, checking the version stamp at most every check_interval"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < self.check_interval:
+            return snapshot
+
+        version = self.read_version(conn)
+        if snapshot is None or snapshot['version'] != version:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None or snapshot['version'] != version:
+                    snapshot = self._load(conn, version)
+                    self._snapshot = snapshot
+        self._checked_at = now
+        return snapshot
+
+    def invalidate(self):
+        """Drop the snapshot so the next request reloads it"""
+        self._snapshot = None
+
+
+recipe_catalog = RecipeCatalog()
+
+def get_catalog():
+    """Return the in-memory recipe catalog for the current request"""
+    return recipe_catalog.get(get_db_connection())
+
+# Precomputed content-based neighbours, persisted next to the database and
+# patched for changed recipes whenever the catalog version moves
+SIMILARITY_DIR = os.getenv('SIMILARITY_DIR', os.path.join(os.path.dirname(DB_PATH), 'similarity'))
+SIMILARITY_TOP_K = int(os.getenv('SIMILARITY_TOP_K', 20))
+SIMILAR_COUNT = 6
+
+similar_recipes = SimilarityIndex(SIMILARITY_DIR, k=SIMILARITY_TOP_K)
+
+def get_similarity_table(catalog):
+    """Neighbour table matching the given catalog snapshot"""
+    return similar_recipes.ensure(catalog['recipes'], catalog['version'])
+
+# Field projection and keyset pagination for recipe listings
+RECIPE_FIELDS = Recipe._fields
+RECIPE_CARD_FIELDS = (
+    'id', 'name', 'country', 'origin', 'cuisine_type', 'description', 'image',
+    'prep_time', 'difficulty', 'spice_level', 'is_vegan', 'is_vegetarian', 'is_gluten_free'
+)
+RECIPE_FLAG_FIELDS = ('is_vegan', 'is_vegetarian', 'is_gluten_free')
+RECIPE_LIST_FIELDS = ('ingredients', 'steps')
+SURPRISE_COUNT = 6
+MAX_SURPRISE_COUNT = 24
+MAX_PANTRY_ITEMS = 50
+DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', 24))
+MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', 100))
+EXPORT_CHUNK_ROWS = int(os.getenv('EXPORT_CHUNK_ROWS', 500))
+
+# Facet filters for /api/recipes. Each equality facet leads an index that
+# continues with (name, id), and each diet flag has a partial (name, id)
+# index, so filtered listings stay index-ordered for keyset pagination.
+RECIPE_FACET_FIELDS = ('country', 'cuisine_type', 'difficulty', 'spice_level')
+TRUE_VALUES = ('1', 'true', 'yes')
+FALSE_VALUES = ('', '0', 'false', 'no')
+
+def parse_recipe_filters(args):
+    """Read facet filters from query parameters; raises ValueError on bad input"""
+    filters = {}
+    for field in RECIPE_FACET_FIELDS:
+        if args.get(field):
+            filters[field] = args[field]
+    for flag in RECIPE_FLAG_FIELDS:
+        value = args.get(flag, '').lower()
+        if value in TRUE_VALUES:
+            filters[flag] = True
+        elif value not in FALSE_VALUES:
+            raise ValueError(f'{flag} must be true or false')
+    return filters
+
+def recipe_filter_clause(filters):
+    """WHERE terms and parameters for a set of facet filters"""
+    terms = []
+    params = []
+    for field, value in filters.items():
+        if field in RECIPE_FLAG_FIELDS:
+            # Written as a literal so SQLite can match the partial index
+            terms.append(f'{field} = 1')
+        else:
+            terms.append(f'{field} = ?')
+            params.append(value)
+    return terms, params
+
+def check_filter_query_plans(conn):
+    """Verify that every supported facet filter combination avoids a full table scan"""
+    partial_indexes = tuple(f'idx_recipes_{flag[3:]}' for flag in RECIPE_FLAG_FIELDS)
+    facets = RECIPE_FACET_FIELDS + RECIPE_FLAG_FIELDS
+    failures = []
+    combinations = 0
+    
+    for mask in range(1, 2 ** len(facets)):
+        filters = {field: True if field in RECIPE_FLAG_FIELDS else 'x'
+                   for bit, field in enumerate(facets) if mask & (1 << bit)}
+        terms, params = recipe_filter_clause(filters)
+        for keyset in (False, True):
+            where = terms + ['(name, id) > (?, ?)'] if keyset else terms
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT id FROM recipes WHERE {' AND '.join(where)} ORDER BY name, id",
+                params + (['x', 0] if keyset else [])
+            ).fetchall()
+            details = [row[3] for row in plan]
+            full_scan = any(
+                detail.startswith('SCAN recipes') and not any(name in detail for name in partial_indexes)
+                for detail in details
+            )
+            combinations += 1
+            if full_scan:
+                failures.append((sorted(filters), keyset, details))
+    
+    if failures:
+        for fields, keyset, details in failures:
+            print(f"⚠️  Full scan for filters {', '.join(fields)}{' (after cursor)' if keyset else ''}: {'; '.join(details)}")
+    else:
+        print(f"🧭 Filter query plans: all {combinations} combinations use an index")
+    return failures
+
+def encode_cursor(values):
+    """Encode keyset values as an opaque, URL-safe cursor"""
+    raw = json.dumps(values, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(token):
+    """Decode a cursor produced by encode_cursor(); raises ValueError if malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError('Invalid cursor')
+    # Keyset values are bound straight into SQL: a name or rank, then an id
+    key, recipe_id = values
+    if isinstance(key, bool) or not isinstance(key, (str, int, float)):
+        raise ValueError('Invalid cursor')
+    if isinstance(recipe_id, bool) or not isinstance(recipe_id, int):
+        raise ValueError('Invalid cursor')
+    return values
+
+def parse_recipe_fields(args):
+    """Fields selected by the view/fields parameters; raises ValueError on bad input"""
+    view = args.get('view', 'full')
+    if args.get('fields'):
+        fields = tuple(field.strip() for field in args['fields'].split(',') if field.strip())
+        unknown = [field for field in fields if field not in RECIPE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        # One canonical tuple per field set, however the request orders or repeats them
+        wanted = set(fields) | {'id'}
+        fields = tuple(field for field in RECIPE_FIELDS if field in wanted)
+    elif view == 'card':
+        fields = RECIPE_CARD_FIELDS
+    elif view == 'full':
+        fields = RECIPE_FIELDS
+    else:
+        raise ValueError("view must be 'card' or 'full'")
+    return fields
+
+def parse_listing_args(args):
+    """Parse view/fields/limit/after parameters into (fields, paginated, limit, after)"""
+    fields = parse_recipe_fields(args)
+    paginated = 'limit' in args or 'after' in args
+    limit = None
+    after = None
+    if paginated:
+        try:
+            limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise ValueError('limit must be an integer')
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f'limit must be between 1 and {MAX_PAGE_SIZE}')
+        if args.get('after'):
+            after = decode_cursor(args['after'])
+    return fields, paginated, limit, after
+
+def select_columns(fields, extra=()):
+    """Column list for a narrow SELECT: the requested fields plus any keyset columns"""
+    columns = [field for field in fields if field not in RECIPE_LIST_FIELDS]
+    return columns + [column for column in extra if column not in columns]
+
+def recipe_lists(conn, recipe_ids, fields):
+    """Ingredient and step lists for many recipes in one query: {field: {recipe_id: [...]}}"""
+    wanted = [field for field in RECIPE_LIST_FIELDS if field in fields]
+    lists = {field: {} for field in wanted}
+    if not wanted or not recipe_ids:
+        return lists
+    
+    ids = json.dumps(list(recipe_ids))
+    tables = {'ingredients': 'recipe_ingredients', 'steps': 'recipe_steps'}
+    sql = ' UNION ALL '.join(
+        f"SELECT '{field}' AS field, recipe_id, position, text FROM {tables[field]} "
+        f"WHERE recipe_id IN (SELECT value FROM json_each(?))"
+        for field in wanted
+    ) + ' ORDER BY recipe_id, position'
+    for field, recipe_id, _, text in conn.execute(sql, [ids] * len(wanted)):
+        lists[field].setdefault(recipe_id, []).append(text)
+    return lists
+
+@lru_cache(maxsize=SERIALIZER_CACHE_SIZE)
+def row_serializer(fields):
+    """Compile, once per field tuple, a function turning a narrow SELECT row into an API dictionary
+
+    Rows come from ``SELECT select_columns(fields, ...)``, so each stored
+    field sits at a known position and only its conversion is left per row.
+    """
+    positions = {column: i for i, column in enumerate(select_columns(fields))}
+    id_position = positions['id']
+    plan = []
+    for field in fields:
+        if field in RECIPE_LIST_FIELDS:
+            plan.append((field, lambda row, lists, field=field: lists[field].get(row[id_position], [])))
+        elif field in RECIPE_FLAG_FIELDS:
+            plan.append((field, lambda row, lists, i=positions[field]: bool(row[i])))
+        else:
+            plan.append((field, lambda row, lists, i=positions[field]: '' if row[i] is None else row[i]))
+    plan = tuple(plan)
+    return lambda row, lists: {field: convert(row, lists) for field, convert in plan}
+
+def format_recipe_rows(conn, rows, fields):
+    """Recipe dictionaries for a page of rows, fetching list fields in one batched query"""
+    lists = recipe_lists(conn, [row['id'] for row in rows], fields)
+    serialize = row_serializer(tuple(fields))
+    return [serialize(row, lists) for row in rows]
+
+def recipe_page(conn, rows, fields, limit, sort_key):
+    """Build one page of a keyset-paginated listing from ``limit + 1`` fetched rows"""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return jsonify({
+        'recipes': format_recipe_rows(conn, rows, fields),
+        'next_cursor': encode_cursor(sort_key(rows[-1])) if has_more else None
+    })
+
+def recipe_export_cursor(conn, fields, filters=None):
+    """Open a cursor over every matching recipe in id order for a streaming export"""
+    where, params = recipe_filter_clause(filters or {})
+    sql = f"SELECT {', '.join(select_columns(fields))} FROM recipes"
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    return conn.execute(sql + ' ORDER BY id', params)
+
+def iter_recipe_chunks(conn, cursor, fields, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield recipe dictionaries a chunk at a time from a recipe_export_cursor()
+
+    While the cursor is open the connection stays in one read transaction,
+    so the list fields fetched per chunk match the rows they belong to.
+    """
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            yield format_recipe_rows(conn, rows, fields)
+    finally:
+        cursor.close()
+
+def ndjson_blocks(chunks):
+    """Encode each chunk of records as one block of newline-delimited JSON"""
+    for records in chunks:
+        yield ''.join(
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n' for record in records
+        ).encode('utf-8')
+
+def gzip_blocks(blocks, level=GZIP_LEVEL):
+    """Gzip a stream of byte blocks incrementally into a single gzip member"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for block in blocks:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def catalog_response(catalog, key, build):
+    """Serve catalog data from cached JSON bytes with a strong ETag and 304 support
+
+    A ``key`` of None serializes the data for this request only, for shapes
+    too numerous to keep a body per variant.
+    """
+    cached = catalog['responses'].get(key) if key is not None else None
+    if cached is None:
+        body = app.json.dumps(build(), separators=(',', ':')).encode('utf-8')
+        etag = f"{catalog['version'] or 0}-{hashlib.sha1(body).hexdigest()[:16]}"
+        cached = (body, etag)
+        if key is not None:
+            catalog['responses'][key] = cached
+
+    body, etag = cached
+    encoding = negotiate_encoding() if len(body) >= COMPRESS_MIN_SIZE else None
+    if encoding:
+        variant = catalog['compressed'].get((key, encoding)) if key is not None else None
+        if variant is None:
+            variant = compress_body(body, encoding)
+            if key is not None:
+                catalog['compressed'][(key, encoding)] = variant
+        body = variant
+        etag = f'{etag}-{encoding}'
+    
+    response = app.response_class(body, mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = CATALOG_CACHE_MAX_AGE
+    return response.make_conditional(request)
 
 @app.route('/')
 def index():
@@ -2144,15 +1905,30 @@ def api_login():
     email = data['email'].lower().strip()
     password = data['password']
     
-    # Get user from database
-    conn = get_db_connection()
-    user = conn.execute(
+    # Get user from database, then free the connection for other requests
+    # while this one waits for and runs the deliberately slow hash
+    user = get_db_connection().execute(
         'SELECT * FROM users WHERE email = ? AND is_active = 1', 
         (email,)
     ).fetchone()
-    conn.close()
+    return_db_connection()
     
-    if user and verify_password(password, user['password_hash']):
+    if user and password_executor.run(verify_password, password, user['password_hash']):
+        # Upgrade hashes stored with an older format or cost, now that we know the password
+        # Best-effort: skipped while the hashing pool is busy and retried on a later login
+        if password_needs_rehash(user['password_hash']):
+            try:
+                new_hash = password_executor.run(hash_password, password, idle_only=True)
+            except HashingBusy:
+                new_hash = None
+            if new_hash:
+                conn = get_db_connection()
+                conn.execute(
+                    'UPDATE users SET password_hash = ? WHERE id = ? AND password_hash = ?',
+                    (new_hash, user['id'], user['password_hash'])
+                )
+                conn.commit()
+        
         # Create session
         session['user_id'] = user['id']
         session['user_email'] = user['email']
@@ -2191,35 +1967,16 @@ def api_signup():
     if len(password) < 8:
         return jsonify({'error': 'Password must be at least 8 characters long'}), 400
     
-    # Check if user already exists
-    conn = get_db_connection()
-    existing_user = conn.execute(
-        'SELECT email FROM users WHERE email = ?', 
-        (email,)
-    ).fetchone()
-    
-    if existing_user:
-        conn.close()
-        return jsonify({'error': 'Email address is already registered'}), 409
-    
-    # Hash password and create user
-    password_hash = hash_password(password)
+    # Hash password and create user; the insert itself detects a taken email
+    password_hash = password_executor.run(hash_password, password)
     
     try:
-        conn.execute(
-            '''INSERT INTO users (email, password_hash, first_name, last_name, 
-                                 cuisine_preferences, newsletter_subscribed)
-               VALUES (?, ?, ?, ?, ?, ?)''',
-            (email, password_hash, first_name, last_name, cuisine_preferences, newsletter_subscribed)
+        user = create_password_user(
+            get_db_connection(), email, password_hash, first_name, last_name,
+            cuisine_preferences, newsletter_subscribed
         )
-        conn.commit()
-        
-        # Get the created user
-        user = conn.execute(
-            'SELECT * FROM users WHERE email = ?', 
-            (email,)
-        ).fetchone()
-        conn.close()
+        if user is None:
+            return jsonify({'error': 'Email address is already registered'}), 409
         
         # Create session
         session['user_id'] = user['id']
@@ -2238,12 +1995,51 @@ def api_signup():
         }), 201
         
     except Exception as e:
-        conn.close()
         return jsonify({'error': 'Registration failed. Please try again.'}), 500
 
+# Per-worker cache of /api/user profiles, keyed by session user_id
+USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', 30))
+USER_CACHE_MAX_ENTRIES = int(os.getenv('USER_CACHE_MAX_ENTRIES', 10000))
+
+
+class UserProfileCache:
+    """Short-TTL, size-bounded map of user_id -> (profile, etag)"""
+
+    def __init__(self, ttl=USER_CACHE_TTL, max_entries=USER_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, user_id):
+        """Cached (profile, etag) for a user, or None if missing or expired"""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1], entry[2]
+
+    def set(self, user_id, profile):
+        """Cache a profile and return it with its ETag"""
+        etag = hashlib.sha1(json.dumps(profile, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, profile, etag)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return profile, etag
+
+    def invalidate(self, user_id):
+        """Forget a user after logout or any change to their profile"""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+user_profiles = UserProfileCache()
+
 @app.route('/api/logout', methods=['POST'])
 def api_logout():
     """Handle user logout"""
+    user_profiles.invalidate(session.get('user_id'))
     session.clear()
     return jsonify({'success': True})
 
@@ -2253,15 +2049,21 @@ def get_current_user():
     if 'user_id' not in session:
         return jsonify({'error': 'Not authenticated'}), 401
     
-    conn = get_db_connection()
-    user = conn.execute(
-        'SELECT id, email, first_name, last_name, cuisine_preferences, created_at FROM users WHERE id = ?',
-        (session['user_id'],)
-    ).fetchone()
-    conn.close()
+    user_id = session['user_id']
+    cached = user_profiles.get(user_id)
     
-    if user:
-        return jsonify({
+    if cached is None:
+        conn = get_db_connection()
+        user = conn.execute(
+            'SELECT id, email, first_name, last_name, cuisine_preferences, created_at FROM users WHERE id = ?',
+            (user_id,)
+        ).fetchone()
+        
+        if not user:
+            session.clear()
+            return jsonify({'error': 'User not found'}), 404
+        
+        cached = user_profiles.set(user_id, {
             'id': user['id'],
             'email': user['email'],
             'first_name': user['first_name'],
@@ -2269,56 +2071,211 @@ def get_current_user():
             'cuisine_preferences': user['cuisine_preferences'],
             'created_at': user['created_at']
         })
-    else:
-        session.clear()
-        return jsonify({'error': 'User not found'}), 404
+    
+    profile, etag = cached
+    response = jsonify(profile)
+    response.set_etag(etag)
+    # Identity is per session: browsers may keep it but must revalidate every time
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    return response.make_conditional(request)
 
-def hash_password(password):
-    """Hash a password using SHA-256 with salt"""
-    salt = os.urandom(32)
-    pwd_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
-    return salt + pwd_hash
+# Password hash parameters. Stored hashes are self-describing
+# ("pbkdf2_sha256$<iterations>$<salt>$<hash>"), so the cost can be tuned per
+# deployment with PASSWORD_ITERATIONS (see calibrate_password_hash.py) and
+# existing hashes are upgraded on the next successful login.
+PASSWORD_ALGORITHM = 'pbkdf2_sha256'
+PASSWORD_ITERATIONS = int(os.getenv('PASSWORD_ITERATIONS', 100000))
+PASSWORD_SALT_BYTES = 32
+LEGACY_PASSWORD_ITERATIONS = 100000
+
+def hash_password(password, iterations=None):
+    """Hash a password with salted PBKDF2-SHA256 in the self-describing format"""
+    iterations = iterations or PASSWORD_ITERATIONS
+    salt = os.urandom(PASSWORD_SALT_BYTES)
+    pwd_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return '$'.join([
+        PASSWORD_ALGORITHM,
+        str(iterations),
+        base64.b64encode(salt).decode('ascii'),
+        base64.b64encode(pwd_hash).decode('ascii')
+    ])
+
+def parse_password_hash(hashed):
+    """Split a stored hash into (algorithm, iterations, salt, hash)"""
+    if isinstance(hashed, bytes):
+        # Legacy format: raw salt + hash bytes at a fixed cost
+        return (PASSWORD_ALGORITHM, LEGACY_PASSWORD_ITERATIONS,
+                hashed[:PASSWORD_SALT_BYTES], hashed[PASSWORD_SALT_BYTES:])
+    algorithm, iterations, salt, pwd_hash = hashed.split('$')
+    return algorithm, int(iterations), base64.b64decode(salt), base64.b64decode(pwd_hash)
 
 def verify_password(password, hashed):
     """Verify a password against its hash"""
-    salt = hashed[:32]
-    pwd_hash = hashed[32:]
-    pwd_check = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
-    return pwd_hash == pwd_check
+    if not hashed:
+        return False
+    try:
+        algorithm, iterations, salt, pwd_hash = parse_password_hash(hashed)
+    except ValueError:
+        return False
+    if algorithm != PASSWORD_ALGORITHM:
+        return False
+    pwd_check = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return hmac.compare_digest(pwd_hash, pwd_check)
+
+def password_needs_rehash(hashed):
+    """True when a stored hash uses an old format or different cost than configured"""
+    if isinstance(hashed, bytes):
+        return True
+    try:
+        algorithm, iterations, _, _ = parse_password_hash(hashed)
+    except ValueError:
+        return False
+    return algorithm != PASSWORD_ALGORITHM or iterations != PASSWORD_ITERATIONS
+
+def calibrate_password_iterations(target_seconds, sample_iterations=50000):
+    """Iteration count at which one hash takes about ``target_seconds`` on this host"""
+    password = b'calibration-password'
+    salt = os.urandom(PASSWORD_SALT_BYTES)
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        hashlib.pbkdf2_hmac('sha256', password, salt, sample_iterations)
+        timings.append(time.perf_counter() - started)
+    per_iteration = min(timings) / sample_iterations
+    # Round to a readable number; never go below the legacy cost
+    iterations = int(target_seconds / per_iteration) // 10000 * 10000
+    return max(iterations, LEGACY_PASSWORD_ITERATIONS)
+
+# Password hashing executor. PBKDF2 is deliberately slow, so it runs on a small,
+# size-capped thread pool and sheds load instead of tying up every request thread.
+# The cap is per process, so it only bites with threaded workers (the Procfile
+# runs gunicorn gthread with WEB_THREADS threads): keep HASH_WORKERS +
+# HASH_QUEUE_LIMIT below WEB_THREADS so the remaining threads keep serving browsing.
+HASH_WORKERS = int(os.getenv('HASH_WORKERS', 2))
+HASH_QUEUE_LIMIT = int(os.getenv('HASH_QUEUE_LIMIT', 4))
+HASH_QUEUE_TIMEOUT = float(os.getenv('HASH_QUEUE_TIMEOUT', 3))
+
+
+class HashingBusy(Exception):
+    """Raised when the password hashing executor cannot take more work"""
+
+
+class PasswordHashExecutor:
+    """Bounded thread pool for password hashing with queue-wait and hash-time metrics"""
+
+    def __init__(self, workers=HASH_WORKERS, queue_limit=HASH_QUEUE_LIMIT, timeout=HASH_QUEUE_TIMEOUT):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pid = None
+        self._executor = None
+        self._stats = {
+            'completed': 0,
+            'rejected': 0,
+            'timeouts': 0,
+            'queue_wait_total': 0.0,
+            'queue_wait_max': 0.0,
+            'hash_time_total': 0.0,
+        }
+
+    def _get_executor(self):
+        # Thread pools do not survive a fork; build one per worker process
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='password-hash')
+                    self._slots = threading.BoundedSemaphore(self.workers + self.queue_limit)
+                    self._pending = 0
+                    self._pid = os.getpid()
+        return self._executor
+
+    def _finished(self, _):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def run(self, fn, *args, idle_only=False):
+        """Run ``fn(*args)`` on the pool; raises HashingBusy when saturated or too slow
+
+        With ``idle_only`` the work is refused unless a worker is free, for
+        optional hashing that must never queue behind logins.
+        """
+        executor = self._get_executor()
+        with self._lock:
+            idle = self._pending < self.workers
+        if (idle_only and not idle) or not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise HashingBusy('Password hashing queue is full')
+        with self._lock:
+            self._pending += 1
+        
+        submitted = time.perf_counter()
+        
+        def timed():
+            started = time.perf_counter()
+            result = fn(*args)
+            return result, started - submitted, time.perf_counter() - started
+        
+        future = executor.submit(timed)
+        future.add_done_callback(self._finished)
+        try:
+            result, queue_wait, hash_time = future.result(timeout=self.timeout)
+        except FuturesTimeout:
+            future.cancel()
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise HashingBusy('Password hashing timed out in the queue')
+        
+        with self._lock:
+            self._stats['completed'] += 1
+            self._stats['queue_wait_total'] += queue_wait
+            self._stats['queue_wait_max'] = max(self._stats['queue_wait_max'], queue_wait)
+            self._stats['hash_time_total'] += hash_time
+        
+        # Per-request metrics, reported back in the Server-Timing header
+        if has_request_context():
+            g.hash_metrics = g.get('hash_metrics', []) + [(queue_wait, hash_time)]
+        return result
+
+    def stats(self):
+        """Snapshot of executor counters for monitoring"""
+        with self._lock:
+            stats = dict(self._stats, workers=self.workers, queue_limit=self.queue_limit)
+        completed = stats['completed'] or 1
+        stats['queue_wait_avg'] = stats['queue_wait_total'] / completed
+        stats['hash_time_avg'] = stats['hash_time_total'] / completed
+        return stats
+
+
+password_executor = PasswordHashExecutor()
+
+@app.errorhandler(HashingBusy)
+def handle_hashing_busy(error):
+    """Shed authentication load quickly instead of queueing behind slow hashes"""
+    response = jsonify({'error': 'Too many sign-in attempts right now, please retry shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+@app.after_request
+def add_hash_timing(response):
+    """Expose password hashing queue-wait and hash time via Server-Timing"""
+    metrics = g.get('hash_metrics')
+    if metrics:
+        queue_wait = sum(wait for wait, _ in metrics) * 1000
+        hash_time = sum(duration for _, duration in metrics) * 1000
+        response.headers.add('Server-Timing', f'hash-queue;dur={queue_wait:.1f}, hash;dur={hash_time:.1f}')
+    return response
 
 def find_or_create_oauth_user(email, first_name, last_name, provider, oauth_id, avatar_url=None):
     """Find existing OAuth user or create new one"""
-    conn = get_db_connection()
-    
-    # First, try to find user by email
-    user = conn.execute(
-        'SELECT * FROM users WHERE email = ?', (email,)
-    ).fetchone()
-    
-    if user:
-        # Update OAuth info if user exists
-        conn.execute(
-            '''UPDATE users SET oauth_provider = ?, oauth_id = ?, avatar_url = ? 
-               WHERE email = ?''',
-            (provider, oauth_id, avatar_url, email)
-        )
-        conn.commit()
-    else:
-        # Create new OAuth user
-        conn.execute(
-            '''INSERT INTO users (email, first_name, last_name, oauth_provider, 
-                                 oauth_id, avatar_url, password_hash)
-               VALUES (?, ?, ?, ?, ?, ?, NULL)''',
-            (email, first_name, last_name, provider, oauth_id, avatar_url)
-        )
-        conn.commit()
-        
-        # Get the newly created user
-        user = conn.execute(
-            'SELECT * FROM users WHERE email = ?', (email,)
-        ).fetchone()
-    
-    conn.close()
+    user = upsert_oauth_user(
+        get_db_connection(), email, first_name, last_name, provider, oauth_id, avatar_url
+    )
+    user_profiles.invalidate(user['id'])
     return user
 
 def create_user_session(user):
@@ -2333,7 +2290,11 @@ def create_user_session(user):
 def google_login():
     """Redirect to Google OAuth"""
     redirect_uri = url_for('google_callback', _external=True)
-    return google.authorize_redirect(redirect_uri)
+    try:
+        return google.authorize_redirect(redirect_uri)
+    except (requests.RequestException, CircuitOpen) as e:
+        print(f"Google OAuth unavailable: {e}")
+        return redirect('/login?error=provider_unavailable')
 
 @app.route('/auth/google/callback')
 def google_callback():
@@ -2357,6 +2318,9 @@ def google_callback():
         else:
             return redirect('/login?error=oauth_failed')
             
+    except CircuitOpen as e:
+        print(f"Google OAuth unavailable: {e}")
+        return redirect('/login?error=provider_unavailable')
     except Exception as e:
         print(f"Google OAuth error: {e}")
         return redirect('/login?error=oauth_failed')
@@ -2392,18 +2356,83 @@ def facebook_callback():
         else:
             return redirect('/login?error=oauth_failed')
             
+    except CircuitOpen as e:
+        print(f"Facebook OAuth unavailable: {e}")
+        return redirect('/login?error=provider_unavailable')
     except Exception as e:
         print(f"Facebook OAuth error: {e}")
         return redirect('/login?error=oauth_failed')
 
 @app.route('/api/recipes')
 def get_all_recipes():
-    """Get all recipes"""
+    """Get all recipes, optionally filtered, projected to fewer fields and paginated by (name, id)"""
+    try:
+        fields, paginated, limit, after = parse_listing_args(request.args)
+        filters = parse_recipe_filters(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if not paginated and not filters:
+        catalog = get_catalog()
+        # Only the named views are cached; any other field set is serialized per request
+        key = {RECIPE_FIELDS: 'recipes', RECIPE_CARD_FIELDS: ('recipes', 'card')}.get(fields)
+        return catalog_response(catalog, key,
+                                lambda: [recipe_to_dict(recipe, fields) for recipe in catalog['recipes']])
+    
     conn = get_db_connection()
-    recipes = conn.execute('SELECT * FROM recipes ORDER BY name').fetchall()
-    conn.close()
+    columns = ', '.join(select_columns(fields, ('name',)))
+    where, params = recipe_filter_clause(filters)
+    if after:
+        where.append('(name, id) > (?, ?)')
+        params += after
+    
+    sql = f'SELECT {columns} FROM recipes'
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    sql += ' ORDER BY name, id'
+    if paginated:
+        sql += ' LIMIT ?'
+        params.append(limit + 1)
+    recipes = conn.execute(sql, params).fetchall()
+    
+    if paginated:
+        return recipe_page(conn, recipes, fields, limit, lambda row: [row['name'], row['id']])
+    return jsonify(format_recipe_rows(conn, recipes, fields))
+
+@app.route('/api/export/recipes')
+def export_recipes():
+    """Stream every recipe as newline-delimited JSON, gzipped for clients that accept it"""
+    try:
+        fields = parse_recipe_fields(request.args)
+        filters = parse_recipe_filters(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # The body is produced after this view returns, so the stream checks out
+    # its own connection instead of the request's and returns it when closed
+    conn = db_pool.acquire()
+    try:
+        ensure_schema(conn)
+        cursor = recipe_export_cursor(conn, fields, filters)
+        version = RecipeCatalog.read_version(conn)
+    except Exception:
+        db_pool.release(conn)
+        raise
+    
+    body = ndjson_blocks(iter_recipe_chunks(conn, cursor, fields))
+    encoding = negotiate_encoding(['gzip'])
+    if encoding:
+        body = gzip_blocks(body)
     
-    return jsonify([format_recipe(recipe) for recipe in recipes])
+    response = app.response_class(body, mimetype='application/x-ndjson')
+    response.call_on_close(lambda: db_pool.release(conn))
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.headers['Content-Disposition'] = f'attachment; filename=recipes-v{version or 0}.ndjson'
+    response.headers['X-Catalog-Version'] = str(version or 0)
+    response.cache_control.no_store = True
+    return response
 
 @app.route('/api/search')
 def search_recipes():
@@ -2413,59 +2442,191 @@ def search_recipes():
     if not query:
         return get_all_recipes()
     
+    try:
+        fields, paginated, limit, after = parse_listing_args(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    match = build_fts_query(query)
+    if not match:
+        return jsonify({'recipes': [], 'next_cursor': None} if paginated else [])
+    
     conn = get_db_connection()
-    recipes = conn.execute('''
-        SELECT * FROM recipes 
-        WHERE LOWER(name) LIKE ? 
-           OR LOWER(country) LIKE ? 
-           OR LOWER(origin) LIKE ?
-           OR LOWER(cuisine_type) LIKE ?
-           OR LOWER(description) LIKE ?
-           OR LOWER(ingredients) LIKE ?
-        ORDER BY name
-    ''', (f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%')).fetchall()
-    conn.close()
-    
-    return jsonify([format_recipe(recipe) for recipe in recipes])
+    weights = ', '.join(str(w) for w in RECIPE_FTS_WEIGHTS)
+    try:
+        # BM25-ranked full-text search; lower bm25() scores are better matches,
+        # and pages are keyed on (rank, id) so they stay in relevance order
+        columns = ', '.join(f'r.{column}' for column in select_columns(fields))
+        sql = f'''
+            SELECT * FROM (
+                SELECT {columns}, bm25(recipes_fts, {weights}) AS rank
+                FROM recipes_fts
+                JOIN recipes r ON r.id = recipes_fts.rowid
+                WHERE recipes_fts MATCH ?
+            )
+        '''
+        params = [match]
+        sort_key = lambda row: [row['rank'], row['id']]
+        if after:
+            sql += ' WHERE (rank, id) > (?, ?)'
+            params += after
+        sql += ' ORDER BY rank, id'
+        if paginated:
+            sql += ' LIMIT ?'
+            params.append(limit + 1)
+        recipes = conn.execute(sql, params).fetchall()
+    except sqlite3.OperationalError:
+        # Search index not built yet (init_database() has not run on this file)
+        columns = ', '.join(select_columns(fields, ('name',)))
+        sql = f'''
+            SELECT {columns} FROM recipes 
+            WHERE (LOWER(name) LIKE ? 
+               OR LOWER(country) LIKE ? 
+               OR LOWER(origin) LIKE ?
+               OR LOWER(cuisine_type) LIKE ?
+               OR LOWER(description) LIKE ?
+               OR id IN (SELECT recipe_id FROM recipe_ingredients WHERE LOWER(text) LIKE ?))
+        '''
+        params = [f'%{query}%'] * 6
+        sort_key = lambda row: [row['name'], row['id']]
+        if after:
+            sql += ' AND (name, id) > (?, ?)'
+            params += after
+        sql += ' ORDER BY name, id'
+        if paginated:
+            sql += ' LIMIT ?'
+            params.append(limit + 1)
+        recipes = conn.execute(sql, params).fetchall()
+    
+    if paginated:
+        return recipe_page(conn, recipes, fields, limit, sort_key)
+    return jsonify(format_recipe_rows(conn, recipes, fields))
 
 @app.route('/api/surprise')
 def surprise_recipes():
-    """Get 6 random recipes"""
-    conn = get_db_connection()
-    recipes = conn.execute('SELECT * FROM recipes ORDER BY RANDOM() LIMIT 6').fetchall()
-    conn.close()
+    """Get random recipes (6 by default), optionally narrowed by the same facet filters as /api/recipes"""
+    try:
+        count = int(request.args.get('count', SURPRISE_COUNT))
+        seed = int(request.args['seed']) if 'seed' in request.args else None
+    except ValueError:
+        return jsonify({'error': 'count and seed must be integers'}), 400
+    if not 1 <= count <= MAX_SURPRISE_COUNT:
+        return jsonify({'error': f'count must be between 1 and {MAX_SURPRISE_COUNT}'}), 400
+    try:
+        filters = parse_recipe_filters(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    catalog = get_catalog()
+    recipe_ids = catalog['sampler'].sample(count, filters, seed)
+    
+    return jsonify([recipe_to_dict(catalog['by_id'][recipe_id]) for recipe_id in recipe_ids])
+
+@app.route('/api/pantry')
+def pantry_recipes():
+    """Recipes ranked by how much of their ingredient list a pantry covers"""
+    items = [
+        item.strip()
+        for value in request.args.getlist('ingredients')
+        for item in value.split(',')
+        if item.strip()
+    ]
+    if not items:
+        return jsonify({'error': 'ingredients is required, e.g. ?ingredients=chicken,rice,garlic'}), 400
+    if len(items) > MAX_PANTRY_ITEMS:
+        return jsonify({'error': f'At most {MAX_PANTRY_ITEMS} ingredients are supported'}), 400
+    
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        max_missing = request.args.get('max_missing')
+        max_missing = int(max_missing) if max_missing is not None else None
+    except ValueError:
+        return jsonify({'error': 'limit and max_missing must be integers'}), 400
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+    
+    results, unrecognized = get_catalog()['pantry'].match(items, limit, max_missing)
+    recipes = []
+    for recipe, coverage, matched, missing in results:
+        data = recipe_to_dict(recipe, RECIPE_CARD_FIELDS)
+        data['coverage'] = round(coverage, 3)
+        data['matched_count'] = matched
+        data['missing_count'] = len(missing)
+        data['missing_ingredients'] = missing
+        recipes.append(data)
     
-    return jsonify([format_recipe(recipe) for recipe in recipes])
+    return jsonify({'recipes': recipes, 'unrecognized': unrecognized})
 
 @app.route('/api/recipe/<int:recipe_id>')
 def get_recipe_details(recipe_id):
     """Get detailed information for a specific recipe"""
-    conn = get_db_connection()
-    recipe = conn.execute('SELECT * FROM recipes WHERE id = ?', (recipe_id,)).fetchone()
-    conn.close()
+    catalog = get_catalog()
+    recipe = catalog['by_id'].get(recipe_id)
     
     if recipe:
-        return jsonify(format_recipe(recipe))
+        return catalog_response(catalog, ('recipe', recipe_id), lambda: recipe_to_dict(recipe))
     else:
         return jsonify({'error': 'Recipe not found'}), 404
 
+@app.route('/api/recipe/<int:recipe_id>/similar')
+def get_similar_recipes(recipe_id):
+    """Recipes closest to this one by ingredients, cuisine, origin and diet"""
+    try:
+        limit = int(request.args.get('limit', SIMILAR_COUNT))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    if not 1 <= limit <= SIMILARITY_TOP_K:
+        return jsonify({'error': f'limit must be between 1 and {SIMILARITY_TOP_K}'}), 400
+    
+    catalog = get_catalog()
+    if recipe_id not in catalog['by_id']:
+        return jsonify({'error': 'Recipe not found'}), 404
+    
+    def build():
+        table = get_similarity_table(catalog)
+        similar = []
+        for neighbour_id, score in similar_recipes.neighbours(table, recipe_id, limit):
+            recipe = catalog['by_id'].get(neighbour_id)
+            if recipe:
+                data = recipe_to_dict(recipe, RECIPE_CARD_FIELDS)
+                data['similarity'] = score
+                similar.append(data)
+        return {'recipe_id': recipe_id, 'similar': similar}
+    
+    return catalog_response(catalog, ('similar', recipe_id, limit), build)
+
 @app.route('/api/countries')
 def get_countries():
     """Get list of all countries represented in recipes"""
-    conn = get_db_connection()
-    countries = conn.execute('SELECT DISTINCT country FROM recipes ORDER BY country').fetchall()
-    conn.close()
-    
-    return jsonify([country['country'] for country in countries])
+    catalog = get_catalog()
+    return catalog_response(catalog, 'countries', lambda: list(catalog['countries']))
 
 @app.route('/api/cuisines')
 def get_cuisines():
     """Get list of all cuisine types represented in recipes"""
-    conn = get_db_connection()
-    cuisines = conn.execute('SELECT DISTINCT cuisine_type FROM recipes ORDER BY cuisine_type').fetchall()
-    conn.close()
-    
-    return jsonify([cuisine['cuisine_type'] for cuisine in cuisines])
+    catalog = get_catalog()
+    return catalog_response(catalog, 'cuisines', lambda: list(catalog['cuisines']))
+
+@app.route('/api/health')
+def health_check():
+    """Report database health and connection pool statistics"""
+    healthy = db_pool.check_health()
+    return jsonify({
+        'status': 'ok' if healthy else 'degraded',
+        'database': {
+            'healthy': healthy,
+            'pool': db_pool.stats(),
+            'storage_profile': read_storage_profile(get_db_connection()),
+            'checkpoints': {
+                'count': wal_checkpointer.checkpoints,
+                'last': wal_checkpointer.last_result
+            }
+        },
+        'password_hashing': password_executor.stats(),
+        'similarity_index': similar_recipes.last_refresh,
+        'recommendation_model': recommendation_model.stats(),
+        'oauth_providers': {host: breaker.stats() for host, breaker in oauth_breakers.items()}
+    }), 200 if healthy else 503
 
 # Authentication decorator
 def require_auth(f):
@@ -2479,6 +2640,62 @@ def require_auth(f):
 
 
 # Rating System Endpoints
+RATING_SUMMARY_TTL = float(os.getenv('RATING_SUMMARY_TTL', 10))
+MAX_SUMMARY_IDS = 1000
+RATING_RECIPE_TYPES = ('regular', 'ai')
+
+
+class RatingSummaryCache:
+    """Per-worker copy of recipe_rating_stats, refreshed at most every ``ttl`` seconds"""
+
+    def __init__(self, ttl=RATING_SUMMARY_TTL):
+        self.ttl = ttl
+        self._snapshots = {}
+
+    def get(self, conn, recipe_type='regular'):
+        """Map of recipe_id -> {'average', 'count'} for every rated recipe"""
+        cached = self._snapshots.get(recipe_type)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.ttl:
+            return cached[1]
+        
+        summaries = {
+            row['recipe_id']: {
+                'average': round(row['rating_sum'] / row['rating_count'], 1),
+                'count': row['rating_count']
+            }
+            for row in conn.execute('''
+                SELECT recipe_id, rating_count, rating_sum
+                FROM recipe_rating_stats
+                WHERE recipe_type = ? AND rating_count > 0
+            ''', (recipe_type,))
+        }
+        self._snapshots[recipe_type] = (now, summaries)
+        return summaries
+
+    def invalidate(self):
+        """Drop all snapshots so this worker sees its own writes immediately"""
+        self._snapshots = {}
+
+
+rating_summaries = RatingSummaryCache()
+
+def get_rating_stats(conn, recipe_id, recipe_type='regular'):
+    """Rating summary for one recipe from the materialized recipe_rating_stats row"""
+    stats = conn.execute('''
+        SELECT rating_count, rating_sum, stars_1, stars_2, stars_3, stars_4, stars_5
+        FROM recipe_rating_stats
+        WHERE recipe_id = ? AND recipe_type = ?
+    ''', (recipe_id, recipe_type)).fetchone()
+    
+    if not stats or not stats['rating_count']:
+        return {'average_rating': None, 'total_ratings': 0, 'histogram': [0, 0, 0, 0, 0]}
+    return {
+        'average_rating': round(stats['rating_sum'] / stats['rating_count'], 1),
+        'total_ratings': stats['rating_count'],
+        'histogram': [stats[f'stars_{star}'] for star in range(1, 6)]
+    }
+
 @app.route('/api/rate-recipe', methods=['POST'])
 @require_auth
 def rate_recipe_frontend():
@@ -2488,11 +2705,16 @@ def rate_recipe_frontend():
     if not data or 'recipe_id' not in data or 'rating' not in data:
         return jsonify({'error': 'Recipe ID and rating are required'}), 400
     
-    recipe_id = data['recipe_id']
     rating = data['rating']
     review_text = data.get('review', '').strip()
     recipe_type = 'regular'  # Only handle regular recipes
     
+    # Store recipe_id as an integer, like /api/ratings/<recipe_id> does
+    try:
+        recipe_id = int(data['recipe_id'])
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Recipe ID must be an integer'}), 400
+    
     # Validate rating
     if not isinstance(rating, int) or rating < 1 or rating > 5:
         return jsonify({'error': 'Rating must be between 1 and 5'}), 400
@@ -2506,7 +2728,6 @@ def rate_recipe_frontend():
     ).fetchone()
     
     if not recipe_exists:
-        conn.close()
         return jsonify({'error': 'Recipe not found'}), 404
     
     try:
@@ -2518,30 +2739,21 @@ def rate_recipe_frontend():
             rating = excluded.rating,
             review_text = excluded.review_text,
             updated_at = CURRENT_TIMESTAMP
-        ''', (str(recipe_id), recipe_type, session['user_id'], rating, review_text))
+        ''', (recipe_id, recipe_type, session['user_id'], rating, review_text))
         
+        # Read the aggregates maintained by the recipe_ratings triggers before committing
+        rating_stats = get_rating_stats(conn, recipe_id, recipe_type)
         conn.commit()
-        
-        # Get updated statistics
-        rating_stats = conn.execute('''
-            SELECT 
-                AVG(rating) as average_rating,
-                COUNT(*) as rating_count
-            FROM recipe_ratings 
-            WHERE recipe_id = ? AND recipe_type = ?
-        ''', (str(recipe_id), recipe_type)).fetchone()
-        
-        conn.close()
+        rating_summaries.invalidate()
         
         return jsonify({
             'success': True,
             'message': 'Rating saved successfully',
-            'average_rating': round(rating_stats['average_rating'], 1) if rating_stats['average_rating'] else rating,
-            'rating_count': rating_stats['rating_count']
+            'average_rating': rating_stats['average_rating'] or rating,
+            'rating_count': rating_stats['total_ratings']
         })
         
     except Exception as e:
-        conn.close()
         print(f"Rating error: {e}")
         return jsonify({'error': 'Failed to save rating'}), 500
 
@@ -2571,7 +2783,6 @@ def rate_recipe(recipe_id):
     ).fetchone()
     
     if not recipe_exists:
-        conn.close()
         return jsonify({'error': 'Recipe not found'}), 404
     
     try:
@@ -2586,7 +2797,7 @@ def rate_recipe(recipe_id):
         ''', (recipe_id, recipe_type, session['user_id'], rating, review_text))
         
         conn.commit()
-        conn.close()
+        rating_summaries.invalidate()
         
         return jsonify({
             'success': True,
@@ -2594,9 +2805,43 @@ def rate_recipe(recipe_id):
         })
         
     except Exception as e:
-        conn.close()
         return jsonify({'error': 'Failed to save rating'}), 500
 
+@app.route('/api/ratings/summary')
+def get_rating_summaries():
+    """Rating summaries for many recipes plus the caller's own ratings in one round trip"""
+    recipe_type = request.args.get('recipe_type', 'regular')
+    ids_param = request.args.get('ids', 'all')
+    if recipe_type not in RATING_RECIPE_TYPES:
+        return jsonify({'error': "recipe_type must be 'regular' or 'ai'"}), 400
+    
+    recipe_ids = None
+    if ids_param != 'all':
+        try:
+            recipe_ids = {int(recipe_id) for recipe_id in ids_param.split(',') if recipe_id.strip()}
+        except ValueError:
+            return jsonify({'error': "ids must be a comma-separated list of integers or 'all'"}), 400
+        if len(recipe_ids) > MAX_SUMMARY_IDS:
+            return jsonify({'error': f'At most {MAX_SUMMARY_IDS} ids per request'}), 400
+    
+    conn = get_db_connection()
+    summaries = rating_summaries.get(conn, recipe_type)
+    if recipe_ids is not None:
+        summaries = {recipe_id: summaries[recipe_id] for recipe_id in recipe_ids if recipe_id in summaries}
+    
+    user_ratings = {}
+    if 'user_id' in session:
+        rows = conn.execute('''
+            SELECT recipe_id, rating FROM recipe_ratings
+            WHERE user_id = ? AND recipe_type = ?
+        ''', (session['user_id'], recipe_type)).fetchall()
+        user_ratings = {
+            row['recipe_id']: row['rating'] for row in rows
+            if recipe_ids is None or row['recipe_id'] in recipe_ids
+        }
+    
+    return jsonify({'ratings': summaries, 'user_ratings': user_ratings})
+
 @app.route('/api/ratings/<int:recipe_id>')
 def get_recipe_ratings(recipe_id):
     """Get ratings and reviews for a recipe"""
@@ -2605,13 +2850,7 @@ def get_recipe_ratings(recipe_id):
     conn = get_db_connection()
     
     # Get average rating and count
-    rating_stats = conn.execute('''
-        SELECT 
-            AVG(rating) as average_rating,
-            COUNT(*) as total_ratings
-        FROM recipe_ratings 
-        WHERE recipe_id = ? AND recipe_type = ?
-    ''', (recipe_id, recipe_type)).fetchone()
+    rating_stats = get_rating_stats(conn, recipe_id, recipe_type)
     
     # Get individual reviews
     reviews = conn.execute('''
@@ -2637,11 +2876,11 @@ def get_recipe_ratings(recipe_id):
             WHERE recipe_id = ? AND recipe_type = ? AND user_id = ?
         ''', (recipe_id, recipe_type, session['user_id'])).fetchone()
     
-    conn.close()
     
     return jsonify({
-        'average_rating': round(rating_stats['average_rating'], 1) if rating_stats['average_rating'] else None,
+        'average_rating': rating_stats['average_rating'],
         'total_ratings': rating_stats['total_ratings'],
+        'histogram': rating_stats['histogram'],
         'user_rating': {
             'rating': user_rating['rating'],
             'review': user_rating['review_text']
@@ -2677,7 +2916,6 @@ def get_user_ratings():
         ORDER BY rr.created_at DESC
     ''', (session['user_id'],)).fetchall()
     
-    conn.close()
     
     return jsonify([
         {
@@ -2691,6 +2929,84 @@ def get_user_ratings():
         for rating in ratings
     ])
 
+# Personalized recommendations from factors trained by train_recommendations.py
+RECOMMENDATION_MODEL_PATH = os.getenv(
+    'RECOMMENDATION_MODEL_PATH', os.path.join(os.path.dirname(DB_PATH), 'recommendations.npz')
+)
+RECOMMENDATION_COUNT = 12
+MAX_RECOMMENDATION_COUNT = 48
+# Prior weight, in ratings, pulling a recipe's popularity toward the global average
+POPULARITY_PRIOR = 3
+
+recommendation_model = RecommendationModel(RECOMMENDATION_MODEL_PATH)
+
+def preference_recommendations(conn, catalog, cuisine_preferences, limit, exclude):
+    """Cold-start ranking: recipes matching the user's cuisines first, then by smoothed rating"""
+    stats = {
+        row['recipe_id']: (row['rating_sum'], row['rating_count'])
+        for row in conn.execute(
+            "SELECT recipe_id, rating_sum, rating_count FROM recipe_rating_stats WHERE recipe_type = 'regular'"
+        )
+    }
+    total_sum = sum(rating_sum for rating_sum, _ in stats.values())
+    total_count = sum(count for _, count in stats.values())
+    prior = total_sum / total_count if total_count else 3.0
+    terms = preference_terms(cuisine_preferences)
+    
+    def rank(recipe):
+        rating_sum, count = stats.get(recipe.id, (0, 0))
+        score = (rating_sum + POPULARITY_PRIOR * prior) / (count + POPULARITY_PRIOR)
+        haystack = f'{recipe.cuisine_type} {recipe.country} {recipe.origin}'.lower()
+        matches = any(term in haystack for term in terms)
+        return (not matches, -score, recipe.name), round(score, 3)
+    
+    ranked = sorted((rank(recipe), recipe.id) for recipe in catalog['recipes'] if recipe.id not in exclude)
+    return [(recipe_id, score) for (_, score), recipe_id in ranked[:limit]]
+
+@app.route('/api/recommendations')
+@require_auth
+def get_recommendations():
+    """Recipes for the signed-in user from collaborative filtering, or their cuisine preferences"""
+    try:
+        limit = int(request.args.get('limit', RECOMMENDATION_COUNT))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    if not 1 <= limit <= MAX_RECOMMENDATION_COUNT:
+        return jsonify({'error': f'limit must be between 1 and {MAX_RECOMMENDATION_COUNT}'}), 400
+    
+    user_id = session['user_id']
+    conn = get_db_connection()
+    catalog = get_catalog()
+    rated = {
+        row[0] for row in conn.execute(
+            "SELECT recipe_id FROM recipe_ratings WHERE user_id = ? AND recipe_type = 'regular'",
+            (user_id,)
+        )
+    }
+    
+    picks = recommendation_model.recommend(conn, user_id, limit, exclude=rated) or []
+    picks = [(recipe_id, score) for recipe_id, score in picks if recipe_id in catalog['by_id']]
+    source = 'collaborative' if picks else None
+    
+    if len(picks) < limit:
+        # Cold start, or too few unseen recipes in the model: fill from preferences
+        user = conn.execute('SELECT cuisine_preferences FROM users WHERE id = ?', (user_id,)).fetchone()
+        preferences = user['cuisine_preferences'] if user else ''
+        chosen = rated | {recipe_id for recipe_id, _ in picks}
+        picks += preference_recommendations(conn, catalog, preferences, limit - len(picks), chosen)
+        source = source or ('cuisine_preferences' if preference_terms(preferences) else 'popular')
+    
+    recipes = []
+    for recipe_id, score in picks:
+        data = recipe_to_dict(catalog['by_id'][recipe_id], RECIPE_CARD_FIELDS)
+        data['score'] = score
+        recipes.append(data)
+    
+    response = jsonify({'source': source, 'recipes': recipes})
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
 
 if __name__ == '__main__':
     # Initialize database on startup
@@ -0,0 +1,137 @@
+"""
+Ingredient normalization and pantry matching for Recipe Recommender
+Ingredient lines such as "2 cups white cornmeal flour (maize flour)" are
+reduced to normalized words ("white cornmeal flour"). A PantryIndex keeps a
+posting list of ingredient lines per word, so matching a pantry against the
+catalog is a handful of sorted-array intersections and one bincount.
+"""
+
+import re
+from functools import reduce
+
+import numpy as np
+
+MEASURE_WORDS = frozenset((
+    'cup', 'cups', 'tbsp', 'tsp', 'tablespoon', 'tablespoons', 'teaspoon', 'teaspoons',
+    'kg', 'ml', 'cm', 'inch', 'lb', 'lbs', 'oz', 'pinch', 'dash', 'handful', 'bunch',
+    'piece', 'pieces', 'slice', 'slices', 'can', 'cans', 'packet', 'litre', 'liter',
+))
+PREPARATION_WORDS = frozenset((
+    'and', 'or', 'of', 'to', 'for', 'the', 'with', 'into', 'taste', 'serving', 'optional',
+    'fresh', 'large', 'medium', 'small', 'chopped', 'minced', 'sliced', 'diced', 'cubed',
+    'grated', 'thinly', 'finely', 'roughly', 'julienned', 'quartered', 'cut', 'wedges',
+    'cubes', 'melted', 'warm', 'cooked', 'peeled', 'crushed', 'beaten', 'frying', 'purpose',
+    'all', 'wash',
+))
+# Assumed to be in every kitchen, so they never count as missing
+PANTRY_STAPLES = ('water',)
+WORD_RE = re.compile(r'[a-z]+')
+PARENTHESES_RE = re.compile(r'\([^)]*\)')
+
+
+def singular(word):
+    """Cheap plural folding so 'tomatoes' and 'tomato' share a term"""
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith('oes') and len(word) > 4:
+        return word[:-2]
+    if word.endswith('s') and not word.endswith('ss') and len(word) > 3:
+        return word[:-1]
+    return word
+
+
+def ingredient_words(line):
+    """Normalized words of one ingredient line, in order, without quantities or preparation"""
+    words = []
+    for word in WORD_RE.findall(PARENTHESES_RE.sub(' ', line.lower())):
+        if len(word) > 2 and word not in MEASURE_WORDS and word not in PREPARATION_WORDS:
+            word = singular(word)
+            if word not in words:
+                words.append(word)
+    return words
+
+
+def ingredient_terms(ingredients):
+    """Distinct normalized words across a recipe's ingredient lines"""
+    terms = set()
+    for line in ingredients:
+        terms.update(ingredient_words(line))
+    return terms
+
+
+class PantryIndex:
+    """Inverted index from normalized ingredient words to ingredient lines of the catalog"""
+
+    def __init__(self, recipes):
+        self.recipes = recipes
+        line_counts = np.fromiter((len(recipe.ingredients) for recipe in recipes),
+                                  dtype=np.int64, count=len(recipes))
+        self.line_counts = line_counts
+        self.line_starts = np.concatenate(([0], np.cumsum(line_counts)[:-1])).astype(np.int64)
+        self.line_recipe = np.repeat(np.arange(len(recipes)), line_counts)
+
+        postings = {}
+        line = 0
+        for recipe in recipes:
+            for text in recipe.ingredients:
+                for word in ingredient_words(text):
+                    postings.setdefault(word, []).append(line)
+                line += 1
+        self.postings = {word: np.array(lines, dtype=np.int64) for word, lines in postings.items()}
+        self.staple_lines = self._lines_for(PANTRY_STAPLES)
+
+    @property
+    def vocabulary_size(self):
+        return len(self.postings)
+
+    def item_lines(self, item):
+        """Sorted line ids mentioning every word of ``item``, or None if a word is unknown"""
+        words = ingredient_words(item)
+        if not words or any(word not in self.postings for word in words):
+            return None
+        return reduce(np.intersect1d, (self.postings[word] for word in words))
+
+    def _lines_for(self, items):
+        lines = [found for found in map(self.item_lines, items) if found is not None]
+        return np.unique(np.concatenate(lines)) if lines else np.empty(0, dtype=np.int64)
+
+    def match(self, items, limit, max_missing=None):
+        """Rank recipes by the share of their ingredient lines the pantry covers
+
+        Returns (results, unrecognized) where each result is
+        (recipe, coverage, matched, missing_lines).
+        """
+        found, unrecognized = [], []
+        for item in items:
+            lines = self.item_lines(item)
+            if lines is None:
+                unrecognized.append(item)
+            else:
+                found.append(lines)
+        if not found:
+            return [], unrecognized
+
+        pantry_lines = np.unique(np.concatenate(found))
+        covered_lines = np.union1d(pantry_lines, self.staple_lines)
+        size = len(self.recipes)
+        touched = np.bincount(self.line_recipe[pantry_lines], minlength=size)
+        covered = np.bincount(self.line_recipe[covered_lines], minlength=size)
+        missing = self.line_counts - covered
+
+        candidates = np.flatnonzero(touched > 0)
+        if max_missing is not None:
+            candidates = candidates[missing[candidates] <= max_missing]
+        coverage = covered[candidates] / np.maximum(self.line_counts[candidates], 1)
+        # Best coverage, then fewest missing; the catalog is name-ordered, so row breaks ties
+        order = np.lexsort((candidates, missing[candidates], -coverage))[:limit]
+
+        results = []
+        for position in order:
+            row = candidates[position]
+            start = self.line_starts[row]
+            lines = np.arange(start, start + self.line_counts[row])
+            absent = lines[~np.isin(lines, covered_lines)] - start
+            recipe = self.recipes[row]
+            results.append((recipe, float(coverage[position]), int(covered[row]),
+                            [recipe.ingredients[i] for i in absent]))
+        return results, unrecognized
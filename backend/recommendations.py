@@ -0,0 +1,214 @@
+"""
+Collaborative-filtering recommendations for Recipe Recommender
+An offline job factorizes the sparse user x recipe rating matrix with
+alternating least squares and saves the factors; the web app loads them and
+ranks recipes for a user with one matrix-vector product and a partial sort.
+Users the model has never seen fall back to their cuisine preferences.
+A model records the catalog version and user count it was trained on and is
+ignored by a database it does not describe.
+"""
+
+import os
+import time
+import threading
+
+import numpy as np
+
+DEFAULT_FACTORS = 16
+DEFAULT_ITERATIONS = 12
+DEFAULT_REGULARIZATION = 0.1
+# Pseudo-ratings pulling a recipe's bias toward zero when it has few ratings
+BIAS_DAMPING = 5
+# Ratings folded into each outer-product chunk when building Gram matrices
+GRAM_CHUNK = 65536
+
+# Signup offers broad cuisine tags; these widen them to the countries and
+# regions that recipes actually carry
+PREFERENCE_ALIASES = {
+    'asian': ('china', 'chinese', 'japan', 'korea', 'thai', 'vietnam', 'indonesia',
+              'malaysia', 'philippin', 'singapore'),
+    'mediterranean': ('italy', 'italian', 'greece', 'greek', 'spain', 'spanish', 'turkey',
+                      'turkish', 'lebanon', 'lebanese', 'morocco', 'moroccan', 'middle east'),
+    'american': ('united states', 'american', 'canada', 'canadian', 'mexico', 'brazil'),
+}
+
+
+def load_ratings(conn):
+    """(user_ids, recipe_ids, ratings) arrays for every rating of a catalog recipe"""
+    rows = conn.execute('''
+        SELECT user_id, recipe_id, rating FROM recipe_ratings
+        WHERE recipe_type = 'regular'
+          AND recipe_id IN (SELECT id FROM recipes)
+    ''').fetchall()
+    if not rows:
+        return (np.empty(0, np.int64),) * 2 + (np.empty(0, np.float32),)
+    data = np.array([tuple(row) for row in rows], dtype=np.float64)
+    return data[:, 0].astype(np.int64), data[:, 1].astype(np.int64), data[:, 2].astype(np.float32)
+
+
+def database_fingerprint(conn):
+    """(catalog_version, user_count) of the data a model is trained on or served against"""
+    version = conn.execute("SELECT value FROM catalog_meta WHERE key = 'catalog_version'").fetchone()
+    user_count = conn.execute('SELECT COUNT(*) FROM users').fetchone()[0]
+    return (int(version[0]) if version else 0), user_count
+
+
+def model_mismatch(model, fingerprint):
+    """Why ``model`` cannot serve a database with ``fingerprint``, or None if it can"""
+    if 'catalog_version' not in model:
+        return 'it predates catalog fingerprints'
+    catalog_version, user_count = fingerprint
+    if int(model['catalog_version']) != catalog_version:
+        return f"it was trained on catalog version {int(model['catalog_version'])}, not {catalog_version}"
+    # Sign-ups between trainings are expected; a database with fewer users than
+    # the model knows is a different database
+    if int(model['user_count']) > user_count:
+        return f"it knows {int(model['user_count'])} users but the database has {user_count}"
+    return None
+
+
+def solve_side(rows, cols, values, fixed, n_rows, regularization):
+    """Least-squares factors for every row given the other side's ``fixed`` factors"""
+    factors = fixed.shape[1]
+    gram = np.zeros((n_rows, factors, factors), dtype=np.float64)
+    rhs = np.zeros((n_rows, factors), dtype=np.float64)
+    for start in range(0, len(rows), GRAM_CHUNK):
+        chunk = slice(start, start + GRAM_CHUNK)
+        vectors = fixed[cols[chunk]]
+        np.add.at(gram, rows[chunk], vectors[:, :, None] * vectors[:, None, :])
+        np.add.at(rhs, rows[chunk], vectors * values[chunk, None])
+
+    # Weighted-lambda regularization: rows with more ratings get proportionally more
+    counts = np.bincount(rows, minlength=n_rows).astype(np.float64)
+    gram += (regularization * np.maximum(counts, 1))[:, None, None] * np.eye(factors)
+    return np.linalg.solve(gram, rhs[:, :, None])[:, :, 0].astype(np.float32)
+
+
+def train_als(user_ids, recipe_ids, ratings, factors=DEFAULT_FACTORS,
+              iterations=DEFAULT_ITERATIONS, regularization=DEFAULT_REGULARIZATION, seed=0):
+    """Factorize explicit ratings into user and recipe factors plus recipe biases"""
+    users, user_index = np.unique(user_ids, return_inverse=True)
+    recipes, recipe_index = np.unique(recipe_ids, return_inverse=True)
+
+    global_mean = float(ratings.mean()) if len(ratings) else 0.0
+    centered = ratings - global_mean
+    recipe_bias = (np.bincount(recipe_index, weights=centered, minlength=len(recipes)) /
+                   (np.bincount(recipe_index, minlength=len(recipes)) + BIAS_DAMPING)).astype(np.float32)
+    residuals = (centered - recipe_bias[recipe_index]).astype(np.float32)
+
+    rng = np.random.default_rng(seed)
+    user_factors = rng.normal(0, 0.1, (len(users), factors)).astype(np.float32)
+    recipe_factors = rng.normal(0, 0.1, (len(recipes), factors)).astype(np.float32)
+
+    for _ in range(iterations):
+        user_factors = solve_side(user_index, recipe_index, residuals, recipe_factors, len(users), regularization)
+        recipe_factors = solve_side(recipe_index, user_index, residuals, user_factors, len(recipes), regularization)
+
+    predictions = global_mean + recipe_bias[recipe_index] + np.einsum(
+        'ij,ij->i', user_factors[user_index], recipe_factors[recipe_index])
+    rmse = float(np.sqrt(np.mean((predictions - ratings) ** 2))) if len(ratings) else 0.0
+
+    return {
+        'user_ids': users.astype(np.int64),
+        'recipe_ids': recipes.astype(np.int64),
+        'user_factors': user_factors,
+        'recipe_factors': recipe_factors,
+        'recipe_bias': recipe_bias,
+        'global_mean': np.float32(global_mean),
+        'trained_at': np.float64(time.time()),
+        'rmse': np.float32(rmse),
+    }
+
+
+def save_model(model, path):
+    """Write the model atomically so serving workers never read a partial file"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        np.savez(f, **model)
+    os.replace(temp_path, path)
+
+
+def preference_terms(cuisine_preferences):
+    """Lower-cased match terms for a user's comma-separated cuisine preferences"""
+    terms = []
+    for preference in (cuisine_preferences or '').split(','):
+        preference = preference.strip().lower()
+        if preference:
+            terms.append(preference)
+            terms.extend(PREFERENCE_ALIASES.get(preference, ()))
+    return terms
+
+
+class RecommendationModel:
+    """Trained factors loaded from disk, reloaded when the training job replaces the file
+
+    Every ``check_interval`` seconds the file's mtime and the database's
+    fingerprint are checked again; a model trained on other data is not served.
+    """
+
+    def __init__(self, path, check_interval=30):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._loaded = None
+        self._model = None
+        self._mtime = None
+        self._mismatch = None
+        self._checked_at = 0.0
+
+    def get(self, conn):
+        """Current model dict, or None if none has been trained for this database"""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self._model
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                self._loaded = self._model = self._mtime = None
+                return None
+            if mtime != self._mtime:
+                with np.load(self.path) as data:
+                    model = {key: data[key] for key in data.files}
+                model['user_rows'] = {int(user_id): row for row, user_id in enumerate(model['user_ids'])}
+                self._loaded, self._mtime, self._mismatch = model, mtime, None
+                print(f"🤝 Loaded recommendation model: {len(model['user_ids'])} users, "
+                      f"{len(model['recipe_ids'])} recipes")
+
+            mismatch = model_mismatch(self._loaded, database_fingerprint(conn))
+            if mismatch and mismatch != self._mismatch:
+                print(f"⚠️  Ignoring the recommendation model because {mismatch}; retrain it")
+            self._mismatch = mismatch
+            self._model = None if mismatch else self._loaded
+        return self._model
+
+    def stats(self):
+        model = self._model
+        if model is None:
+            return None
+        return {
+            'users': len(model['user_ids']),
+            'recipes': len(model['recipe_ids']),
+            'factors': int(model['user_factors'].shape[1]),
+            'rmse': round(float(model['rmse']), 4),
+            'trained_at': float(model['trained_at']),
+        }
+
+    def recommend(self, conn, user_id, limit, exclude=()):
+        """[(recipe_id, predicted_rating), ...] for a known user, or None for a cold-start user"""
+        model = self.get(conn)
+        if model is None or user_id not in model['user_rows']:
+            return None
+
+        scores = model['global_mean'] + model['recipe_bias'] + \
+            model['recipe_factors'] @ model['user_factors'][model['user_rows'][user_id]]
+        if exclude:
+            scores[np.isin(model['recipe_ids'], np.fromiter(exclude, dtype=np.int64))] = -np.inf
+
+        limit = min(limit, len(scores))
+        top = np.argpartition(-scores, limit - 1)[:limit] if limit < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(model['recipe_ids'][i]), round(float(scores[i]), 3))
+                for i in top if np.isfinite(scores[i])]
@@ -0,0 +1,394 @@
+"""
+Content-based recipe similarity for Recipe Recommender
+Recipes are vectorized with TF-IDF over normalized ingredient words plus
+one-hot cuisine, origin and diet attributes, kept as sparse rows so memory
+grows with the number of terms rather than recipes x vocabulary. Each
+recipe's top-k neighbours are precomputed into a single structured .npy
+file per catalog version, which is memory-mapped so a request is a binary
+search and a slice.
+"""
+
+import os
+import glob
+import json
+import hashlib
+import threading
+import time
+
+import numpy as np
+
+try:
+    from backend.ingredients import ingredient_terms
+except ImportError:
+    from ingredients import ingredient_terms
+
+# Share of the similarity score that comes from ingredients (the rest is attributes)
+INGREDIENT_WEIGHT = 0.75
+# Patched tables keep scores from the IDF of the last full build, so once the
+# recipes added, changed or removed since then pass this fraction, rebuild
+REBUILD_FRACTION = 0.2
+# Rows scored per pass, further capped so a pass holds at most CHUNK_CELLS scores
+CHUNK_ROWS = 1024
+CHUNK_CELLS = 1 << 24
+# Terms in at least this share of recipes (diet flags, salt, ...) are also kept
+# as dense columns, within the CHUNK_CELLS budget, and scored with a matrix product
+DENSE_TERM_SHARE = 1 / 32
+
+
+def attribute_terms(recipe):
+    """Namespaced categorical features of a recipe"""
+    terms = {
+        f'cuisine:{recipe.cuisine_type.lower()}',
+        f'country:{recipe.country.lower()}',
+        f'origin:{recipe.origin.lower()}',
+        f'spice:{recipe.spice_level.lower()}',
+    }
+    for flag in ('is_vegan', 'is_vegetarian', 'is_gluten_free'):
+        if getattr(recipe, flag):
+            terms.add(f'diet:{flag[3:]}')
+    return terms
+
+
+def fingerprint(ingredients, attributes):
+    """64-bit digest of a recipe's features, used to find what changed between builds"""
+    text = '\n'.join(sorted(ingredients)) + '\0' + '\n'.join(sorted(attributes))
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def expand_ranges(starts, counts):
+    """Concatenation of range(start, start + count) for each pair"""
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(int(counts.sum()))
+
+
+def tfidf_block(term_sets):
+    """Row-normalized binary TF-IDF as (rows, cols, values) triples plus the vocabulary size"""
+    vocabulary = {}
+    rows, cols = [], []
+    for row, terms in enumerate(term_sets):
+        for term in terms:
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+
+    rows = np.array(rows, dtype=np.int64)
+    cols = np.array(cols, dtype=np.int64)
+    document_frequency = np.bincount(cols, minlength=len(vocabulary))
+    values = (np.log((1 + len(term_sets)) / (1 + document_frequency)) + 1)[cols].astype(np.float32)
+    norms = np.sqrt(np.bincount(rows, weights=values.astype(np.float64) ** 2, minlength=len(term_sets)))
+    values /= np.where(norms == 0, 1, norms)[rows].astype(np.float32)
+    return rows, cols, values, len(vocabulary)
+
+
+class SparseFeatures:
+    """Recipe feature rows in CSR form, with per-term postings for scoring rows against recipes"""
+
+    def __init__(self, rows, cols, values, n_rows):
+        self.n_rows = n_rows
+        order = np.argsort(rows, kind='stable')
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=n_rows))))
+        self.indices = cols[order]
+        self.data = values[order]
+
+        order = np.lexsort((rows, cols))
+        n_terms = int(cols.max()) + 1 if len(cols) else 0
+        self.postings_ptr = np.concatenate(([0], np.cumsum(np.bincount(cols, minlength=n_terms))))
+        self.postings = rows[order]
+        self.postings_data = values[order]
+
+        document_frequency = np.diff(self.postings_ptr)
+        common = np.flatnonzero(document_frequency >= DENSE_TERM_SHARE * n_rows)
+        common = common[np.argsort(-document_frequency[common], kind='stable')][:CHUNK_CELLS // max(n_rows, 1)]
+        self.dense_column = np.full(n_terms, -1, dtype=np.int64)
+        self.dense_column[common] = np.arange(len(common))
+        self.dense = np.zeros((n_rows, len(common)), dtype=np.float32)
+        for column, term in enumerate(common):
+            span = slice(self.postings_ptr[term], self.postings_ptr[term + 1])
+            self.dense[self.postings[span], column] = self.postings_data[span]
+
+    def dot(self, rows, targets=None):
+        """Dense scores of ``rows`` against every recipe (or only ``targets``, in that order)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        if targets is None:
+            position = None
+            scores = np.zeros((len(rows), self.n_rows), dtype=np.float32)
+        else:
+            position = np.full(self.n_rows, -1, dtype=np.int64)
+            position[targets] = np.arange(len(targets))
+            scores = np.zeros((len(rows), len(targets)), dtype=np.float32)
+
+        # Gather the (row, term, weight) entries of the requested rows. Common terms
+        # go through the dense columns; each remaining term adds one outer product
+        # over its postings
+        counts = self.indptr[rows + 1] - self.indptr[rows]
+        entries = expand_ranges(self.indptr[rows], counts)
+        local = np.repeat(np.arange(len(rows)), counts)
+        terms = self.indices[entries]
+        weights = self.data[entries]
+
+        dense_column = self.dense_column[terms]
+        in_dense = dense_column >= 0
+        if in_dense.any():
+            query = np.zeros((len(rows), self.dense.shape[1]), dtype=np.float32)
+            query[local[in_dense], dense_column[in_dense]] = weights[in_dense]
+            scores += query @ (self.dense if targets is None else self.dense[targets]).T
+            terms, local, weights = terms[~in_dense], local[~in_dense], weights[~in_dense]
+
+        order = np.argsort(terms, kind='stable')
+        terms, local, weights = terms[order], local[order], weights[order]
+
+        for group in np.split(np.arange(len(terms)), np.flatnonzero(np.diff(terms)) + 1):
+            if not len(group):
+                continue
+            term = terms[group[0]]
+            span = slice(self.postings_ptr[term], self.postings_ptr[term + 1])
+            columns, values = self.postings[span], self.postings_data[span]
+            if position is not None:
+                columns = position[columns]
+                values = values[columns >= 0]
+                columns = columns[columns >= 0]
+            scores[local[group][:, None], columns] += weights[group][:, None] * values
+        return scores
+
+
+def feature_matrix(recipes):
+    """Sparse feature rows whose dot products are the weighted ingredient/attribute cosine"""
+    ingredients = [ingredient_terms(recipe.ingredients) for recipe in recipes]
+    attributes = [attribute_terms(recipe) for recipe in recipes]
+    ingredient_rows, ingredient_cols, ingredient_values, width = tfidf_block(ingredients)
+    attribute_rows, attribute_cols, attribute_values, _ = tfidf_block(attributes)
+    matrix = SparseFeatures(
+        np.concatenate((ingredient_rows, attribute_rows)),
+        np.concatenate((ingredient_cols, attribute_cols + width)),
+        np.concatenate((ingredient_values * np.float32(np.sqrt(INGREDIENT_WEIGHT)),
+                        attribute_values * np.float32(np.sqrt(1 - INGREDIENT_WEIGHT)))),
+        len(recipes)
+    )
+    fingerprints = np.fromiter(
+        (fingerprint(i, a) for i, a in zip(ingredients, attributes)),
+        dtype=np.uint64, count=len(recipes)
+    )
+    return matrix, fingerprints
+
+
+def chunk_rows(width):
+    """Rows per scoring pass against ``width`` columns"""
+    return max(1, min(CHUNK_ROWS, CHUNK_CELLS // max(width, 1)))
+
+
+def top_k(scores, k):
+    """Column indices and values of the k highest scores in each row, best first"""
+    if scores.shape[1] > k:
+        columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        columns = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    values = np.take_along_axis(scores, columns, axis=1)
+    order = np.argsort(-values, axis=1, kind='stable')
+    return np.take_along_axis(columns, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+
+def index_dtype(k):
+    return np.dtype([
+        ('id', '<i4'),
+        ('fingerprint', '<u8'),
+        ('neighbours', '<i4', (k,)),
+        ('scores', '<f2', (k,)),
+    ])
+
+
+class SimilarityIndex:
+    """Top-k neighbour lists for the recipe catalog, persisted as recipes-v<version>.npy
+
+    A recipes-v<version>.json sidecar records how many recipes changed since
+    the last full build, so patches cannot drift further than REBUILD_FRACTION.
+    """
+
+    def __init__(self, directory, k=20):
+        self.directory = directory
+        self.k = k
+        self._lock = threading.Lock()
+        self._table = None
+        self._version = None
+        self._changes = None
+        self.last_refresh = None
+
+    def path_for(self, version):
+        return os.path.join(self.directory, f'recipes-v{version}.npy')
+
+    def _open(self, path):
+        table = np.load(path, mmap_mode='r')
+        if table.dtype != index_dtype(self.k):
+            return None
+        return table
+
+    def _read_changes(self, path):
+        """Recipes changed since the full build behind ``path``; unknown counts force a rebuild"""
+        try:
+            with open(path[:-len('.npy')] + '.json') as f:
+                return int(json.load(f)['changes_since_rebuild'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _latest_on_disk(self):
+        """Newest persisted table of any version and its change count, the base for a refresh"""
+        tables = []
+        for path in glob.glob(os.path.join(self.directory, 'recipes-v*.npy')):
+            try:
+                table = self._open(path)
+                if table is not None:
+                    tables.append((os.path.getmtime(path), table, self._read_changes(path)))
+            except (OSError, ValueError):
+                continue
+        if not tables:
+            return None, None
+        _, table, changes = max(tables, key=lambda item: item[0])
+        return table, changes
+
+    def ensure(self, recipes, version):
+        """Return the neighbour table for ``version``, loading or refreshing it if needed"""
+        if self._table is not None and self._version == version:
+            return self._table
+        with self._lock:
+            if self._table is not None and self._version == version:
+                return self._table
+
+            path = self.path_for(version)
+            table = None
+            if os.path.exists(path):
+                try:
+                    table = self._open(path)
+                    changes = self._read_changes(path)
+                except (OSError, ValueError):
+                    table = None
+            if table is None:
+                if self._table is not None:
+                    previous, previous_changes = self._table, self._changes
+                else:
+                    previous, previous_changes = self._latest_on_disk()
+                table, changes = self._refresh(recipes, version, previous, previous_changes)
+
+            self._table, self._version, self._changes = table, version, changes
+            return table
+
+    def _refresh(self, recipes, version, previous, previous_changes):
+        """Patch ``previous`` for the recipes that changed, or rebuild from scratch
+
+        Returns the table and the number of recipes changed since the last full build.
+        """
+        started = time.perf_counter()
+        recipes = sorted(recipes, key=lambda recipe: recipe.id)
+        ids = np.fromiter((recipe.id for recipe in recipes), dtype=np.int32, count=len(recipes))
+        matrix, fingerprints = feature_matrix(recipes)
+
+        table = np.zeros(len(recipes), dtype=index_dtype(self.k))
+        table['id'] = ids
+        table['fingerprint'] = fingerprints
+
+        changed = np.ones(len(recipes), dtype=bool)
+        mode = 'rebuilt'
+        changes = 0
+        if previous is not None and len(previous) and previous_changes is not None:
+            row = np.clip(np.searchsorted(previous['id'], ids), 0, len(previous) - 1)
+            present = previous['id'][row] == ids
+            kept = present & (previous['fingerprint'][row] == fingerprints)
+            # Added and changed recipes here, removed ones in the previous table
+            moved = int((~kept).sum()) + len(previous) - int(present.sum())
+            if previous_changes + moved <= REBUILD_FRACTION * max(len(recipes), 1):
+                changes = previous_changes + moved
+                mode = 'patched'
+                # A list naming a removed or changed recipe, or with empty slots,
+                # cannot be repaired by merging, so those rows are rescored in full
+                unchanged = np.flatnonzero(kept)
+                old_neighbours = np.asarray(previous['neighbours'][row[unchanged]])
+                stale_ids = np.setdiff1d(previous['id'], ids[unchanged])
+                invalid = (np.isin(old_neighbours, stale_ids) | (old_neighbours < 0)).any(axis=1)
+                changed = ~kept
+                changed[unchanged[invalid]] = True
+                self._patch_unchanged(table, matrix, previous, row, unchanged[~invalid], np.flatnonzero(~kept))
+
+        self._score_rows(table, matrix, np.flatnonzero(changed))
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(version)
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        # The sidecar goes first: a table found without one is treated as unknown and rebuilt
+        meta_path = path[:-len('.npy')] + '.json'
+        with open(temp_path, 'w') as f:
+            json.dump({'changes_since_rebuild': changes}, f)
+        os.replace(temp_path, meta_path)
+        with open(temp_path, 'wb') as f:
+            np.save(f, table)
+        os.replace(temp_path, path)
+        try:
+            mapped = self._open(path)
+        except OSError:
+            # Another worker already replaced it with a newer version
+            mapped = table
+        self._remove_older(path)
+
+        self.last_refresh = {
+            'version': version,
+            'mode': mode,
+            'recipes': len(recipes),
+            'rescored': int(changed.sum()),
+            'changes_since_rebuild': changes,
+            'ms': round((time.perf_counter() - started) * 1000, 1),
+        }
+        print(f"🧮 Similarity index {mode}: {self.last_refresh['rescored']}/{len(recipes)} recipes rescored")
+        return mapped, changes
+
+    def _score_rows(self, table, matrix, rows):
+        """Full neighbour search for ``rows`` against every recipe"""
+        k = self.k
+        step = chunk_rows(len(table))
+        for start in range(0, len(rows), step):
+            chunk = rows[start:start + step]
+            scores = matrix.dot(chunk)
+            scores[np.arange(len(chunk)), chunk] = -np.inf
+            columns, values = top_k(scores, k)
+            width = columns.shape[1]
+            neighbours = np.full((len(chunk), k), -1, dtype=np.int32)
+            padded = np.full((len(chunk), k), -np.inf, dtype=np.float32)
+            neighbours[:, :width] = table['id'][columns]
+            padded[:, :width] = values
+            neighbours[~np.isfinite(padded)] = -1
+            table['neighbours'][chunk] = neighbours
+            table['scores'][chunk] = padded
+
+    def _patch_unchanged(self, table, matrix, previous, row, unchanged, changed):
+        """Keep the still-valid old neighbours of ``unchanged`` rows, merging in the ``changed`` ones"""
+        old_neighbours = np.asarray(previous['neighbours'][row[unchanged]])
+        old_scores = np.asarray(previous['scores'][row[unchanged]], dtype=np.float32)
+
+        step = chunk_rows(len(changed) + self.k)
+        for start in range(0, len(unchanged), step):
+            chunk = slice(start, start + step)
+            rows = unchanged[chunk]
+            candidates = np.hstack((old_neighbours[chunk], np.broadcast_to(table['id'][changed], (len(rows), len(changed)))))
+            scores = np.hstack((old_scores[chunk], matrix.dot(rows, changed)))
+            columns, values = top_k(scores, self.k)
+            neighbours = np.take_along_axis(candidates, columns, axis=1).astype(np.int32)
+            neighbours[~np.isfinite(values)] = -1
+            table['neighbours'][rows] = neighbours
+            table['scores'][rows] = values
+
+    def _remove_older(self, keep):
+        keep_meta = keep[:-len('.npy')] + '.json'
+        for path in glob.glob(os.path.join(self.directory, 'recipes-v*.npy')) + \
+                glob.glob(os.path.join(self.directory, 'recipes-v*.json')):
+            if path not in (keep, keep_meta):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def neighbours(self, table, recipe_id, limit):
+        """[(recipe_id, score), ...] for the ``limit`` most similar recipes"""
+        row = int(np.searchsorted(table['id'], recipe_id))
+        if row >= len(table) or table['id'][row] != recipe_id:
+            return []
+        record = table[row]
+        return [
+            (int(neighbour), round(float(score), 4))
+            for neighbour, score in zip(record['neighbours'][:limit], record['scores'][:limit])
+            if neighbour >= 0 and score > 0
+        ]
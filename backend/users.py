@@ -0,0 +1,49 @@
+"""
+User data access for Recipe Recommender
+Each write is an upsert with RETURNING inside one transaction, so
+concurrent sign-ins for the same email cannot race on the UNIQUE constraint
+and callers get the stored row back without a second SELECT. Returning
+OAuth users are matched on (oauth_provider, oauth_id) through
+idx_users_oauth before their email is considered.
+"""
+
+
+def upsert_oauth_user(conn, email, first_name, last_name, provider, oauth_id, avatar_url=None):
+    """Find the user already linked to this provider identity, else create one or link the account with that email"""
+    with conn:
+        # The provider's id is stable; the email it reports may have changed since the account was linked
+        user = conn.execute(
+            '''UPDATE users SET avatar_url = ?
+               WHERE id = (SELECT id FROM users
+                           WHERE oauth_provider = ? AND oauth_id = ?
+                           ORDER BY id LIMIT 1)
+               RETURNING *''',
+            (avatar_url, provider, oauth_id)
+        ).fetchone()
+        if user is not None:
+            return user
+        return conn.execute(
+            '''INSERT INTO users (email, first_name, last_name, oauth_provider,
+                                  oauth_id, avatar_url, password_hash)
+               VALUES (?, ?, ?, ?, ?, ?, NULL)
+               ON CONFLICT (email) DO UPDATE SET
+                   oauth_provider = excluded.oauth_provider,
+                   oauth_id = excluded.oauth_id,
+                   avatar_url = excluded.avatar_url
+               RETURNING *''',
+            (email, first_name, last_name, provider, oauth_id, avatar_url)
+        ).fetchone()
+
+
+def create_password_user(conn, email, password_hash, first_name, last_name,
+                         cuisine_preferences='', newsletter_subscribed=0):
+    """Insert a password user; returns None if the email is already registered"""
+    with conn:
+        return conn.execute(
+            '''INSERT INTO users (email, password_hash, first_name, last_name,
+                                  cuisine_preferences, newsletter_subscribed)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT (email) DO NOTHING
+               RETURNING *''',
+            (email, password_hash, first_name, last_name, cuisine_preferences, newsletter_subscribed)
+        ).fetchone()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Recipe serialization micro-benchmark for Recipe Recommender
+Compares the per-recipe cost of the old row-to-dict formatter (key lookups
+and string splitting on every response) with building interned Recipe
+records once and serializing them through the precompiled serializers.
+The database is copied into memory first, so the benchmark never migrates or
+seeds the real one.
+"""
+
+import sys
+import os
+import sqlite3
+import argparse
+import timeit
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.app import (
+    DB_PATH, SEED_PATH, RECIPE_FIELDS, RECIPE_CARD_FIELDS, migrate_database, load_seed_recipes,
+    recipe_from_row, recipe_to_dict, row_serializer, select_columns
+)
+
+LEGACY_ROWS_SQL = '''
+    SELECT r.*,
+           (SELECT group_concat(text, '|') FROM (
+                SELECT text FROM recipe_ingredients WHERE recipe_id = r.id ORDER BY position)) AS ingredients,
+           (SELECT group_concat(text, '|') FROM (
+                SELECT text FROM recipe_steps WHERE recipe_id = r.id ORDER BY position)) AS steps
+    FROM recipes r ORDER BY r.name
+'''
+
+def format_recipe(row):
+    """The formatter every response used before Recipe records (kept here as the baseline)"""
+    return {
+        'id': row['id'],
+        'name': row['name'],
+        'country': row['country'],
+        'origin': row['origin'] if 'origin' in row.keys() else '',
+        'cuisine_type': row['cuisine_type'] if 'cuisine_type' in row.keys() else '',
+        'description': row['description'],
+        'image': row['image'],
+        'prep_time': row['prep_time'],
+        'difficulty': row['difficulty'],
+        'spice_level': row['spice_level'] if 'spice_level' in row.keys() else '',
+        'is_vegan': bool(row['is_vegan']) if 'is_vegan' in row.keys() else False,
+        'is_vegetarian': bool(row['is_vegetarian']) if 'is_vegetarian' in row.keys() else False,
+        'is_gluten_free': bool(row['is_gluten_free']) if 'is_gluten_free' in row.keys() else False,
+        'health_benefits': row['health_benefits'],
+        'ingredients': row['ingredients'].split('|') if row['ingredients'] else [],
+        'steps': row['steps'].split('|') if row['steps'] else []
+    }
+
+def open_benchmark_database():
+    """In-memory copy of the recipes database, migrated and seeded without touching the file"""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    if os.path.exists(DB_PATH):
+        source = sqlite3.connect(f'file:{DB_PATH}?mode=ro', uri=True)
+        source.backup(conn)
+        source.close()
+    migrate_database(conn)
+    if not conn.execute('SELECT COUNT(*) FROM recipes').fetchone()[0]:
+        load_seed_recipes(conn, SEED_PATH)
+    return conn
+
+def per_recipe_ns(func, items, repeat):
+    """Best-of-``repeat`` nanoseconds per item for ``func`` over ``items``"""
+    best = min(timeit.repeat(lambda: [func(item) for item in items], number=1, repeat=repeat))
+    return best / len(items) * 1e9
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure per-recipe serialization cost')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='timing rounds; the best round is reported (default: 200)')
+    args = parser.parse_args()
+
+    conn = open_benchmark_database()
+    legacy_rows = conn.execute(LEGACY_ROWS_SQL).fetchall()
+    records = [recipe_from_row(row, (row['ingredients'] or '').split('|'), (row['steps'] or '').split('|'))
+               for row in legacy_rows]
+    card_rows = conn.execute(f"SELECT {', '.join(select_columns(RECIPE_CARD_FIELDS))} FROM recipes ORDER BY name").fetchall()
+    conn.close()
+
+    assert [format_recipe(row) for row in legacy_rows] == [recipe_to_dict(record) for record in records]
+
+    serialize_card_row = row_serializer(RECIPE_CARD_FIELDS)
+    results = [
+        ('full recipe: format_recipe(row)', per_recipe_ns(format_recipe, legacy_rows, args.repeat)),
+        ('full recipe: recipe_to_dict(record)', per_recipe_ns(recipe_to_dict, records, args.repeat)),
+        ('card view:   recipe_to_dict(record, card)',
+         per_recipe_ns(lambda record: recipe_to_dict(record, RECIPE_CARD_FIELDS), records, args.repeat)),
+        ('card view:   row_serializer(card)(row)',
+         per_recipe_ns(lambda row: serialize_card_row(row, None), card_rows, args.repeat)),
+    ]
+
+    print(f"📊 Serializing {len(records)} recipes, best of {args.repeat} rounds\n")
+    baseline = results[0][1]
+    for label, ns in results:
+        print(f"   {label:<44} {ns:8.0f} ns/recipe  ({baseline / ns:4.1f}x)")
+
+    countries = {id(record.country) for record in records}
+    print(f"\n🧵 {len({record.country for record in records})} distinct countries held by {len(countries)} string objects")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Static asset build step for Recipe Recommender
+Writes content-hashed copies of everything under static/ into static/dist/,
+plus precompressed .gz and .br siblings that the Flask static route serves
+to clients which accept them.
+"""
+
+import os
+import gzip
+import json
+import shutil
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+
+# Formats that are already compressed gain nothing from gzip/brotli
+SKIP_COMPRESSION = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.woff', '.woff2', '.gz', '.br')
+HASH_LENGTH = 10
+
+def iter_source_files():
+    """Yield static/ paths (relative, forward slashes) excluding build output"""
+    for root, dirs, files in os.walk(STATIC_DIR):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != DIST_DIR)
+        for name in sorted(files):
+            if name.endswith(('.gz', '.br')):
+                continue
+            path = os.path.relpath(os.path.join(root, name), STATIC_DIR)
+            yield path.replace(os.sep, '/')
+
+def hashed_name(path, content):
+    """style.css -> style.<hash>.css"""
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    base, ext = os.path.splitext(path)
+    return f"{base}.{digest}{ext}"
+
+def write_compressed(full_path, content):
+    """Write .gz/.br siblings when they are actually smaller than the original"""
+    written = []
+    if full_path.endswith(SKIP_COMPRESSION):
+        return written
+
+    gz = gzip.compress(content, compresslevel=9, mtime=0)
+    if len(gz) < len(content):
+        with open(full_path + '.gz', 'wb') as f:
+            f.write(gz)
+        written.append('gz')
+
+    if brotli:
+        br = brotli.compress(content, quality=11)
+        if len(br) < len(content):
+            with open(full_path + '.br', 'wb') as f:
+                f.write(br)
+            written.append('br')
+    return written
+
+def build_static():
+    """Rebuild static/dist/ and the precompressed siblings of every asset"""
+    print("📦 Building static assets...")
+    if not brotli:
+        print("⚠️  brotli not installed - writing .gz files only")
+
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    manifest = {}
+
+    for path in iter_source_files():
+        source = os.path.join(STATIC_DIR, path)
+        with open(source, 'rb') as f:
+            content = f.read()
+
+        dist_path = 'dist/' + hashed_name(path, content)
+        target = os.path.join(STATIC_DIR, dist_path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(content)
+
+        write_compressed(source, content)
+        encodings = write_compressed(target, content)
+        manifest[path] = dist_path
+
+        suffix = f" (+{', '.join(encodings)})" if encodings else ''
+        print(f"✅ {path} -> {dist_path}{suffix}")
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"\n🎉 Built {len(manifest)} assets, manifest written to {os.path.relpath(MANIFEST_PATH)}")
+    return manifest
+
+if __name__ == "__main__":
+    build_static()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Password hash calibration for Recipe Recommender
+Benchmarks PBKDF2 on this host and recommends a PASSWORD_ITERATIONS value
+that keeps a single hash close to the target latency.
+"""
+
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.app import PASSWORD_ITERATIONS, calibrate_password_iterations
+
+def main():
+    parser = argparse.ArgumentParser(description='Pick a PBKDF2 cost for this host')
+    parser.add_argument('--target-ms', type=float, default=100,
+                        help='target time for one password hash in milliseconds (default: 100)')
+    args = parser.parse_args()
+
+    print(f"⏱️  Benchmarking PBKDF2-SHA256 for a {args.target_ms:.0f} ms target...")
+    iterations = calibrate_password_iterations(args.target_ms / 1000)
+
+    print(f"📊 Current PASSWORD_ITERATIONS: {PASSWORD_ITERATIONS}")
+    print(f"✅ Recommended PASSWORD_ITERATIONS: {iterations}")
+    print("\nSet it in the environment and restart; existing users are rehashed on their next login:")
+    print(f"   export PASSWORD_ITERATIONS={iterations}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Recipe catalog export for Recipe Recommender
+Streams the recipes table as newline-delimited JSON, one recipe per line in
+id order, reading the database in fixed-size chunks so memory stays flat
+however large the catalog is. The output is the bulk-dump format used for
+backups and data pipelines; a .gz output path is gzip-compressed.
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import argparse
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.app import (
+    DB_PATH, EXPORT_CHUNK_ROWS, RecipeCatalog, migrate_database, parse_recipe_fields, parse_recipe_filters,
+    recipe_export_cursor, iter_recipe_chunks, ndjson_blocks, gzip_blocks
+)
+
+def main():
+    parser = argparse.ArgumentParser(description='Export recipes as newline-delimited JSON')
+    parser.add_argument('--output', default='-',
+                        help='file to write, "-" for stdout; a .gz suffix enables gzip (default: -)')
+    parser.add_argument('--gzip', action='store_true', help='gzip-compress the output')
+    parser.add_argument('--view', default='full', choices=('full', 'card'),
+                        help='field set to export (default: full)')
+    parser.add_argument('--fields', help='comma-separated fields to export instead of a view')
+    parser.add_argument('--country', help='only export recipes from this country')
+    parser.add_argument('--cuisine-type', help='only export recipes of this cuisine type')
+    parser.add_argument('--chunk-rows', type=int, default=EXPORT_CHUNK_ROWS,
+                        help=f'rows read per chunk (default: {EXPORT_CHUNK_ROWS})')
+    args = parser.parse_args()
+
+    options = {'view': args.view}
+    if args.fields:
+        options['fields'] = args.fields
+    if args.country:
+        options['country'] = args.country
+    if args.cuisine_type:
+        options['cuisine_type'] = args.cuisine_type
+    try:
+        fields = parse_recipe_fields(options)
+        filters = parse_recipe_filters(options)
+    except ValueError as e:
+        parser.error(str(e))
+
+    to_stdout = args.output == '-'
+    compress = args.gzip or args.output.endswith('.gz')
+    # Progress goes to stderr when stdout carries the data
+    log = sys.stderr if to_stdout else sys.stdout
+
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    with redirect_stdout(log):
+        migrate_database(conn)
+    cursor = recipe_export_cursor(conn, fields, filters)
+    version = RecipeCatalog.read_version(conn)
+
+    exported = 0
+    def counted(chunks):
+        nonlocal exported
+        for chunk in chunks:
+            exported += len(chunk)
+            yield chunk
+
+    blocks = ndjson_blocks(counted(iter_recipe_chunks(conn, cursor, fields, args.chunk_rows)))
+    if compress:
+        blocks = gzip_blocks(blocks)
+
+    print(f"📤 Exporting catalog version {version or 0} from {os.path.relpath(DB_PATH)}...", file=log)
+    started = time.perf_counter()
+    out = sys.stdout.buffer if to_stdout else open(args.output, 'wb')
+    written = 0
+    try:
+        for block in blocks:
+            out.write(block)
+            written += len(block)
+    finally:
+        if not to_stdout:
+            out.close()
+        conn.close()
+
+    target = 'stdout' if to_stdout else os.path.relpath(args.output)
+    print(f"✅ Exported {exported} recipes ({written / 1024:.1f} KiB{', gzip' if compress else ''}) "
+          f"to {target} in {time.perf_counter() - started:.2f}s", file=log)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Bulk recipe import for Recipe Recommender
+Streams a CSV or JSON Lines file (optionally .gz) into the recipes table in
+fixed-size transactions. Recipes whose content hash is already stored are
+skipped, so re-running an import is harmless. The search index, facet
+indexes and catalog version triggers are dropped for the load and rebuilt
+once when it ends, however it ends. While it runs the import renews a lease
+on that suspension; if the process is killed outright, the next import or
+the web app rebuilds them once the lease expires. Progress is checkpointed
+with every batch, so an interrupted import picks up where it stopped when
+run again.
+
+The JSON Lines format is the one export_recipes.py writes; CSV files use the
+same column names with ingredients and steps pipe-delimited.
+"""
+
+import sys
+import os
+import io
+import csv
+import gzip
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.app import (
+    DB_PATH, RECIPE_COLUMNS, RECIPE_FLAG_FIELDS, TRUE_VALUES, FALSE_VALUES, IMPORT_LEASE_SECONDS,
+    apply_storage_profile, migrate_database, recipe_content_hash, split_recipe_list,
+    replace_recipe_lists, suspend_recipe_indexes, renew_index_suspension, rebuild_recipe_indexes,
+    recipe_catalog, get_similarity_table
+)
+
+DEFAULT_BATCH_SIZE = 1000
+PROGRESS_INTERVAL = 2.0
+REQUIRED_FIELDS = ('name', 'ingredients')
+# Invalid records reported individually before the rest are only counted
+MAX_REPORTED_ERRORS = 10
+
+def detect_format(path):
+    """'csv' or 'jsonl' from the file name, ignoring a trailing .gz"""
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    raise ValueError(f'Cannot tell the format of {path}; pass --format')
+
+def iter_records(stream, fmt):
+    """Yield raw records: undecoded lines for JSON Lines, dictionaries for CSV
+
+    JSON lines are decoded later by normalize_recipe(), so skipping the
+    records already imported on a resumed run costs almost nothing.
+    """
+    if fmt == 'jsonl':
+        for line in stream:
+            if line.strip():
+                yield line
+    else:
+        yield from csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8', newline=''))
+
+def parse_flag(name, value):
+    if isinstance(value, (bool, int)):
+        return int(bool(value))
+    value = str(value or '').strip().lower()
+    if value in TRUE_VALUES:
+        return 1
+    if value in FALSE_VALUES:
+        return 0
+    raise ValueError(f'{name} must be true or false')
+
+def normalize_recipe(raw):
+    """Validated recipe dictionary with every column, list fields and content hash; raises ValueError"""
+    if isinstance(raw, bytes):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            raise ValueError('not valid JSON')
+        if not isinstance(raw, dict):
+            raise ValueError('expected a JSON object')
+
+    recipe = {}
+    for column in RECIPE_COLUMNS:
+        if column in RECIPE_FLAG_FIELDS:
+            recipe[column] = parse_flag(column, raw.get(column))
+        else:
+            value = raw.get(column)
+            recipe[column] = '' if value is None else str(value).strip()
+    for field in ('ingredients', 'steps'):
+        recipe[field] = [item.strip() for item in split_recipe_list(raw.get(field)) if item and item.strip()]
+
+    missing = [field for field in REQUIRED_FIELDS if not recipe[field]]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    recipe['id'] = None
+    if raw.get('id') not in (None, ''):
+        try:
+            recipe['id'] = int(raw['id'])
+        except (TypeError, ValueError):
+            raise ValueError('id must be an integer')
+    recipe['content_hash'] = recipe_content_hash(recipe)
+    return recipe
+
+def insert_batch(conn, recipes, keep_ids):
+    """Write one batch of normalized recipes, skipping content already stored; returns (inserted, duplicates)"""
+    hashes = [recipe['content_hash'] for recipe in recipes]
+    seen = {row[0] for row in conn.execute(
+        'SELECT content_hash FROM recipes WHERE content_hash IN (SELECT value FROM json_each(?))',
+        (json.dumps(hashes),)
+    )}
+    fresh = []
+    for recipe in recipes:
+        if recipe['content_hash'] not in seen:
+            seen.add(recipe['content_hash'])
+            fresh.append(recipe)
+    if not fresh:
+        return 0, len(recipes)
+
+    # Ids are assigned here rather than by AUTOINCREMENT so the child rows can
+    # be written with executemany too; sqlite_sequence keeps deleted ids retired
+    next_id = conn.execute('''
+        SELECT MAX(COALESCE((SELECT MAX(id) FROM recipes), 0),
+                   COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'recipes'), 0))
+    ''').fetchone()[0]
+    for recipe in fresh:
+        if not (keep_ids and recipe['id']):
+            next_id += 1
+            recipe['id'] = next_id
+
+    columns = ('id',) + RECIPE_COLUMNS + ('content_hash',)
+    sql = f"INSERT INTO recipes ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    if keep_ids:
+        sql += ' ON CONFLICT(id) DO UPDATE SET ' + ', '.join(f'{column} = excluded.{column}' for column in columns[1:])
+    conn.executemany(sql, [tuple(recipe[column] for column in columns) for recipe in fresh])
+    replace_recipe_lists(conn, ((recipe['id'], recipe['ingredients'], recipe['steps']) for recipe in fresh))
+    return len(fresh), len(recipes) - len(fresh)
+
+def checkpoint_key(path):
+    return 'import_checkpoint:' + hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+
+def load_checkpoint(conn, key):
+    row = conn.execute('SELECT value FROM catalog_meta WHERE key = ?', (key,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+def save_checkpoint(conn, key, checkpoint):
+    conn.execute('INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)', (key, json.dumps(checkpoint)))
+
+def report_progress(checkpoint, position, size, started, resumed_at):
+    rate = (checkpoint['records'] - resumed_at) / max(time.perf_counter() - started, 1e-9)
+    percent = f"{100 * position / size:5.1f}% " if size else ''
+    print(f"📥 {percent}{checkpoint['records']:,} read, {checkpoint['inserted']:,} imported, "
+          f"{checkpoint['duplicates']:,} duplicates, {checkpoint['invalid']:,} invalid ({rate:,.0f} records/s)",
+          flush=True)
+
+def main():
+    parser = argparse.ArgumentParser(description='Import recipes from a CSV or JSON Lines file')
+    parser.add_argument('path', help='recipes file (.csv, .jsonl or .ndjson, optionally .gz)')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), help='input format (default: from the file name)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'records written per transaction (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--keep-ids', action='store_true',
+                        help='keep the ids in the file, replacing recipes with the same id (for restoring exports)')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint of an earlier, unfinished run')
+    parser.add_argument('--skip-similarity', action='store_true',
+                        help='leave the similar-recipes table for the web app to rebuild on demand')
+    args = parser.parse_args()
+
+    try:
+        fmt = args.format or detect_format(args.path)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
+
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    apply_storage_profile(conn)
+    migrate_database(conn)
+
+    stat = os.stat(args.path)
+    source = {'path': os.path.abspath(args.path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    key = checkpoint_key(args.path)
+    checkpoint = load_checkpoint(conn, key)
+    if checkpoint and not args.restart:
+        if checkpoint['source'] != source:
+            sys.exit(f"❌ {args.path} changed since the interrupted import; rerun with --restart")
+        print(f"⏯️  Resuming after record {checkpoint['records']:,}")
+    else:
+        checkpoint = {'source': source, 'records': 0, 'inserted': 0, 'duplicates': 0, 'invalid': 0}
+
+    conn.execute('BEGIN IMMEDIATE')
+    suspend_recipe_indexes(conn)
+    save_checkpoint(conn, key, checkpoint)
+    conn.execute('COMMIT')
+
+    print(f"📦 Importing {args.path} ({fmt}) into {os.path.relpath(DB_PATH)} in batches of {args.batch_size}...")
+    started = last_report = time.perf_counter()
+    resumed_at = skip = checkpoint['records']
+    errors = 0
+    # Renewed well inside the lease so the web app never takes the load for dead
+    renew_interval = IMPORT_LEASE_SECONDS / 4
+    renewed_at = time.perf_counter()
+
+    def flush(batch, records):
+        nonlocal renewed_at
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            inserted, duplicates = insert_batch(conn, batch, args.keep_ids) if batch else (0, 0)
+            progress = dict(checkpoint, records=records,
+                            inserted=checkpoint['inserted'] + inserted,
+                            duplicates=checkpoint['duplicates'] + duplicates)
+            save_checkpoint(conn, key, progress)
+            renew_index_suspension(conn)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        checkpoint.update(progress)
+        renewed_at = time.perf_counter()
+
+    def keep_alive():
+        nonlocal renewed_at
+        if time.perf_counter() - renewed_at >= renew_interval:
+            conn.execute('BEGIN IMMEDIATE')
+            renew_index_suspension(conn)
+            conn.execute('COMMIT')
+            renewed_at = time.perf_counter()
+
+    def rebuild_indexes():
+        print("🔧 Rebuilding search and facet indexes...")
+        conn.execute('BEGIN IMMEDIATE')
+        rebuild_recipe_indexes(conn)
+        if finished:
+            conn.execute('DELETE FROM catalog_meta WHERE key = ?', (key,))
+        conn.execute('COMMIT')
+
+    # The indexes come back on every way out, so the live catalog is never left
+    # without them; the checkpoint survives an unfinished run for resuming
+    finished = False
+    try:
+        with open(args.path, 'rb') as raw:
+            stream = gzip.GzipFile(fileobj=raw) if args.path.endswith('.gz') else raw
+            batch = []
+            records = checkpoint['records']
+            for number, record in enumerate(iter_records(stream, fmt), 1):
+                keep_alive()
+                if number <= skip:
+                    continue
+                records = number
+                try:
+                    batch.append(normalize_recipe(record))
+                except ValueError as e:
+                    checkpoint['invalid'] += 1
+                    errors += 1
+                    if errors <= MAX_REPORTED_ERRORS:
+                        print(f"⚠️  Record {number}: {e}")
+
+                if len(batch) >= args.batch_size:
+                    flush(batch, records)
+                    batch = []
+                    if time.perf_counter() - last_report >= PROGRESS_INTERVAL:
+                        report_progress(checkpoint, raw.tell(), source['size'], started, resumed_at)
+                        last_report = time.perf_counter()
+            flush(batch, records)
+        finished = True
+    except KeyboardInterrupt:
+        print(f"\n⏸️  Interrupted after record {checkpoint['records']:,}; run the same command again to resume")
+        rebuild_indexes()
+        sys.exit(130)
+    except BaseException:
+        print(f"❌ Import failed after record {checkpoint['records']:,}; run the same command again to resume")
+        rebuild_indexes()
+        raise
+
+    report_progress(checkpoint, source['size'], source['size'], started, resumed_at)
+    if errors > MAX_REPORTED_ERRORS:
+        print(f"⚠️  {errors - MAX_REPORTED_ERRORS} more invalid records not shown")
+    rebuild_indexes()
+
+    if not args.skip_similarity:
+        get_similarity_table(recipe_catalog.get(conn))
+
+    print(f"✅ Imported {checkpoint['inserted']:,} recipes in {time.perf_counter() - started:.1f}s "
+          f"({checkpoint['duplicates']:,} duplicates and {checkpoint['invalid']:,} invalid records skipped)")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
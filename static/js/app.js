@@ -133,8 +133,9 @@ class RecipeApp {
     async loadAllRecipes() {
         this.showLoading();
         try {
-            const response = await fetch('/api/recipes');
+            const response = await fetch('/api/recipes?view=card');
             this.recipes = await response.json();
+            await this.attachRatings(this.recipes, true);
             this.displayRecipes(this.recipes);
         } catch (error) {
             console.error('Error loading recipes:', error);
@@ -143,6 +144,23 @@ class RecipeApp {
         this.hideLoading();
     }
 
+    async attachRatings(recipes, allRecipes = false) {
+        // One batch request for every card's rating summary and the user's own ratings
+        if (!recipes || recipes.length === 0) return;
+        try {
+            const ids = allRecipes ? 'all' : recipes.map(recipe => recipe.id).join(',');
+            const response = await fetch(`/api/ratings/summary?ids=${ids}`);
+            if (!response.ok) return;
+            const summary = await response.json();
+            recipes.forEach(recipe => {
+                recipe.rating = summary.ratings[recipe.id] || null;
+                recipe.userRating = summary.user_ratings[recipe.id] || 0;
+            });
+        } catch (error) {
+            console.error('Error loading ratings:', error);
+        }
+    }
+
     async performSearch() {
         const query = document.getElementById('searchInput').value.trim();
         if (!query) {
@@ -154,8 +172,9 @@ class RecipeApp {
         this.scrollToResults();
 
         try {
-            const response = await fetch(`/api/search?q=${encodeURIComponent(query)}`);
+            const response = await fetch(`/api/search?q=${encodeURIComponent(query)}&view=card`);
             const results = await response.json();
+            await this.attachRatings(results);
             this.displayRecipes(results);
         } catch (error) {
             console.error('Error searching recipes:', error);
@@ -171,6 +190,7 @@ class RecipeApp {
         try {
             const response = await fetch('/api/surprise');
             const surpriseRecipes = await response.json();
+            await this.attachRatings(surpriseRecipes);
             this.displayRecipes(surpriseRecipes);
         } catch (error) {
             console.error('Error getting surprise recipes:', error);
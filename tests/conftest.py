@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the Recipe Recommender tests
+backend.app reads its configuration when it is imported, so the database,
+similarity and model paths are pointed at a scratch directory first.
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+
+import pytest
+
+SCRATCH_DIR = tempfile.mkdtemp(prefix='recipe-tests-')
+os.environ['DB_PATH'] = os.path.join(SCRATCH_DIR, 'recipes.db')
+os.environ.setdefault('PASSWORD_ITERATIONS', '1000')
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.app import app, init_database, migrate_database, load_seed_recipes, SEED_PATH
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def client():
+    """Test client for the app, backed by a seeded scratch database"""
+    init_database()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'recipes.db')
+
+
+@pytest.fixture
+def migrated_conn(db_path):
+    """Connection to an empty database with every migration applied"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    migrate_database(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def seeded_conn(migrated_conn):
+    """Migrated database holding the seed catalog"""
+    load_seed_recipes(migrated_conn, SEED_PATH)
+    return migrated_conn
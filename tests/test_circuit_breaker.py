@@ -0,0 +1,94 @@
+import time
+
+import pytest
+import requests
+
+from backend import app as backend_app
+from backend.app import CircuitBreaker, CircuitOpen, PooledOAuth2Session, get_oauth_breaker
+
+
+def tripped(threshold=2, cooldown=60):
+    breaker = CircuitBreaker(threshold=threshold, cooldown=cooldown)
+    for _ in range(threshold):
+        breaker.before_call()
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_threshold_failures():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    assert breaker.stats() == {'state': 'open', 'failures': 3, 'rejected': 1}
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = tripped(cooldown=0.05)
+    time.sleep(0.06)
+    assert breaker.state == 'half-open'
+    breaker.before_call()
+    # Everyone else waits out a fresh cooldown while the probe is in flight
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    breaker.before_call()
+
+
+def test_failed_probe_reopens():
+    breaker = tripped(cooldown=0.05)
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+
+def test_breakers_are_per_host():
+    assert get_oauth_breaker('https://a.example/x') is get_oauth_breaker('https://a.example/y')
+    assert get_oauth_breaker('https://a.example/x') is not get_oauth_breaker('https://b.example/x')
+
+
+def test_session_stops_calling_a_failing_provider(monkeypatch):
+    calls = []
+    def unreachable(request, **kwargs):
+        calls.append(request.url)
+        raise requests.ConnectionError('connection refused')
+    monkeypatch.setattr(backend_app.oauth_http_adapter, 'send', unreachable)
+
+    url = 'https://failing-provider.example/token'
+    session = PooledOAuth2Session(client_id='client')
+    for _ in range(backend_app.OAUTH_BREAKER_THRESHOLD):
+        with pytest.raises(requests.ConnectionError):
+            session.request('GET', url, withhold_token=True)
+    with pytest.raises(CircuitOpen):
+        session.request('GET', url, withhold_token=True)
+    assert len(calls) == backend_app.OAUTH_BREAKER_THRESHOLD
+    assert get_oauth_breaker(url).stats()['rejected'] == 1
+
+
+def test_server_errors_count_as_failures(monkeypatch):
+    def overloaded(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 503
+        response.url = request.url
+        response.request = request
+        return response
+    monkeypatch.setattr(backend_app.oauth_http_adapter, 'send', overloaded)
+
+    url = 'https://overloaded-provider.example/userinfo'
+    session = PooledOAuth2Session(client_id='client')
+    session.request('GET', url, withhold_token=True)
+    assert get_oauth_breaker(url).failures == 1
@@ -0,0 +1,63 @@
+import base64
+import json
+
+import pytest
+
+from backend.app import decode_cursor, encode_cursor
+
+
+def raw_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def walk(client, url):
+    """Ids of every page of a keyset-paginated listing, in order"""
+    ids, cursor = [], None
+    while True:
+        page = client.get(url + (f'&after={cursor}' if cursor else '')).get_json()
+        ids += [recipe['id'] for recipe in page['recipes']]
+        cursor = page['next_cursor']
+        if not cursor:
+            return ids
+
+
+@pytest.mark.parametrize('values', [['Ugali', 3], [0.25, 17], [-4, 1]])
+def test_cursor_round_trip(values):
+    assert decode_cursor(encode_cursor(values)) == values
+
+
+@pytest.mark.parametrize('token', [
+    'not base64 at all!',
+    raw_cursor('Ugali'),
+    raw_cursor(['Ugali']),
+    raw_cursor(['Ugali', 3, 4]),
+    raw_cursor([True, 3]),
+    raw_cursor([['Ugali'], 3]),
+    raw_cursor(['Ugali', '3']),
+    raw_cursor(['Ugali', None]),
+    base64.urlsafe_b64encode(b'\xff\xfe').decode('ascii'),
+])
+def test_malformed_cursor_is_rejected(client, token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+    response = client.get(f'/api/recipes?limit=5&after={token}')
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid cursor'}
+
+
+def test_pages_cover_the_listing_once(client):
+    everything = [recipe['id'] for recipe in client.get('/api/recipes?view=card').get_json()]
+    assert walk(client, '/api/recipes?view=card&limit=7') == everything
+
+
+def test_filtered_pages_cover_the_filtered_listing(client):
+    recipes = client.get('/api/recipes?is_vegan=true&fields=is_vegan&limit=100').get_json()['recipes']
+    assert recipes and all(recipe['is_vegan'] for recipe in recipes)
+    vegan = [recipe['id'] for recipe in recipes]
+    assert walk(client, '/api/recipes?is_vegan=true&limit=3') == vegan
+
+
+def test_search_pages_follow_relevance(client):
+    ranked = [recipe['id'] for recipe in client.get('/api/search?q=rice&limit=100').get_json()['recipes']]
+    assert len(ranked) > 2
+    assert walk(client, '/api/search?q=rice&limit=2') == ranked
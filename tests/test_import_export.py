@@ -0,0 +1,78 @@
+import os
+import sys
+import json
+import gzip
+import sqlite3
+import subprocess
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_script(script, db_path, *args):
+    """Run one of the command-line tools against ``db_path``; returns its stdout"""
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, script), *args],
+        env=dict(os.environ, DB_PATH=db_path), capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def read_ndjson(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize('suffix', ['.jsonl', '.jsonl.gz'])
+def test_export_import_round_trip(seeded_conn, db_path, tmp_path, suffix):
+    dump = str(tmp_path / f'recipes{suffix}')
+    restored = str(tmp_path / 'restored.db')
+    run_script('export_recipes.py', db_path, '--output', dump)
+    original = read_ndjson(dump)
+    assert len(original) == seeded_conn.execute('SELECT COUNT(*) FROM recipes').fetchone()[0]
+
+    output = run_script('import_recipes.py', restored, dump, '--keep-ids', '--skip-similarity')
+    assert f'Imported {len(original)} recipes' in output
+
+    again = str(tmp_path / 'again.jsonl')
+    run_script('export_recipes.py', restored, '--output', again)
+    assert read_ndjson(again) == original
+
+    conn = sqlite3.connect(restored)
+    conn.execute("INSERT INTO recipes_fts(recipes_fts, rank) VALUES ('integrity-check', 1)")
+    assert conn.execute("SELECT value FROM catalog_meta WHERE key = 'recipe_indexes_suspended'").fetchone() is None
+    assert conn.execute("SELECT COUNT(*) FROM catalog_meta WHERE key LIKE 'import_checkpoint:%'").fetchone()[0] == 0
+    conn.close()
+
+
+def test_reimport_skips_stored_recipes(seeded_conn, db_path, tmp_path):
+    dump = str(tmp_path / 'recipes.jsonl')
+    run_script('export_recipes.py', db_path, '--output', dump)
+    count = seeded_conn.execute('SELECT COUNT(*) FROM recipes').fetchone()[0]
+
+    output = run_script('import_recipes.py', db_path, dump, '--skip-similarity')
+    assert 'Imported 0 recipes' in output
+    assert f'{count:,} duplicates' in output
+    assert seeded_conn.execute('SELECT COUNT(*) FROM recipes').fetchone()[0] == count
+
+
+def test_invalid_records_are_counted_not_fatal(migrated_conn, db_path, tmp_path):
+    dump = tmp_path / 'recipes.csv'
+    dump.write_text(
+        'name,country,ingredients,steps,is_vegan\n'
+        'Githeri,Kenya,maize|beans,Boil|Simmer,yes\n'
+        ',Kenya,maize,Boil,no\n'
+        'Mandazi,Kenya,flour|sugar,Knead|Fry,perhaps\n',
+        encoding='utf-8'
+    )
+    output = run_script('import_recipes.py', db_path, str(dump), '--skip-similarity')
+    assert 'Imported 1 recipes' in output
+    assert '2 invalid' in output
+    row = migrated_conn.execute('SELECT id, is_vegan FROM recipes').fetchone()
+    assert row['is_vegan'] == 1
+    steps = [step[0] for step in migrated_conn.execute(
+        'SELECT text FROM recipe_steps WHERE recipe_id = ? ORDER BY position', (row['id'],)
+    )]
+    assert steps == ['Boil', 'Simmer']
@@ -0,0 +1,118 @@
+import sqlite3
+
+from backend.app import MIGRATIONS, get_schema_version, migrate_database, table_columns
+
+LATEST = MIGRATIONS[-1][0]
+
+
+def schema_objects(conn):
+    """(type, name) of every index, trigger and view, the parts migrations rebuild"""
+    return set(conn.execute('''
+        SELECT type, name FROM sqlite_master
+        WHERE type IN ('index', 'trigger', 'view') AND name NOT LIKE 'sqlite_autoindex_%'
+    '''))
+
+
+def make_legacy_database(path):
+    """A database written before migrations existed: pipe-delimited lists, text recipe ids"""
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            cuisine_preferences TEXT DEFAULT '',
+            newsletter_subscribed INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active INTEGER DEFAULT 1
+        );
+        CREATE TABLE recipes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            country TEXT NOT NULL,
+            description TEXT NOT NULL,
+            image TEXT NOT NULL,
+            prep_time TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            health_benefits TEXT NOT NULL,
+            ingredients TEXT NOT NULL,
+            steps TEXT NOT NULL
+        );
+        CREATE TABLE recipe_ratings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            recipe_id INTEGER NOT NULL,
+            recipe_type TEXT NOT NULL DEFAULT 'regular',
+            user_id INTEGER NOT NULL,
+            rating INTEGER NOT NULL CHECK (rating >= 1 AND rating <= 5),
+            review_text TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(recipe_id, recipe_type, user_id),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        );
+        INSERT INTO users (email, password_hash, first_name, last_name)
+        VALUES ('cook@example.com', 'legacy-hash', 'Ada', 'Cook');
+        INSERT INTO recipes (name, country, description, image, prep_time, difficulty, health_benefits, ingredients, steps)
+        VALUES ('Sukuma Wiki', 'Kenya', 'Braised collard greens', 'sukuma.jpg', '20 mins', 'Easy',
+                'Rich in iron', '1 bunch collard greens|2 tomatoes|1 onion', 'Chop the greens|Fry the onion|Simmer');
+        INSERT INTO recipe_ratings (recipe_id, user_id, rating) VALUES (' 1 ', 1, 4);
+        INSERT INTO recipe_ratings (recipe_id, user_id, rating) VALUES ('not-an-id', 1, 2);
+    ''')
+    conn.commit()
+    return conn
+
+
+def test_fresh_database_reaches_latest_version(migrated_conn):
+    assert get_schema_version(migrated_conn) == LATEST
+    versions = [row[0] for row in migrated_conn.execute('SELECT version FROM schema_version ORDER BY version')]
+    assert versions == [version for version, _ in MIGRATIONS]
+
+
+def test_migrate_database_is_idempotent(migrated_conn):
+    before = schema_objects(migrated_conn)
+    assert migrate_database(migrated_conn) == 0
+    assert schema_objects(migrated_conn) == before
+
+
+def test_interrupted_migration_resumes(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    migrate_database(conn)
+    conn.execute('DELETE FROM schema_version WHERE version = ?', (LATEST,))
+    conn.commit()
+
+    assert migrate_database(conn) == 1
+    assert get_schema_version(conn) == LATEST
+
+
+def test_legacy_database_upgrades_in_place(db_path, migrated_conn):
+    conn = make_legacy_database(db_path.replace('recipes.db', 'legacy.db'))
+    conn.row_factory = sqlite3.Row
+    assert migrate_database(conn) == len(MIGRATIONS)
+
+    assert schema_objects(conn) == schema_objects(migrated_conn)
+    assert {'origin', 'cuisine_type', 'content_hash'} <= table_columns(conn, 'recipes')
+    assert not {'ingredients', 'steps'} & table_columns(conn, 'recipes')
+
+    ingredients = [row[0] for row in conn.execute(
+        'SELECT text FROM recipe_ingredients WHERE recipe_id = 1 ORDER BY position'
+    )]
+    assert ingredients == ['1 bunch collard greens', '2 tomatoes', '1 onion']
+    assert conn.execute('SELECT COUNT(*) FROM recipe_steps WHERE recipe_id = 1').fetchone()[0] == 3
+    assert conn.execute('SELECT content_hash FROM recipes WHERE id = 1').fetchone()[0]
+
+    # Text recipe ids are cast, junk ones dropped, and the aggregates backfilled
+    ratings = conn.execute('SELECT recipe_id, typeof(recipe_id) FROM recipe_ratings').fetchall()
+    assert [tuple(row) for row in ratings] == [(1, 'integer')]
+    assert tuple(conn.execute('SELECT rating_count, rating_sum FROM recipe_rating_stats').fetchone()) == (1, 4)
+
+    # OAuth-only accounts need a nullable password
+    conn.execute("INSERT INTO users (email, first_name, last_name, oauth_provider, oauth_id) "
+                 "VALUES ('oauth@example.com', 'O', 'Auth', 'google', '42')")
+
+    # The search index covers the moved ingredients
+    matches = conn.execute("SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH 'collard'").fetchall()
+    assert [row[0] for row in matches] == [1]
+    conn.close()
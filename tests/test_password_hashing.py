@@ -0,0 +1,136 @@
+import sqlite3
+import threading
+
+import pytest
+
+from backend import app as backend_app
+from backend.app import (
+    DB_PATH, PASSWORD_ITERATIONS, HashingBusy, PasswordHashExecutor,
+    hash_password, verify_password, password_needs_rehash
+)
+
+
+@pytest.fixture
+def blocked():
+    """An event that holds hashing jobs until the test ends"""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def occupy(executor, event, count=1):
+    """Start ``count`` jobs that hold an executor slot until ``event`` is set"""
+    started = threading.Barrier(count + 1)
+    def job():
+        started.wait()
+        event.wait()
+    for _ in range(count):
+        threading.Thread(target=executor.run, args=(job,), daemon=True).start()
+    started.wait()
+
+
+def signup(client, email, password='correct horse battery'):
+    return client.post('/api/signup', json={
+        'firstName': 'Test', 'lastName': 'Cook', 'email': email, 'password': password
+    })
+
+
+def stored_hash(email):
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        return conn.execute('SELECT password_hash FROM users WHERE email = ?', (email,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_hash_round_trip():
+    hashed = hash_password('s3cret-pass')
+    assert verify_password('s3cret-pass', hashed)
+    assert not verify_password('wrong-pass', hashed)
+    assert not verify_password('s3cret-pass', None)
+    assert not verify_password('s3cret-pass', 'garbage')
+    assert not password_needs_rehash(hashed)
+    assert password_needs_rehash(hash_password('s3cret-pass', iterations=PASSWORD_ITERATIONS + 1))
+
+
+def test_executor_returns_result():
+    executor = PasswordHashExecutor(workers=1, queue_limit=1, timeout=5)
+    assert executor.run(pow, 2, 10) == 1024
+    assert executor.stats()['completed'] == 1
+
+
+def test_saturated_executor_rejects(blocked):
+    executor = PasswordHashExecutor(workers=1, queue_limit=0, timeout=5)
+    occupy(executor, blocked)
+    with pytest.raises(HashingBusy):
+        executor.run(pow, 2, 10)
+    assert executor.stats()['rejected'] == 1
+
+
+def test_idle_only_work_never_queues(blocked):
+    executor = PasswordHashExecutor(workers=1, queue_limit=4, timeout=5)
+    occupy(executor, blocked)
+    with pytest.raises(HashingBusy):
+        executor.run(pow, 2, 10, idle_only=True)
+    blocked.set()
+    # Once the worker is free again optional work runs
+    executor.run(pow, 2, 10)
+    assert executor.run(pow, 2, 10, idle_only=True) == 1024
+
+
+def test_queued_work_times_out(blocked):
+    executor = PasswordHashExecutor(workers=1, queue_limit=1, timeout=5)
+    occupy(executor, blocked)
+    executor.timeout = 0.05
+    with pytest.raises(HashingBusy):
+        executor.run(pow, 2, 10)
+    assert executor.stats()['timeouts'] == 1
+
+
+def test_login_upgrades_old_hash(client):
+    email = 'upgrade@example.com'
+    assert signup(client, email).status_code == 201
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute('UPDATE users SET password_hash = ? WHERE email = ?',
+                     (hash_password('correct horse battery', iterations=500), email))
+    conn.close()
+
+    response = client.post('/api/login', json={'email': email, 'password': 'correct horse battery'})
+    assert response.status_code == 200
+    assert not password_needs_rehash(stored_hash(email))
+
+
+def test_login_skips_upgrade_when_busy(client, monkeypatch):
+    email = 'busy-upgrade@example.com'
+    assert signup(client, email).status_code == 201
+    old_hash = hash_password('correct horse battery', iterations=500)
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute('UPDATE users SET password_hash = ? WHERE email = ?', (old_hash, email))
+    conn.close()
+
+    run = backend_app.password_executor.run
+    def no_idle_workers(fn, *args, idle_only=False):
+        if idle_only:
+            raise HashingBusy('Password hashing queue is full')
+        return run(fn, *args)
+    monkeypatch.setattr(backend_app.password_executor, 'run', no_idle_workers)
+
+    response = client.post('/api/login', json={'email': email, 'password': 'correct horse battery'})
+    assert response.status_code == 200
+    assert stored_hash(email) == old_hash
+
+
+def test_login_sheds_load_when_saturated(client, monkeypatch):
+    email = 'saturated@example.com'
+    assert signup(client, email).status_code == 201
+
+    def saturated(fn, *args, idle_only=False):
+        raise HashingBusy('Password hashing queue is full')
+    monkeypatch.setattr(backend_app.password_executor, 'run', saturated)
+
+    response = client.post('/api/login', json={'email': email, 'password': 'correct horse battery'})
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    assert backend_app.db_pool.stats()['in_use'] == 0
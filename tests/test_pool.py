@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from backend.app import ConnectionPool, PoolTimeout
+
+
+def test_released_connection_is_reused(db_path):
+    pool = ConnectionPool(db_path, size=2, timeout=0.1)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert pool.stats()['created'] == 1
+
+
+def test_acquire_times_out_when_exhausted(db_path):
+    pool = ConnectionPool(db_path, size=1, timeout=0.05)
+    pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    stats = pool.stats()
+    assert stats['timeouts'] == 1
+    assert stats['in_use'] == 1
+
+
+def test_waiter_gets_connection_released_by_another_thread(db_path):
+    pool = ConnectionPool(db_path, size=1, timeout=5)
+    conn = pool.acquire()
+    threading.Timer(0.05, pool.release, (conn,)).start()
+    assert pool.acquire() is conn
+    assert pool.stats()['waits'] == 1
+
+
+def test_release_rolls_back_open_transaction(db_path):
+    pool = ConnectionPool(db_path, size=1, timeout=0.1)
+    conn = pool.acquire()
+    conn.execute('CREATE TABLE t (x INTEGER)')
+    conn.commit()
+    conn.execute('INSERT INTO t VALUES (1)')
+    assert conn.in_transaction
+    pool.release(conn)
+
+    conn = pool.acquire()
+    assert not conn.in_transaction
+    assert conn.execute('SELECT COUNT(*) FROM t').fetchone()[0] == 0
+
+
+def test_broken_connection_is_replaced(db_path):
+    pool = ConnectionPool(db_path, size=1, timeout=0.1, health_check_interval=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.close()
+
+    replacement = pool.acquire()
+    assert replacement is not conn
+    assert replacement.execute('SELECT 1').fetchone()[0] == 1
+    assert pool.stats()['discarded'] == 1
+
+
+def test_pool_timeout_is_served_as_503(client, monkeypatch):
+    from backend import app as backend_app
+
+    def exhausted():
+        raise PoolTimeout('No database connection available')
+
+    monkeypatch.setattr(backend_app.db_pool, 'acquire', exhausted)
+    response = client.get('/api/recipes?limit=5')
+    assert response.status_code == 503
+    assert response.get_json() == {'error': 'Service busy, please retry'}
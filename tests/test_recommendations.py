@@ -0,0 +1,56 @@
+import numpy as np
+
+from backend.recommendations import RecommendationModel, database_fingerprint, save_model, train_als
+
+
+def rate(conn, ratings):
+    """Add users and their (recipe_id, rating) pairs; ``ratings`` holds one list per user"""
+    with conn:
+        for picks in ratings:
+            user_id = conn.execute('''
+                INSERT INTO users (email, first_name, last_name)
+                VALUES ('rater' || (SELECT COUNT(*) FROM users) || '@example.com', 'R', 'Ater')
+                RETURNING id
+            ''').fetchone()[0]
+            conn.executemany('INSERT INTO recipe_ratings (recipe_id, user_id, rating) VALUES (?, ?, ?)',
+                             [(recipe_id, user_id, rating) for recipe_id, rating in picks])
+
+
+def trained_model(conn, path):
+    rows = conn.execute('SELECT user_id, recipe_id, rating FROM recipe_ratings').fetchall()
+    users, recipes, ratings = (np.array(column) for column in zip(*rows))
+    model = train_als(users, recipes, ratings.astype(np.float32), factors=4, iterations=3)
+    catalog_version, user_count = database_fingerprint(conn)
+    model['catalog_version'] = np.int64(catalog_version)
+    model['user_count'] = np.int64(user_count)
+    save_model(model, path)
+    return int(users[0])
+
+
+def test_model_is_ignored_once_the_catalog_changes(seeded_conn, tmp_path):
+    ids = [row[0] for row in seeded_conn.execute('SELECT id FROM recipes ORDER BY id LIMIT 6')]
+    rate(seeded_conn, [[(ids[0], 5), (ids[1], 4)], [(ids[1], 2), (ids[2], 5)], [(ids[0], 4), (ids[3], 3)]])
+    path = str(tmp_path / 'model.npz')
+    user_id = trained_model(seeded_conn, path)
+    model = RecommendationModel(path, check_interval=0)
+    assert model.recommend(seeded_conn, user_id, 3)
+
+    # A sign-up after training leaves the model in use
+    rate(seeded_conn, [[]])
+    assert model.recommend(seeded_conn, user_id, 3)
+
+    with seeded_conn:
+        seeded_conn.execute("UPDATE recipes SET name = name || ' II' WHERE id = ?", (ids[5],))
+    assert model.recommend(seeded_conn, user_id, 3) is None
+
+
+def test_model_without_fingerprint_is_ignored(seeded_conn, tmp_path):
+    ids = [row[0] for row in seeded_conn.execute('SELECT id FROM recipes ORDER BY id LIMIT 3')]
+    rate(seeded_conn, [[(ids[0], 5), (ids[1], 3)], [(ids[1], 4), (ids[2], 2)]])
+    path = str(tmp_path / 'model.npz')
+    user_id = trained_model(seeded_conn, path)
+    with np.load(path) as data:
+        legacy = {key: data[key] for key in data.files if key not in ('catalog_version', 'user_count')}
+    save_model(legacy, path)
+
+    assert RecommendationModel(path, check_interval=0).recommend(seeded_conn, user_id, 3) is None
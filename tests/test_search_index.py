@@ -0,0 +1,110 @@
+import json
+import time
+
+import pytest
+
+from backend.app import (
+    IMPORT_LEASE_SECONDS, build_fts_query, replace_recipe_lists, suspend_recipe_indexes, rebuild_recipe_indexes,
+    restore_suspended_indexes, suspension_lease_left
+)
+
+
+def check_index(conn):
+    """Strict FTS integrity check: every document must match the row it was indexed from"""
+    conn.execute("INSERT INTO recipes_fts(recipes_fts, rank) VALUES ('integrity-check', 1)")
+
+
+def search(conn, query):
+    return {row[0] for row in conn.execute(
+        'SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH ?', (build_fts_query(query),)
+    )}
+
+
+def two_recipes(conn):
+    return [row[0] for row in conn.execute('SELECT id FROM recipes ORDER BY id LIMIT 2')]
+
+
+def test_seeded_index_is_consistent(seeded_conn):
+    check_index(seeded_conn)
+    assert search(seeded_conn, 'ugali')
+
+
+def test_recipe_update_reindexes_document(seeded_conn):
+    recipe_id, _ = two_recipes(seeded_conn)
+    with seeded_conn:
+        seeded_conn.execute("UPDATE recipes SET name = 'Zanzibar Pizza Deluxe' WHERE id = ?", (recipe_id,))
+    check_index(seeded_conn)
+    assert search(seeded_conn, 'zanzibar deluxe') == {recipe_id}
+
+
+def test_image_update_leaves_index_alone(seeded_conn):
+    recipe_id, _ = two_recipes(seeded_conn)
+    before = seeded_conn.total_changes
+    with seeded_conn:
+        seeded_conn.execute("UPDATE recipes SET image = 'new.jpg' WHERE id = ?", (recipe_id,))
+    # The row itself plus the catalog version bump, no FTS writes
+    assert seeded_conn.total_changes - before == 2
+    check_index(seeded_conn)
+
+
+def test_ingredient_moved_between_recipes(seeded_conn):
+    source, target = two_recipes(seeded_conn)
+    with seeded_conn:
+        replace_recipe_lists(seeded_conn, [(source, ['3 sprigs lemongrassy herb'], ['Cook'])])
+        seeded_conn.execute('''
+            UPDATE recipe_ingredients SET recipe_id = ?, position = 1000
+            WHERE recipe_id = ? AND position = 0
+        ''', (target, source))
+    check_index(seeded_conn)
+    assert search(seeded_conn, 'lemongrassy') == {target}
+
+
+def test_ingredient_and_recipe_deletes(seeded_conn):
+    source, target = two_recipes(seeded_conn)
+    with seeded_conn:
+        seeded_conn.execute('DELETE FROM recipe_ingredients WHERE recipe_id = ?', (source,))
+        seeded_conn.execute('DELETE FROM recipes WHERE id = ?', (target,))
+    check_index(seeded_conn)
+    assert seeded_conn.execute('SELECT COUNT(*) FROM recipe_ingredients WHERE recipe_id = ?',
+                               (target,)).fetchone()[0] == 0
+    assert target not in search(seeded_conn, seeded_conn.execute(
+        'SELECT name FROM recipes WHERE id = ?', (source,)
+    ).fetchone()[0])
+
+
+def test_suspended_indexes_are_rebuilt(seeded_conn):
+    with seeded_conn:
+        suspend_recipe_indexes(seeded_conn)
+    assert suspension_lease_left(seeded_conn) > 0
+    with seeded_conn:
+        seeded_conn.execute("UPDATE recipes SET name = 'Quokka Stew' WHERE id = (SELECT MIN(id) FROM recipes)")
+    with seeded_conn:
+        rebuild_recipe_indexes(seeded_conn)
+    assert suspension_lease_left(seeded_conn) is None
+    check_index(seeded_conn)
+    assert len(search(seeded_conn, 'quokka')) == 1
+
+
+@pytest.mark.parametrize('query', ['', '"', '*', 'AND OR NOT', '(((', 'name:'])
+def test_hostile_queries_are_neutralized(seeded_conn, query):
+    match = build_fts_query(query)
+    if match:
+        seeded_conn.execute('SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH ?', (match,)).fetchall()
+
+
+def test_live_import_lease_is_respected(seeded_conn):
+    with seeded_conn:
+        suspend_recipe_indexes(seeded_conn)
+    left = restore_suspended_indexes(seeded_conn)
+    assert 0 < left <= IMPORT_LEASE_SECONDS
+    assert not seeded_conn.execute("SELECT name FROM sqlite_master WHERE name = 'recipes_fts'").fetchone()
+
+
+def test_expired_lease_is_repaired(seeded_conn):
+    with seeded_conn:
+        suspend_recipe_indexes(seeded_conn)
+        seeded_conn.execute("UPDATE catalog_meta SET value = ? WHERE key = 'recipe_indexes_suspended'",
+                            (json.dumps({'pid': 0, 'expires': time.time() - 1}),))
+    assert restore_suspended_indexes(seeded_conn) is None
+    assert suspension_lease_left(seeded_conn) is None
+    check_index(seeded_conn)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Recommendation model training for Recipe Recommender
+Factorizes the user x recipe rating matrix with alternating least squares
+and writes the factors that /api/recommendations serves from. Run it on a
+schedule (e.g. nightly); web workers pick up the new file automatically.
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import argparse
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.app import DB_PATH, RECOMMENDATION_MODEL_PATH
+from backend.recommendations import (
+    DEFAULT_FACTORS, DEFAULT_ITERATIONS, DEFAULT_REGULARIZATION,
+    database_fingerprint, load_ratings, train_als, save_model
+)
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the collaborative-filtering recommendation model')
+    parser.add_argument('--factors', type=int, default=DEFAULT_FACTORS,
+                        help=f'latent factors per user and recipe (default: {DEFAULT_FACTORS})')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help=f'ALS sweeps (default: {DEFAULT_ITERATIONS})')
+    parser.add_argument('--regularization', type=float, default=DEFAULT_REGULARIZATION,
+                        help=f'L2 penalty per rating (default: {DEFAULT_REGULARIZATION})')
+    parser.add_argument('--output', default=RECOMMENDATION_MODEL_PATH,
+                        help='where to write the model (default: next to the database)')
+    args = parser.parse_args()
+
+    # One read transaction, so the fingerprint describes exactly the ratings read
+    conn = sqlite3.connect(f'file:{DB_PATH}?mode=ro', uri=True)
+    conn.execute('BEGIN')
+    catalog_version, user_count = database_fingerprint(conn)
+    user_ids, recipe_ids, ratings = load_ratings(conn)
+    conn.close()
+
+    if not len(ratings):
+        print("⚠️  No ratings yet - every user gets cuisine-preference recommendations")
+        return
+
+    print(f"🧮 Training on {len(ratings)} ratings from {len(set(user_ids.tolist()))} users...")
+    started = time.perf_counter()
+    model = train_als(user_ids, recipe_ids, ratings, factors=args.factors,
+                      iterations=args.iterations, regularization=args.regularization)
+    model['catalog_version'] = np.int64(catalog_version)
+    model['user_count'] = np.int64(user_count)
+    save_model(model, args.output)
+
+    print(f"✅ Trained in {time.perf_counter() - started:.2f}s, training RMSE {float(model['rmse']):.3f}")
+    print(f"💾 Model written to {os.path.relpath(args.output)}")
+
+if __name__ == "__main__":
+    main()